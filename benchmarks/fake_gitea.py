@@ -0,0 +1,784 @@
+#!/usr/bin/env python3
+"""
+Fake Gitea - Local Gitea API stand-in for benchmarks
+
+In-memory implementation of the Gitea REST endpoints the bridge uses
+(users, orgs, teams, repos, issues, labels, milestones), with Gitea-style
+pagination, configurable latency/jitter, error injection and 429
+throttling. Runs in-process or as a standalone localhost server, so sync
+throughput, retries and concurrency can be measured without a network.
+
+Usage:
+    # Standalone
+    python -m benchmarks.fake_gitea --port 3000 --latency 0.02 --jitter 0.01
+
+    # In-process
+    from benchmarks.fake_gitea import FakeGitea
+
+    with FakeGitea(latency=0.02, error_rate=0.01) as gitea:
+        client = GiteaClient(gitea.url, 'token', organization='org', repository='repo')
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+logger = logging.getLogger(__name__)
+
+ADMIN_LOGIN = "admin"
+
+# Gitea's default MAX_RESPONSE_ITEMS
+MAX_PAGE_SIZE = 50
+
+
+class FakeGiteaError(Exception):
+    """HTTP error returned by a route handler"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class FakeGiteaOptions:
+    """Behaviour of the fake server"""
+    latency: float = 0.0              # seconds added to every request
+    jitter: float = 0.0               # +/- uniform jitter on latency
+    error_rate: float = 0.0           # fraction of requests failing with error_status
+    error_status: int = 503
+    throttle_rate: float = 0.0        # fraction of requests answered 429
+    rate_limit: Optional[float] = None  # requests/second before 429 (token bucket)
+    burst: int = 10                   # token bucket size for rate_limit
+    retry_after: Optional[int] = 1    # Retry-After header on 429 (None = omit)
+    page_size: int = MAX_PAGE_SIZE    # max items per page
+    autocreate_repos: bool = True     # create repositories on first use
+    etags: bool = True                # ETag on GET, 304 on If-None-Match
+    seed: Optional[int] = None        # RNG seed for reproducible runs
+
+
+@dataclass
+class FakeRepo:
+    """In-memory repository"""
+    data: Dict[str, Any]
+    issues: List[Dict[str, Any]] = field(default_factory=list)
+    labels: List[Dict[str, Any]] = field(default_factory=list)
+    milestones: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class FakeGiteaState:
+    """In-memory Gitea data (thread-safe)"""
+
+    def __init__(self, options: FakeGiteaOptions):
+        self.options = options
+        self.lock = threading.RLock()
+        self._next_id = 0
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.orgs: Dict[str, Dict[str, Any]] = {}
+        self.teams: Dict[int, Dict[str, Any]] = {}
+        self.team_members: Dict[int, List[str]] = {}
+        self.repos: Dict[Tuple[str, str], FakeRepo] = {}
+        self.add_user(ADMIN_LOGIN, f"{ADMIN_LOGIN}@example.com", is_admin=True)
+
+    def next_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    # --- Seeding helpers ---
+
+    def add_user(self, login: str, email: str = "", full_name: str = "", is_admin: bool = False) -> Dict:
+        with self.lock:
+            user = {
+                'id': self.next_id(),
+                'login': login,
+                'username': login,
+                'email': email or f"{login}@example.com",
+                'full_name': full_name,
+                'is_admin': is_admin,
+                'created': _now()
+            }
+            self.users[login.lower()] = user
+            return user
+
+    def add_org(self, name: str, description: str = "") -> Dict:
+        with self.lock:
+            org = {
+                'id': self.next_id(),
+                'username': name,
+                'name': name,
+                'full_name': '',
+                'description': description,
+                'visibility': 'private'
+            }
+            self.orgs[name.lower()] = org
+            return org
+
+    def add_repo(self, owner: str, name: str, description: str = "", private: bool = True) -> FakeRepo:
+        with self.lock:
+            repo = FakeRepo(data={
+                'id': self.next_id(),
+                'name': name,
+                'full_name': f"{owner}/{name}",
+                'owner': {'login': owner},
+                'description': description,
+                'private': private
+            })
+            self.repos[(owner.lower(), name.lower())] = repo
+            return repo
+
+    # --- Lookups ---
+
+    def user(self, login: str) -> Dict:
+        user = self.users.get(login.lower())
+        if user is None:
+            raise FakeGiteaError(404, "user does not exist")
+        return user
+
+    def org(self, name: str) -> Dict:
+        org = self.orgs.get(name.lower())
+        if org is None:
+            raise FakeGiteaError(404, "org does not exist")
+        return org
+
+    def team(self, team_id: str) -> Dict:
+        team = self.teams.get(int(team_id))
+        if team is None:
+            raise FakeGiteaError(404, "team does not exist")
+        return team
+
+    def repo(self, owner: str, name: str) -> FakeRepo:
+        repo = self.repos.get((owner.lower(), name.lower()))
+        if repo is None:
+            if not self.options.autocreate_repos:
+                raise FakeGiteaError(404, "repository does not exist")
+            repo = self.add_repo(owner, name)
+        return repo
+
+    @staticmethod
+    def find(items: List[Dict], key: str, value: int) -> Dict:
+        for item in items:
+            if item[key] == value:
+                return item
+        raise FakeGiteaError(404, "not found")
+
+
+# (method, compiled pattern, handler, readable template)
+Route = Tuple[str, re.Pattern, Callable, str]
+
+
+class FakeGiteaAPI:
+    """Route table and handlers of the fake Gitea API"""
+
+    def __init__(self, state: FakeGiteaState):
+        self.state = state
+        self.routes: List[Route] = []
+
+        R = self._route
+        R('GET', r'/user', self.get_current_user)
+        R('GET', r'/users/(?P<username>[^/]+)', self.get_user)
+        R('GET', r'/admin/users', self.list_users)
+        R('POST', r'/admin/users', self.create_user)
+        R('POST', r'/orgs', self.create_org)
+        R('GET', r'/orgs/(?P<org>[^/]+)', self.get_org)
+        R('PATCH', r'/orgs/(?P<org>[^/]+)', self.edit_org)
+        R('GET', r'/orgs/(?P<org>[^/]+)/teams', self.list_teams)
+        R('POST', r'/orgs/(?P<org>[^/]+)/teams', self.create_team)
+        R('GET', r'/orgs/(?P<org>[^/]+)/repos', self.list_org_repos)
+        R('POST', r'/orgs/(?P<org>[^/]+)/repos', self.create_org_repo)
+        R('PATCH', r'/teams/(?P<team>\d+)', self.edit_team)
+        R('GET', r'/teams/(?P<team>\d+)/members', self.list_team_members)
+        R('PUT', r'/teams/(?P<team>\d+)/members/(?P<username>[^/]+)', self.add_team_member)
+        R('DELETE', r'/teams/(?P<team>\d+)/members/(?P<username>[^/]+)', self.remove_team_member)
+        repo = r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)'
+        R('GET', repo, self.get_repo)
+        R('PATCH', repo, self.edit_repo)
+        R('GET', repo + r'/issues', self.list_issues)
+        R('POST', repo + r'/issues', self.create_issue)
+        R('GET', repo + r'/issues/(?P<number>\d+)', self.get_issue)
+        R('PATCH', repo + r'/issues/(?P<number>\d+)', self.edit_issue)
+        R('POST', repo + r'/issues/(?P<number>\d+)/labels', self.add_issue_labels)
+        R('GET', repo + r'/labels', self.list_labels)
+        R('POST', repo + r'/labels', self.create_label)
+        R('GET', repo + r'/milestones', self.list_milestones)
+        R('POST', repo + r'/milestones', self.create_milestone)
+        R('PATCH', repo + r'/milestones/(?P<milestone>\d+)', self.edit_milestone)
+
+    def _route(self, method: str, pattern: str, handler: Callable):
+        template = re.sub(r'\(\?P<(\w+)>[^)]*\)', r'{\1}', pattern)
+        self.routes.append((method, re.compile(f"^/api/v1{pattern}$"), handler, template))
+
+    def match(self, method: str, path: str) -> Tuple[Optional[Callable], Dict[str, str], Optional[str]]:
+        """
+        Find the handler of a request
+
+        Returns:
+            (handler, path params, route template); handler is None when
+            nothing matches, and the template is '' for a known path
+            requested with the wrong method, None for an unknown path
+        """
+        path_known = False
+        for route_method, pattern, handler, template in self.routes:
+            match = pattern.match(path)
+            if match:
+                if route_method == method:
+                    return handler, match.groupdict(), template
+                path_known = True
+        return None, {}, ('' if path_known else None)
+
+    # --- Users ---
+
+    def get_current_user(self, params, query, body):
+        return 200, self.state.user(ADMIN_LOGIN)
+
+    def get_user(self, params, query, body):
+        return 200, self.state.user(params['username'])
+
+    def list_users(self, params, query, body):
+        return 200, sorted(self.state.users.values(), key=lambda user: user['id'])
+
+    def create_user(self, params, query, body):
+        if body['username'].lower() in self.state.users:
+            raise FakeGiteaError(422, "user already exists")
+        return 201, self.state.add_user(body['username'], body.get('email', ''), body.get('full_name', ''))
+
+    # --- Organizations ---
+
+    def create_org(self, params, query, body):
+        if body['username'].lower() in self.state.orgs:
+            raise FakeGiteaError(422, "user already exists")
+        return 201, self.state.add_org(body['username'], body.get('description', ''))
+
+    def get_org(self, params, query, body):
+        return 200, self.state.org(params['org'])
+
+    def edit_org(self, params, query, body):
+        org = self.state.org(params['org'])
+        org.update({key: value for key, value in body.items() if key in ('description', 'full_name', 'visibility')})
+        return 200, org
+
+    def list_teams(self, params, query, body):
+        org = self.state.org(params['org'])
+        return 200, [team for team in self.state.teams.values() if team['organization']['id'] == org['id']]
+
+    def create_team(self, params, query, body):
+        org = self.state.org(params['org'])
+        if any(team['name'] == body['name'] and team['organization']['id'] == org['id']
+               for team in self.state.teams.values()):
+            raise FakeGiteaError(422, "team already exists")
+        team = {
+            'id': self.state.next_id(),
+            'name': body['name'],
+            'description': body.get('description', ''),
+            'permission': body.get('permission', 'read'),
+            'includes_all_repositories': body.get('includes_all_repositories', False),
+            'units': body.get('units', []),
+            'organization': {'id': org['id'], 'username': org['username']}
+        }
+        self.state.teams[team['id']] = team
+        self.state.team_members[team['id']] = []
+        return 201, team
+
+    def list_org_repos(self, params, query, body):
+        org = self.state.org(params['org'])
+        return 200, [
+            repo.data for (owner, _), repo in self.state.repos.items()
+            if owner == org['username'].lower()
+        ]
+
+    def create_org_repo(self, params, query, body):
+        org = self.state.org(params['org'])
+        if (org['username'].lower(), body['name'].lower()) in self.state.repos:
+            raise FakeGiteaError(409, "The repository with the same name already exists.")
+        repo = self.state.add_repo(
+            org['username'], body['name'], body.get('description', ''), body.get('private', False)
+        )
+        return 201, repo.data
+
+    # --- Teams ---
+
+    def edit_team(self, params, query, body):
+        team = self.state.team(params['team'])
+        team.update({
+            key: value for key, value in body.items()
+            if key in ('name', 'description', 'permission', 'includes_all_repositories', 'units')
+        })
+        return 200, team
+
+    def list_team_members(self, params, query, body):
+        self.state.team(params['team'])
+        return 200, [self.state.user(login) for login in self.state.team_members[int(params['team'])]]
+
+    def add_team_member(self, params, query, body):
+        self.state.team(params['team'])
+        user = self.state.user(params['username'])
+        members = self.state.team_members[int(params['team'])]
+        if user['login'] not in members:
+            members.append(user['login'])
+        return 204, None
+
+    def remove_team_member(self, params, query, body):
+        self.state.team(params['team'])
+        user = self.state.user(params['username'])
+        members = self.state.team_members[int(params['team'])]
+        if user['login'] in members:
+            members.remove(user['login'])
+        return 204, None
+
+    # --- Repositories ---
+
+    def _repo(self, params) -> FakeRepo:
+        return self.state.repo(params['owner'], params['repo'])
+
+    def get_repo(self, params, query, body):
+        return 200, self._repo(params).data
+
+    def edit_repo(self, params, query, body):
+        repo = self._repo(params)
+        repo.data.update({key: value for key, value in body.items() if key in ('description', 'private')})
+        return 200, repo.data
+
+    # --- Issues ---
+
+    def _issue_refs(self, repo: FakeRepo, issue: Dict, body: Dict):
+        """Resolve label ids, milestone id and assignee of an issue payload"""
+        if 'labels' in body:
+            issue['labels'] = [label for label in repo.labels if label['id'] in (body['labels'] or [])]
+        if 'milestone' in body:
+            issue['milestone'] = (
+                self.state.find(repo.milestones, 'id', body['milestone']) if body['milestone'] else None
+            )
+        if 'assignee' in body:
+            assignee = self.state.user(body['assignee']) if body['assignee'] else None
+            issue['assignee'] = assignee
+            issue['assignees'] = [assignee] if assignee else []
+
+    def list_issues(self, params, query, body):
+        repo = self._repo(params)
+        state = query.get('state', 'open')
+        return 200, [
+            issue for issue in reversed(repo.issues)
+            if state == 'all' or issue['state'] == state
+        ]
+
+    def create_issue(self, params, query, body):
+        repo = self._repo(params)
+        issue = {
+            'id': self.state.next_id(),
+            'number': len(repo.issues) + 1,
+            'title': body['title'],
+            'body': body.get('body', ''),
+            'state': 'open',
+            'labels': [],
+            'milestone': None,
+            'assignee': None,
+            'assignees': [],
+            'created_at': _now(),
+            'updated_at': _now()
+        }
+        self._issue_refs(repo, issue, body)
+        repo.issues.append(issue)
+        return 201, issue
+
+    def get_issue(self, params, query, body):
+        return 200, self.state.find(self._repo(params).issues, 'number', int(params['number']))
+
+    def edit_issue(self, params, query, body):
+        repo = self._repo(params)
+        issue = self.state.find(repo.issues, 'number', int(params['number']))
+        issue.update({key: value for key, value in body.items() if key in ('title', 'body', 'state')})
+        self._issue_refs(repo, issue, {key: value for key, value in body.items() if key in ('milestone', 'assignee')})
+        issue['updated_at'] = _now()
+        return 201, issue
+
+    def add_issue_labels(self, params, query, body):
+        repo = self._repo(params)
+        issue = self.state.find(repo.issues, 'number', int(params['number']))
+        current = {label['id'] for label in issue['labels']}
+        issue['labels'] += [
+            label for label in repo.labels
+            if label['id'] in body.get('labels', []) and label['id'] not in current
+        ]
+        return 200, issue['labels']
+
+    # --- Labels & milestones ---
+
+    def list_labels(self, params, query, body):
+        return 200, self._repo(params).labels
+
+    def create_label(self, params, query, body):
+        repo = self._repo(params)
+        label = {
+            'id': self.state.next_id(),
+            'name': body['name'],
+            'color': body.get('color', 'ededed').lstrip('#'),
+            'description': body.get('description', '')
+        }
+        repo.labels.append(label)
+        return 201, label
+
+    def list_milestones(self, params, query, body):
+        state = query.get('state', 'open')
+        return 200, [
+            milestone for milestone in self._repo(params).milestones
+            if state == 'all' or milestone['state'] == state
+        ]
+
+    def create_milestone(self, params, query, body):
+        repo = self._repo(params)
+        milestone = {
+            'id': self.state.next_id(),
+            'title': body['title'],
+            'description': body.get('description', ''),
+            'state': body.get('state', 'open'),
+            'due_on': body.get('due_on'),
+            'open_issues': 0,
+            'closed_issues': 0
+        }
+        repo.milestones.append(milestone)
+        return 201, milestone
+
+    def edit_milestone(self, params, query, body):
+        milestone = self.state.find(self._repo(params).milestones, 'id', int(params['milestone']))
+        milestone.update({
+            key: value for key, value in body.items()
+            if key in ('title', 'description', 'state', 'due_on')
+        })
+        return 200, milestone
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP front end: faults, latency, pagination, JSON encoding"""
+
+    protocol_version = 'HTTP/1.1'
+    server: '_FakeGiteaHTTPServer'
+
+    # Send headers and body in one segment; otherwise Nagle + delayed ACK
+    # add ~40 ms to every keep-alive request and swamp the measurements
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def _dispatch(self):
+        fake = self.server.fake
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+
+        handler, params, route = fake.api.match(self.command, url.path)
+        fake.record(self.command, route or url.path)
+
+        fake.delay()
+
+        fault = fake.fault()
+        if fault:
+            status, headers = fault
+            return self._send_json(status, {'message': 'injected failure'}, headers)
+
+        if handler is None:
+            status = 405 if route == '' else 404
+            return self._send_json(status, {'message': 'not found' if status == 404 else 'method not allowed'})
+
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            return self._send_json(400, {'message': 'invalid JSON body'})
+
+        try:
+            with fake.state.lock:
+                status, payload = handler(params, query, body)
+                if isinstance(payload, list):
+                    payload, headers = fake.paginate(url.path, query, payload)
+                else:
+                    headers = {}
+                data = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        except FakeGiteaError as e:
+            return self._send_json(e.status, {'message': e.message})
+        except (KeyError, TypeError) as e:
+            return self._send_json(422, {'message': f"invalid request: {e}"})
+
+        # Strong validator over body and pagination headers
+        if self.command == 'GET' and status == 200 and fake.options.etags:
+            digest = hashlib.sha1(data + json.dumps(headers, sort_keys=True).encode('utf-8'))
+            headers['ETag'] = f'"{digest.hexdigest()}"'
+            if self.headers.get('If-None-Match') == headers['ETag']:
+                return self._send_raw(304, b'', {'ETag': headers['ETag']})
+
+        self._send_raw(status, data, headers)
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None):
+        self._send_raw(status, json.dumps(payload).encode('utf-8'), headers or {})
+
+    def _send_raw(self, status: int, data: bytes, headers: Dict[str, str]):
+        self.server.fake.record_status(status)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json;charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+
+class _FakeGiteaHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: 'FakeGitea'
+
+
+class FakeGitea:
+    """
+    Local Gitea API stand-in
+
+    Start it with start() (or as a context manager), point a GiteaClient
+    at `url`, and read `stats()` afterwards for server-side counts.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, **options):
+        """
+        Initialize fake server
+
+        Args:
+            host: Interface to bind
+            port: Port (0 = pick a free one)
+            **options: FakeGiteaOptions fields (latency, jitter,
+                error_rate, throttle_rate, rate_limit, page_size, seed, ...)
+        """
+        self.options = FakeGiteaOptions(**options)
+        self.state = FakeGiteaState(self.options)
+        self.api = FakeGiteaAPI(self.state)
+        self.host = host
+        self.port = port
+        self._random = random.Random(self.options.seed)
+        self._random_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._requests: Dict[str, int] = {}
+        self._statuses: Dict[int, int] = {}
+        self._tokens = float(self.options.burst)
+        self._tokens_at = time.monotonic()
+        self._server: Optional[_FakeGiteaHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to give to GiteaClient"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> 'FakeGitea':
+        """Start serving in a background thread"""
+        self._server = _FakeGiteaHTTPServer((self.host, self.port), _Handler)
+        self._server.fake = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name='fake-gitea',
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Fake Gitea listening on {self.url}")
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread.join()
+
+    def __enter__(self) -> 'FakeGitea':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # --- Behaviour ---
+
+    def _uniform(self, low: float, high: float) -> float:
+        with self._random_lock:
+            return self._random.uniform(low, high)
+
+    def delay(self):
+        """Sleep for the configured latency +/- jitter"""
+        latency = self.options.latency
+        if self.options.jitter:
+            latency += self._uniform(-self.options.jitter, self.options.jitter)
+        if latency > 0:
+            time.sleep(latency)
+
+    def _take_token(self) -> Optional[float]:
+        """Token bucket; returns seconds until a token frees up, or None if taken"""
+        rate = self.options.rate_limit
+        with self._stats_lock:
+            now = time.monotonic()
+            self._tokens = min(self.options.burst, self._tokens + (now - self._tokens_at) * rate)
+            self._tokens_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            return (1 - self._tokens) / rate
+
+    def fault(self) -> Optional[Tuple[int, Dict[str, str]]]:
+        """
+        Decide whether to fail the current request
+
+        Returns:
+            (status, headers) of the injected failure, or None
+        """
+        retry_after = self.options.retry_after
+
+        if self.options.rate_limit:
+            wait = self._take_token()
+            if wait is not None:
+                headers = {'Retry-After': str(max(1, math.ceil(wait)))} if retry_after is not None else {}
+                return 429, headers
+
+        if self.options.throttle_rate and self._uniform(0, 1) < self.options.throttle_rate:
+            return 429, ({'Retry-After': str(retry_after)} if retry_after is not None else {})
+
+        if self.options.error_rate and self._uniform(0, 1) < self.options.error_rate:
+            return self.options.error_status, {}
+
+        return None
+
+    def paginate(self, path: str, query: Dict[str, str], items: List[Any]) -> Tuple[List[Any], Dict[str, str]]:
+        """
+        Slice a list response like Gitea does
+
+        Returns:
+            (page items, headers with X-Total-Count and Link)
+        """
+        try:
+            page = max(1, int(query.get('page', 1)))
+            limit = int(query.get('limit', self.options.page_size))
+        except ValueError:
+            page, limit = 1, self.options.page_size
+        limit = max(1, min(limit, self.options.page_size))
+
+        total = len(items)
+        last_page = max(1, math.ceil(total / limit))
+        headers = {'X-Total-Count': str(total)}
+
+        links = []
+        for rel, target in (('next', page + 1), ('last', last_page)):
+            if rel == 'next' and page >= last_page:
+                continue
+            link_query = urlencode({**query, 'page': target, 'limit': limit})
+            links.append(f'<{self.url}{path}?{link_query}>; rel="{rel}"')
+        if links:
+            headers['Link'] = ', '.join(links)
+
+        start = (page - 1) * limit
+        return items[start:start + limit], headers
+
+    # --- Stats ---
+
+    def record(self, method: str, route: str):
+        with self._stats_lock:
+            key = f"{method} {route}"
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+    def record_status(self, status: int):
+        with self._stats_lock:
+            self._statuses[status] = self._statuses.get(status, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Server-side request counters
+
+        Returns:
+            Dict with total requests, per-route counts and per-status counts
+        """
+        with self._stats_lock:
+            return {
+                'requests': sum(self._requests.values()),
+                'by_route': dict(self._requests),
+                'by_status': {str(status): count for status, count in sorted(self._statuses.items())}
+            }
+
+    def reset_stats(self):
+        """Clear request counters (data is kept)"""
+        with self._stats_lock:
+            self._requests.clear()
+            self._statuses.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Gitea API stand-in for benchmarks")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3000)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every request')
+    parser.add_argument('--jitter', type=float, default=0.0, help='+/- seconds of uniform jitter')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests failing')
+    parser.add_argument('--error-status', type=int, default=503, help='Status of injected failures')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests answered 429')
+    parser.add_argument('--rate-limit', type=float, default=None, help='Requests/second before 429')
+    parser.add_argument('--burst', type=int, default=10, help='Burst allowed by --rate-limit')
+    parser.add_argument('--page-size', type=int, default=MAX_PAGE_SIZE, help='Max items per page')
+    parser.add_argument('--seed', type=int, default=None, help='RNG seed (jitter, fault injection)')
+    parser.add_argument('--org', action='append', default=[], help='Organization to create up front')
+    parser.add_argument('--repo', action='append', default=[], help='owner/name repository to create up front')
+    parser.add_argument('--no-autocreate', action='store_true', help='404 on unknown repositories')
+    parser.add_argument('--no-etags', action='store_true', help='No ETag/304 on GET')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    fake = FakeGitea(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        page_size=args.page_size,
+        autocreate_repos=not args.no_autocreate,
+        etags=not args.no_etags,
+        seed=args.seed
+    )
+    for org in args.org:
+        fake.state.add_org(org)
+    for repo in args.repo:
+        owner, _, name = repo.partition('/')
+        fake.state.add_repo(owner, name)
+
+    fake.start()
+    print(f"Fake Gitea on {fake.url} (token: any) - Ctrl-C to stop")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        fake.stop()
+        print(json.dumps(fake.stats(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Parser Benchmark - Markdown parser throughput and regression gate
+
+Micro-benchmarks BaseParser.extract_sections, extract_yaml_frontmatter,
+StoryParser.parse and EpicParser.parse over small, typical and
+pathological files (huge tables, thousands of checkbox tasks, deeply
+nested lists) and reports files/s and MB/s per case.
+
+Usage:
+    python -m benchmarks.parser_benchmark run
+    python -m benchmarks.parser_benchmark save                  # write the baseline
+    python -m benchmarks.parser_benchmark check --threshold 0.15  # exit 1 on regression
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baselines' / 'parsers.json'
+
+sys.path.insert(0, str(REPO_ROOT / 'src'))
+
+from parsers.base_parser import BaseParser  # noqa: E402
+from parsers.epic_parser import EpicParser  # noqa: E402
+from parsers.story_parser import StoryParser  # noqa: E402
+
+from benchmarks.synthetic import render_epic, render_story  # noqa: E402
+
+
+@dataclass
+class Case:
+    """One benchmark input file"""
+    name: str
+    kind: str  # 'story' or 'epic'
+    text: str
+
+
+def _frontmatter(rng: random.Random, keys: int) -> str:
+    lines = ['---', 'epic: "Epic-001: Patient Portal"', 'assignee: bmad-dev', 'points: 5']
+    lines += [f"key_{i}: value {rng.randint(0, 10 ** 6)}" for i in range(keys)]
+    lines += ['tags:'] + [f"  - tag-{i}" for i in range(keys // 4)]
+    return '\n'.join(lines + ['---', ''])
+
+
+def _huge_table(rows: int) -> str:
+    header = "| ID | Endpoint | Method | Status | Owner | Notes |\n|----|----------|--------|--------|-------|-------|\n"
+    return header + '\n'.join(
+        f"| {i} | /api/v1/resource/{i} | GET | 200 | team-{i % 7} | row {i} notes text |"
+        for i in range(rows)
+    )
+
+
+def _checkboxes(count: int) -> str:
+    return '\n'.join(
+        f"- [{'x' if i % 3 == 0 else ' '}] Task {i}: implement step {i} of the migration"
+        for i in range(count)
+    )
+
+
+def _nested_list(depth: int, repeat: int) -> str:
+    return '\n'.join(
+        f"{'  ' * level}- level {level} item {block}"
+        for block in range(repeat)
+        for level in range(depth)
+    )
+
+
+def build_cases(seed: int = 0) -> List[Case]:
+    """
+    Benchmark inputs (deterministic for a given seed)
+
+    Args:
+        seed: RNG seed of the synthetic content
+
+    Returns:
+        Cases from small to pathological
+    """
+    rng = random.Random(seed)
+    typical_story = render_story(1, 1, 'Patient Portal', 'dev', rng)
+    typical_epic = render_epic(1, 'Patient Portal', list(range(1, 21)), rng)
+
+    return [
+        Case('story-small', 'story',
+             "# Story-001: Login\n\n## Tasks\n\n- [ ] Form\n\n## Assignee\n\n**Dev**\n"),
+        Case('story-typical', 'story', typical_story),
+        Case('story-frontmatter', 'story', _frontmatter(rng, 40) + typical_story),
+        Case('epic-typical', 'epic', typical_epic),
+        Case('epic-many-stories', 'epic', render_epic(1, 'Big Epic', list(range(1, 2001)), rng)),
+        Case('story-huge-table', 'story',
+             typical_story.replace('## Technical Notes\n', f"## Technical Notes\n\n{_huge_table(5000)}\n", 1)),
+        Case('story-5k-checkboxes', 'story',
+             typical_story.replace('## Tasks\n', f"## Tasks\n\n{_checkboxes(5000)}\n", 1)),
+        Case('story-nested-lists', 'story',
+             typical_story.replace('## Acceptance Criteria\n', f"## Acceptance Criteria\n\n{_nested_list(60, 80)}\n", 1)),
+    ]
+
+
+def _fresh(parser: BaseParser) -> BaseParser:
+    """Drop the tokenize() cache so each call measures a full scan"""
+    parser._document = None
+    return parser
+
+
+def targets_for(case: Case, path: Path) -> Dict[str, Callable[[], object]]:
+    """
+    Functions to time for a case
+
+    Args:
+        case: Benchmark case
+        path: Case file on disk
+
+    Returns:
+        Dict of target name: zero-argument callable
+    """
+    parser_class = StoryParser if case.kind == 'story' else EpicParser
+
+    # Content loaded once: sections/frontmatter time the scan, not the read
+    loaded = parser_class(path)
+    loaded.read_file()
+
+    return {
+        'extract_sections': lambda: _fresh(loaded).extract_sections(),
+        'extract_yaml_frontmatter': lambda: _fresh(loaded).extract_yaml_frontmatter(),
+        f"{parser_class.__name__}.parse": lambda: parser_class(path).parse(),
+    }
+
+
+def time_target(target: Callable[[], object], min_time: float, repeats: int) -> float:
+    """
+    Best seconds per call
+
+    Calls are batched until a batch lasts at least min_time; the best of
+    `repeats` batches is kept (least disturbed by other processes).
+
+    Args:
+        target: Function to time
+        min_time: Minimum batch duration (seconds)
+        repeats: Number of batches
+
+    Returns:
+        Seconds per call
+    """
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            target()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+    best = elapsed / number
+    for _ in range(repeats - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            target()
+        best = min(best, (time.perf_counter() - started) / number)
+
+    return best
+
+
+def run(min_time: float, repeats: int, only: Optional[str] = None, seed: int = 0) -> Dict:
+    """
+    Run every case and target
+
+    Args:
+        min_time: Minimum batch duration (seconds)
+        repeats: Batches per measurement
+        only: Run only cases whose name contains this string
+        seed: RNG seed of the synthetic content
+
+    Returns:
+        Result dict with one entry per (case, target)
+    """
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix='bmad-parser-bench-') as tmp:
+        for case in build_cases(seed):
+            if only and only not in case.name:
+                continue
+
+            path = Path(tmp) / f"{case.kind}-001-{case.name}.md"
+            path.write_text(case.text, encoding='utf-8')
+            size = len(case.text.encode('utf-8'))
+
+            for target_name, target in targets_for(case, path).items():
+                seconds = time_target(target, min_time, repeats)
+                results.append({
+                    'case': case.name,
+                    'target': target_name,
+                    'bytes': size,
+                    'seconds_per_file': seconds,
+                    'files_per_second': round(1 / seconds, 1),
+                    'mb_per_second': round(size / seconds / 1e6, 2)
+                })
+                print(f"   {case.name:<20} {target_name:<26} {size / 1024:>8.1f} KiB "
+                      f"{1 / seconds:>12,.0f} files/s {size / seconds / 1e6:>9.2f} MB/s")
+
+    return {
+        'benchmark': 'parsers',
+        'created_at': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'min_time': min_time, 'repeats': repeats, 'seed': seed},
+        'results': results
+    }
+
+
+def regressions(result: Dict, baseline: Dict, threshold: float) -> List[Dict]:
+    """
+    Cases whose throughput dropped by more than threshold
+
+    Args:
+        result: Current run
+        baseline: Saved baseline
+        threshold: Allowed relative drop (0.15 = 15%)
+
+    Returns:
+        List of {'case', 'target', 'baseline', 'current', 'change'}
+    """
+    previous = {(r['case'], r['target']): r['files_per_second'] for r in baseline.get('results', [])}
+    found = []
+
+    for entry in result['results']:
+        before = previous.get((entry['case'], entry['target']))
+        if not before:
+            continue
+
+        change = entry['files_per_second'] / before - 1
+        if change < -threshold:
+            found.append({
+                'case': entry['case'],
+                'target': entry['target'],
+                'baseline': before,
+                'current': entry['files_per_second'],
+                'change': round(change, 4)
+            })
+
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Markdown parser micro-benchmark")
+    parser.add_argument('command', choices=['run', 'save', 'check'],
+                        help='run: print results; save: write the baseline; check: compare with it')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help='Baseline file (default: benchmarks/baselines/parsers.json)')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='check: allowed throughput drop (default 0.15 = 15%%)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum batch duration (seconds)')
+    parser.add_argument('--repeats', type=int, default=5, help='Batches per measurement (best is kept)')
+    parser.add_argument('--case', default=None, help='Only cases whose name contains this string')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, default=None, help='Also write the results to this file')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.command == 'check':
+        if not args.baseline.exists():
+            print(f"❌ No baseline at {args.baseline} (run 'save' first)")
+            sys.exit(2)
+        baseline = json.loads(args.baseline.read_text())
+
+    print("🧮 Parser benchmark")
+    result = run(args.min_time, args.repeats, args.case, args.seed)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2))
+        print(f"\n💾 Results: {args.output}")
+
+    if args.command == 'save':
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(result, indent=2))
+        print(f"\n💾 Baseline saved: {args.baseline}")
+
+    elif args.command == 'check':
+        found = regressions(result, baseline, args.threshold)
+        if found:
+            print(f"\n❌ {len(found)} regression(s) beyond {args.threshold:.0%}:")
+            for entry in found:
+                print(f"   {entry['case']} / {entry['target']}: "
+                      f"{entry['baseline']:,.0f} → {entry['current']:,.0f} files/s ({entry['change']:+.1%})")
+            sys.exit(1)
+
+        print(f"\n✅ No regression beyond {args.threshold:.0%} (baseline {args.baseline})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Sync Benchmark - End-to-end sync against a local Gitea stand-in
+
+Generates a synthetic BMad tree, starts benchmarks.fake_gitea in-process,
+runs the `sync` and `sync-artifacts` CLI commands against it (cold run,
+then a warm re-run with nothing changed) and records wall time, HTTP
+calls per artifact, per-phase timings, parse CPU time and peak RSS as
+JSON, for comparison between commits.
+
+Usage:
+    python -m benchmarks.sync_benchmark --epics 20 --stories 1000 --agents 12
+    python -m benchmarks.sync_benchmark --stories 1000 --compare benchmarks/results/<old>.json
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = REPO_ROOT / 'src'
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+sys.path.insert(0, str(SRC_DIR))
+
+from benchmarks.fake_gitea import FakeGitea  # noqa: E402
+from benchmarks.synthetic import generate_tree  # noqa: E402
+
+# Run metrics compared by --compare (lower is better)
+COMPARED_METRICS = ['wall_seconds', 'http_calls', 'calls_per_artifact', 'peak_rss_mb']
+
+
+def git_revision() -> Optional[str]:
+    """Short commit hash of the working tree (None outside git)"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def project_yaml(project: str, tree: Path, gitea_url: str, provisioning: str) -> str:
+    """Project config for the synthetic tree (see examples/medical-project.yaml)"""
+    return f"""# Generated by benchmarks/sync_benchmark.py - removed after the run
+project:
+  name: {project}
+bmad:
+  root: {tree}
+  manifest: manifest.csv
+  artifacts: {tree / 'artifacts'}
+gitea:
+  url: {gitea_url}
+  organization: BenchOrg
+  repository: bench-repo
+  admin_token: bench-token
+  retry:
+    backoff_base: 0.05
+    backoff_max: 1
+organization:
+  name: BenchOrg
+  description: "Benchmark organization"
+  teams:
+    - name: BMad-Core
+      members: all
+  repositories:
+    - name: bench-repo
+gmail:
+  base: bench
+sync:
+  provisioning: {provisioning}
+  state_dir: {tree / 'state'}
+logging:
+  level: WARNING
+"""
+
+
+def run_command(
+    command: str,
+    project: str,
+    workdir: Path,
+    gitea: FakeGitea,
+    extra_args: List[str]
+) -> Dict[str, Any]:
+    """
+    Run one CLI command in a child process and measure it
+
+    Args:
+        command: 'sync' or 'sync-artifacts'
+        project: Project name
+        workdir: Working directory (email mapping, metrics report)
+        gitea: Fake Gitea the project points at
+        extra_args: Extra CLI arguments
+
+    Returns:
+        Run measurements (wall time, HTTP calls, peak RSS, phases, API metrics)
+    """
+    metrics_file = workdir / f"{command}-{time.monotonic_ns()}.json"
+    args = [
+        sys.executable, str(SRC_DIR / 'sync.py'), command,
+        '-p', project, '--metrics', '--metrics-file', str(metrics_file),
+        *extra_args
+    ]
+
+    gitea.reset_stats()
+    started = time.perf_counter()
+
+    with open(workdir / f"{command}.log", 'a') as log:
+        process = subprocess.Popen(args, cwd=workdir, stdout=log, stderr=subprocess.STDOUT)
+        # wait4 gives this child's own rusage (peak RSS, CPU)
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+
+    wall = time.perf_counter() - started
+    server = gitea.stats()
+
+    report = json.loads(metrics_file.read_text()) if metrics_file.exists() else {}
+
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    rss_divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+
+    return {
+        'command': command,
+        'args': extra_args,
+        'exit_code': process.returncode,
+        'wall_seconds': round(wall, 4),
+        'user_cpu_seconds': round(usage.ru_utime, 4),
+        'system_cpu_seconds': round(usage.ru_stime, 4),
+        'peak_rss_mb': round(usage.ru_maxrss / rss_divisor, 2),
+        'http_calls': server['requests'],
+        'http_by_status': server['by_status'],
+        'http_by_route': server['by_route'],
+        'phases': report.get('phases', []),
+        'api': report.get('api', {}).get('totals', {})
+    }
+
+
+def measure_parsing(artifacts: Path) -> Dict[str, Any]:
+    """
+    CPU time spent parsing every epic and story (in this process)
+
+    Args:
+        artifacts: Artifacts directory (epics/, stories/)
+
+    Returns:
+        Files, bytes, CPU seconds and throughput
+    """
+    from parsers.epic_parser import EpicParser
+    from parsers.story_parser import StoryParser
+
+    files = (
+        [(EpicParser, path) for path in sorted((artifacts / 'epics').glob('epic-*.md'))]
+        + [(StoryParser, path) for path in sorted((artifacts / 'stories').glob('story-*.md'))]
+    )
+    size = sum(path.stat().st_size for _, path in files)
+
+    started = time.process_time()
+    for parser_class, path in files:
+        parser_class(path).parse()
+    cpu = time.process_time() - started
+
+    return {
+        'files': len(files),
+        'bytes': size,
+        'cpu_seconds': round(cpu, 4),
+        'files_per_second': round(len(files) / cpu, 1) if cpu else None,
+        'mb_per_second': round(size / cpu / 1e6, 2) if cpu else None
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Generate the tree, run every command cold then warm, collect results"""
+    project = f"bench-{os.getpid()}"
+    config_file = REPO_ROOT / 'config' / 'projects' / f"{project}.yaml"
+
+    workdir = Path(tempfile.mkdtemp(prefix='bmad-bench-'))
+    tree = workdir / 'tree'
+
+    print(f"🏗️  Generating {args.epics} epics / {args.stories} stories / {args.agents} agents in {tree}")
+    sizes = generate_tree(tree, args.epics, args.stories, args.agents, seed=args.seed)
+    artifacts = sizes['epics'] + sizes['stories']
+
+    extra = ['--workers', str(args.workers)]
+    artifact_extra = extra + ['--parse-workers', str(args.parse_workers)]
+
+    runs = []
+
+    with FakeGitea(latency=args.latency, jitter=args.jitter, seed=args.seed) as gitea:
+        config_file.write_text(project_yaml(project, tree, gitea.url, args.provisioning))
+
+        try:
+            for phase in ('cold', 'warm'):
+                for command in args.commands:
+                    run = run_command(
+                        command,
+                        project,
+                        workdir,
+                        gitea,
+                        artifact_extra if command == 'sync-artifacts' else extra
+                    )
+                    run['run'] = phase
+                    count = artifacts if command == 'sync-artifacts' else sizes['agents']
+                    run['calls_per_artifact'] = round(run['http_calls'] / count, 3) if count else None
+                    runs.append(run)
+
+                    status = '✅' if run['exit_code'] == 0 else f"❌ exit {run['exit_code']}"
+                    print(
+                        f"   {status} {command:<15} {phase:<5} {run['wall_seconds']:>8.2f}s "
+                        f"{run['http_calls']:>7} calls ({run['calls_per_artifact']}/item) "
+                        f"{run['peak_rss_mb']:>7.1f} MB"
+                    )
+        finally:
+            config_file.unlink(missing_ok=True)
+
+    parsing = measure_parsing(tree / 'artifacts')
+    print(f"   🧮 parse: {parsing['files']} files in {parsing['cpu_seconds']:.2f}s CPU "
+          f"({parsing['files_per_second']} files/s)")
+
+    result = {
+        'benchmark': 'sync',
+        'revision': git_revision(),
+        'created_at': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {
+            'epics': sizes['epics'],
+            'stories': sizes['stories'],
+            'agents': sizes['agents'],
+            'tree_bytes': sizes['bytes'],
+            'workers': args.workers,
+            'parse_workers': args.parse_workers,
+            'latency': args.latency,
+            'jitter': args.jitter,
+            'seed': args.seed
+        },
+        'parsing': parsing,
+        'runs': runs
+    }
+
+    if not args.keep:
+        import shutil
+        shutil.rmtree(workdir, ignore_errors=True)
+    else:
+        print(f"   📁 Kept {workdir}")
+
+    return result
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any]):
+    """Print per-run deltas against a baseline result"""
+    baseline_runs = {(run['command'], run['run']): run for run in baseline.get('runs', [])}
+
+    print(f"\n📊 Compared with {baseline.get('revision') or 'baseline'}")
+    if baseline.get('params') != result['params']:
+        print("   ⚠️  Parameters differ from the baseline")
+
+    for run in result['runs']:
+        old = baseline_runs.get((run['command'], run['run']))
+        if not old:
+            continue
+
+        deltas = []
+        for metric in COMPARED_METRICS:
+            before, after = old.get(metric), run.get(metric)
+            if not before or after is None:
+                continue
+            deltas.append(f"{metric} {before} → {after} ({(after - before) / before * 100:+.1f}%)")
+
+        print(f"   {run['command']} ({run['run']}): " + ', '.join(deltas))
+
+    old_parse = baseline.get('parsing', {}).get('cpu_seconds')
+    if old_parse:
+        new_parse = result['parsing']['cpu_seconds']
+        print(f"   parse cpu_seconds {old_parse} → {new_parse} ({(new_parse - old_parse) / old_parse * 100:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end sync benchmark against a local Gitea stand-in")
+    parser.add_argument('--epics', type=int, default=10)
+    parser.add_argument('--stories', type=int, default=200)
+    parser.add_argument('--agents', type=int, default=12)
+    parser.add_argument('--workers', type=int, default=4, help='--workers of both commands')
+    parser.add_argument('--parse-workers', type=int, default=1, help='--parse-workers of sync-artifacts')
+    parser.add_argument('--provisioning', choices=['auto', 'manual'], default='auto')
+    parser.add_argument('--latency', type=float, default=0.0, help='Fake Gitea latency (seconds)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Fake Gitea latency jitter (seconds)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--commands', nargs='+', default=['sync', 'sync-artifacts'],
+                        choices=['sync', 'sync-artifacts'])
+    parser.add_argument('--output', type=Path, default=None,
+                        help='Result file (default: benchmarks/results/sync-<rev>-<time>.json)')
+    parser.add_argument('--compare', type=Path, default=None, help='Baseline result to compare with')
+    parser.add_argument('--keep', action='store_true', help='Keep the generated tree and logs')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    output = args.output or RESULTS_DIR / (
+        f"sync-{result['revision'] or 'norev'}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"\n💾 Results: {output}")
+
+    if args.compare:
+        compare(result, json.loads(args.compare.read_text()))
+
+    if any(run['exit_code'] != 0 for run in result['runs']):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
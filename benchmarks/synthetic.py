@@ -0,0 +1,284 @@
+"""
+Synthetic BMad Trees - Generated artifacts for benchmarks
+
+Builds BMad project trees (agent manifest, epics, stories) of any size,
+modelled on test-artifacts/: same sections, checkbox lists, assignee,
+status and epic references, with seeded variation in length.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import csv
+import random
+import string
+from pathlib import Path
+from typing import Dict, List
+
+# Agents of the standard BMad method manifest
+BASE_AGENTS = [
+    ('analyst', 'Mary', 'Business Analyst'),
+    ('pm', 'John', 'Product Manager'),
+    ('architect', 'Winston', 'Architect'),
+    ('dev', 'Amelia', 'Developer'),
+    ('sm', 'Bob', 'Scrum Master'),
+    ('tea', 'Murat', 'Test Architect'),
+    ('ux-designer', 'Sally', 'UX Designer'),
+    ('tech-writer', 'Paige', 'Technical Writer'),
+]
+
+STATUSES = ['Todo', 'Todo', 'In Progress', 'Review', 'Done']
+PRIORITIES = ['Low', 'Medium', 'High', 'Critical']
+WORDS = (
+    'patient portal record access secure message lab result appointment '
+    'prescription upload download audit consent identity verification '
+    'billing report dashboard notification schedule provider clinic export'
+).split()
+
+
+def _letters(index: int) -> str:
+    """0 -> 'a', 25 -> 'z', 26 -> 'ba' (agent names can't contain digits)"""
+    name = ''
+    while True:
+        name = string.ascii_lowercase[index % 26] + name
+        index //= 26
+        if not index:
+            return name
+
+
+def agent_names(count: int) -> List[str]:
+    """Names of the first `count` synthetic agents"""
+    names = [name for name, _, _ in BASE_AGENTS[:count]]
+    names += [f"agent-{_letters(i)}" for i in range(count - len(names))]
+    return names
+
+
+def write_manifest(path: Path, count: int) -> List[str]:
+    """
+    Write an agent-manifest.csv
+
+    Args:
+        path: Manifest file
+        count: Number of agents
+
+    Returns:
+        Agent names
+    """
+    names = agent_names(count)
+    details = {name: (display, title) for name, display, title in BASE_AGENTS}
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['name', 'displayName', 'title', 'icon', 'role', 'module', 'path'])
+        for name in names:
+            display, title = details.get(name, (name.title(), 'Agent'))
+            writer.writerow([name, display, title, '🤖', name, 'bmm', f"_bmad/bmm/agents/{name}.md"])
+
+    return names
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def _checklist(rng: random.Random, count: int, suffix: str = '') -> str:
+    return '\n'.join(
+        f"- [{'x' if rng.random() < 0.3 else ' '}] {_phrase(rng, rng.randint(4, 12)).capitalize()}{suffix}"
+        for _ in range(count)
+    )
+
+
+def epic_title(index: int, rng: random.Random) -> str:
+    return f"{_phrase(rng, 2).title()} - {_phrase(rng, 3).title()} {index}"
+
+
+def render_epic(index: int, title: str, story_ids: List[int], rng: random.Random) -> str:
+    """Markdown of one epic (sections as in epic-001-patient-portal.md)"""
+    stories = '\n'.join(
+        f"- [ ] Story-{story_id:03d}: {_phrase(rng, 5).capitalize()}"
+        for story_id in story_ids
+    )
+    return f"""# Epic: {title}
+
+## Overview
+
+{_phrase(rng, 25).capitalize()}.
+
+## Business Value
+
+- **Problem**: {_phrase(rng, 10).capitalize()}
+- **Solution**: {_phrase(rng, 10).capitalize()}
+- **Impact**: {_phrase(rng, 8).capitalize()}
+
+## Scope
+
+### In Scope
+{_checklist(rng, rng.randint(3, 6)).replace('- [ ] ', '- ').replace('- [x] ', '- ')}
+
+### Out of Scope
+- {_phrase(rng, 5).capitalize()} (future epic)
+
+## User Stories
+
+{stories}
+
+## Acceptance Criteria
+
+{_checklist(rng, rng.randint(4, 8))}
+
+## Dependencies
+
+- {_phrase(rng, 6).capitalize()}
+
+## Timeline
+
+- **Start**: 2026-{rng.randint(1, 6):02d}-01
+- **Target**: 2026-{rng.randint(7, 12):02d}-15
+
+## Risks
+
+- {_phrase(rng, 5).capitalize()} (HIGH)
+
+---
+
+**Epic Owner**: PM (John)
+**Status**: {rng.choice(['Planning', 'In Progress', 'Done'])}
+**Last Updated**: 2026-01-19
+"""
+
+
+def render_story(
+    story_id: int,
+    epic_id: int,
+    epic: str,
+    assignee: str,
+    rng: random.Random
+) -> str:
+    """Markdown of one story (sections as in story-001-account-creation.md)"""
+    return f"""# Story-{story_id:03d}: {_phrase(rng, 4).title()}
+
+## User Story
+
+**As a** patient
+**I want to** {_phrase(rng, 6)}
+**So that** {_phrase(rng, 8)}
+
+## Description
+
+{_phrase(rng, rng.randint(20, 60)).capitalize()}.
+
+## Epic
+
+Epic-{epic_id:03d}: {epic}
+
+## Acceptance Criteria
+
+### Functional
+{_checklist(rng, rng.randint(3, 8))}
+
+### Non-Functional
+{_checklist(rng, rng.randint(1, 4))}
+
+## Tasks
+
+{_checklist(rng, rng.randint(4, 12), f" ({assignee.title()})")}
+
+## Technical Notes
+
+### API Endpoint
+```
+POST /api/v1/{rng.choice(WORDS)}/{rng.choice(WORDS)}
+{{"id": {story_id}, "value": "{_phrase(rng, 2)}"}}
+```
+
+## Dependencies
+
+- {_phrase(rng, 5).capitalize()}
+
+## Definition of Done
+
+{_checklist(rng, rng.randint(3, 7))}
+
+## Story Points
+
+**{rng.choice([1, 2, 3, 5, 8, 13])} points** (Fibonacci scale)
+
+## Assignee
+
+**{assignee.title()}**
+
+## Status
+
+**{rng.choice(STATUSES)}**
+
+## Priority
+
+**{rng.choice(PRIORITIES)}**
+
+## Labels
+
+`{rng.choice(WORDS)}`, `{rng.choice(WORDS)}`, `epic-{epic_id:03d}`
+
+---
+
+**Created**: 2026-01-15
+**Sprint**: Sprint {rng.randint(1, 20)}
+"""
+
+
+def generate_tree(
+    root: Path,
+    epics: int,
+    stories: int,
+    agents: int,
+    seed: int = 0
+) -> Dict[str, int]:
+    """
+    Generate a BMad project tree
+
+    Layout: <root>/manifest.csv, <root>/artifacts/epics/epic-NNN-*.md,
+    <root>/artifacts/stories/story-NNN-*.md. Stories are spread evenly
+    over the epics and assigned round-robin to the agents.
+
+    Args:
+        root: Output directory
+        epics: Number of epics (>= 1)
+        stories: Number of stories
+        agents: Number of agents in the manifest (>= 1)
+        seed: RNG seed (same seed = same tree)
+
+    Returns:
+        Counts and total size in bytes
+    """
+    rng = random.Random(seed)
+    epics = max(1, epics)
+
+    names = write_manifest(root / 'manifest.csv', max(1, agents))
+
+    epics_dir = root / 'artifacts' / 'epics'
+    stories_dir = root / 'artifacts' / 'stories'
+    epics_dir.mkdir(parents=True, exist_ok=True)
+    stories_dir.mkdir(parents=True, exist_ok=True)
+
+    titles = [epic_title(index, rng) for index in range(1, epics + 1)]
+    story_epics = [(story_id, (story_id - 1) % epics + 1) for story_id in range(1, stories + 1)]
+    total_bytes = 0
+
+    for epic_id, title in enumerate(titles, start=1):
+        story_ids = [story_id for story_id, owner in story_epics if owner == epic_id]
+        text = render_epic(epic_id, title, story_ids, rng)
+        (epics_dir / f"epic-{epic_id:03d}-synthetic.md").write_text(text)
+        total_bytes += len(text.encode('utf-8'))
+
+    for story_id, epic_id in story_epics:
+        assignee = names[(story_id - 1) % len(names)]
+        text = render_story(story_id, epic_id, titles[epic_id - 1], assignee, rng)
+        (stories_dir / f"story-{story_id:03d}-synthetic.md").write_text(text)
+        total_bytes += len(text.encode('utf-8'))
+
+    return {
+        'epics': epics,
+        'stories': stories,
+        'agents': len(names),
+        'bytes': total_bytes
+    }
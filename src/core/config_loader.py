@@ -9,7 +9,7 @@ from pathlib import Path
 from dataclasses import dataclass, field
 import logging
 from dotenv import load_dotenv
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,8 @@ class TeamConfig:
     description: str = ""
     permission: str = "write"
     includes_all_repositories: bool = True
-    members: str = "all"
+    members: Union[str, List[str]] = "all"   # 'all', 'none' or agent names
+    prune_members: bool = False              # also remove undesired bmad- members
     units: List[str] = field(default_factory=lambda: [
         "repo.code", "repo.issues", "repo.pulls",
         "repo.releases", "repo.wiki", "repo.projects"
@@ -35,6 +36,7 @@ class RepositoryConfig:
     description: str = ""
     private: bool = True
     auto_init: bool = True
+    enforce_visibility: bool = False   # True = patch 'private' on drift
 
 
 @dataclass
@@ -66,6 +68,30 @@ class ProjectConfig:
     # Warning: fields with default must be at the end
     bmad_artifacts: Optional[Path] = None
     organization_config: Optional[OrganizationConfig] = None
+    # HTTP connection pool (gitea.pool in project YAML)
+    gitea_pool_connections: int = 10
+    gitea_pool_maxsize: int = 10
+    gitea_pool_block: bool = False
+    # Retry policy (gitea.retry in project YAML)
+    gitea_retry: Dict[str, Any] = field(default_factory=dict)
+    # Client-side pacing (gitea.rate_limit / gitea.max_concurrency)
+    gitea_rate_limit: Optional[float] = None
+    gitea_rate_burst: Optional[int] = None
+    gitea_max_concurrency: Optional[int] = None
+    # Conditional GET cache (gitea.cache in project YAML)
+    gitea_cache: Dict[str, Any] = field(default_factory=dict)
+    gitea_cache_file: Optional[Path] = None
+    # Labels to ensure in the repository (gitea.labels in project YAML)
+    gitea_labels: List[Dict[str, Any]] = field(default_factory=list)
+    # Local sync state (incremental artifact sync)
+    state_dir: Optional[Path] = None
+    # Watch mode (bmad.watch / bmad.ignore, sync.interval / sync.debounce /
+    # sync.max_batch_latency in project YAML)
+    bmad_watch: List[str] = field(default_factory=list)
+    bmad_ignore: List[str] = field(default_factory=list)
+    sync_interval: int = 300
+    sync_debounce: float = 2.0
+    sync_max_batch_latency: float = 30.0
 
     def __post_init__(self):
         """Validate after init"""
@@ -149,6 +175,14 @@ class ConfigLoader:
                 repositories=repos
             )
 
+        # HTTP connection pool settings
+        pool_data = config['gitea'].get('pool', {}) or {}
+
+        # Sync state directory (relative paths are under the bridge root)
+        state_dir = Path(config.get('sync', {}).get('state_dir', '.cache'))
+        if not state_dir.is_absolute():
+            state_dir = self.base_dir / state_dir
+
         # Create ProjectConfig object
         project_config = ProjectConfig(
             name=config['project']['name'],
@@ -164,11 +198,26 @@ class ConfigLoader:
             gmail_domain=config['gmail'].get('domain', 'gmail.com'),
             log_level=config.get('logging', {}).get('level', 'INFO'),
             sync_provisioning=config.get('sync', {}).get('provisioning', 'issue'),
-            organization_config=org_config
+            organization_config=org_config,
+            gitea_pool_connections=pool_data.get('connections', 10),
+            gitea_pool_maxsize=pool_data.get('maxsize', 10),
+            gitea_pool_block=pool_data.get('block', False),
+            gitea_retry=config['gitea'].get('retry', {}) or {},
+            gitea_rate_limit=config['gitea'].get('rate_limit'),
+            gitea_rate_burst=config['gitea'].get('rate_burst'),
+            gitea_max_concurrency=config['gitea'].get('max_concurrency'),
+            gitea_cache=config['gitea'].get('cache', {}) or {},
+            gitea_cache_file=state_dir / f"{project_name}.http-cache.json",
+            gitea_labels=config['gitea'].get('labels', []) or [],
+            state_dir=state_dir,
+            bmad_watch=config['bmad'].get('watch', []) or [],
+            bmad_ignore=config['bmad'].get('ignore', []) or [],
+            sync_interval=config.get('sync', {}).get('interval', 300),
+            sync_debounce=config.get('sync', {}).get('debounce', 2.0),
+            sync_max_batch_latency=config.get('sync', {}).get('max_batch_latency', 30.0)
             )
 
 # Convert and validate manifest path
-        from pathlib import Path
         manifest_path = Path(config['bmad']['manifest'])
         if manifest_path.is_absolute():
             project_config.bmad_manifest = manifest_path
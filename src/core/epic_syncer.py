@@ -5,27 +5,89 @@ Authors: Khaled Z. & Claude (Anthropic)
 """
 
 import logging
+import re
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from parsers.epic_parser import EpicParser
-from gitea.milestones import GiteaMilestones
+from parsers.bulk import parse_many, parse_many_by_path
+from gitea.milestones import GiteaMilestones, epic_milestone_title
+from gitea.index import MilestoneIndex
+from core.state_store import SyncStateStore, hash_payload
+from utils.concurrency import KeyedLock, map_bounded
 
 logger = logging.getLogger(__name__)
 
+# "Epic-001", "epic 12", "EPIC_003"
+EPIC_ID_PATTERN = re.compile(r'\bepic[-_\s]?(\d+)', re.IGNORECASE)
+# Leading "Epic:" / "Epic-001:" / "Epic 2 -" of a title or reference
+EPIC_PREFIX_PATTERN = re.compile(r'^\s*epic(?:[-_\s]?\d+)?\s*[:\-]\s*', re.IGNORECASE)
+
+
+def epic_reference_keys(reference) -> List[str]:
+    """
+    Lookup keys for an epic reference, title or file name
+    
+    'Epic-001: Patient Portal', 'epic-001-patient-portal', 'Patient
+    Portal' and 1 all yield keys shared with the matching epic.
+    
+    Args:
+        reference: Story epic reference, epic title or epic file stem
+    
+    Returns:
+        Keys ('id:<n>' and/or 'title:<normalized title>')
+    """
+    text = str(reference or '').strip()
+    keys = []
+    
+    match = EPIC_ID_PATTERN.search(text)
+    if match:
+        keys.append(f"id:{int(match.group(1))}")
+    elif text.isdigit():
+        keys.append(f"id:{int(text)}")
+    
+    title = text
+    while EPIC_PREFIX_PATTERN.match(title):
+        title = EPIC_PREFIX_PATTERN.sub('', title, count=1)
+    title = ' '.join(title.lower().split())
+    
+    if title and not title.isdigit() and not EPIC_ID_PATTERN.fullmatch(title):
+        keys.append(f"title:{title}")
+    
+    return keys
+
 
 class EpicSyncer:
     """Synchronize BMad epics to Gitea milestones"""
     
-    def __init__(self, gitea_client, bmad_artifacts_path: Path):
+    def __init__(
+        self,
+        gitea_client,
+        bmad_artifacts_path: Path,
+        state_store: Optional[SyncStateStore] = None,
+        milestone_index: Optional[MilestoneIndex] = None
+    ):
         """
         Initialize epic syncer
         
         Args:
             gitea_client: GiteaClient instance
             bmad_artifacts_path: Path to BMad artifacts directory
+            state_store: Sync state store for incremental sync (optional)
+            milestone_index: Shared MilestoneIndex (built lazily if omitted)
         """
         self.gitea_client = gitea_client
         self.milestones = GiteaMilestones(gitea_client)
+        self.milestone_index = (
+            milestone_index if milestone_index is not None else MilestoneIndex(gitea_client)
+        )
+        self.state_store = state_store
+        self._title_locks = KeyedLock()
+        self._epic_milestones: Dict[str, int] = {}
+        self._epic_milestones_lock = threading.Lock()
+        # Title reference key -> milestone ID, rebuilt when the index changes
+        self._reference_milestones: Dict[str, int] = {}
+        self._reference_generation: Optional[int] = None
         self.artifacts_path = Path(bmad_artifacts_path)
         self.epics_path = self.artifacts_path / "epics"
         
@@ -42,7 +104,7 @@ class EpicSyncer:
         if not self.epics_path.exists():
             return []
         
-        epic_files = list(self.epics_path.glob("epic-*.md"))
+        epic_files = sorted(self.epics_path.glob("epic-*.md"))
         logger.info(f"Discovered {len(epic_files)} epic files")
         
         return epic_files
@@ -62,6 +124,27 @@ class EpicSyncer:
         
         return epic_data
     
+    def parse_epics(
+        self,
+        epic_files: Optional[List[Path]] = None,
+        workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Parse many epic files at once on a process pool
+        
+        Args:
+            epic_files: Files to parse (default: discover_epics())
+            workers: Worker processes (None = CPU count)
+        
+        Returns:
+            Parsed epic records in file order; unreadable files yield
+            {'file_path', 'error'} records
+        """
+        if epic_files is None:
+            epic_files = self.discover_epics()
+        
+        return parse_many(epic_files, kind='epic', workers=workers)
+    
     def _extract_due_date(self, epic_data: Dict) -> Optional[str]:
         """
         Extract due date from epic data
@@ -75,9 +158,9 @@ class EpicSyncer:
         sections = epic_data.get('sections', {})
         timeline = sections.get('Timeline', '')
         
-        # Look for "Target:" date
+        # Look for "Target:" date (also "- **Target**: 2026-05-15")
         import re
-        match = re.search(r'Target[:\s]+(\d{4}-\d{2}-\d{2})', timeline)
+        match = re.search(r'Target\**[:\s]+\**\s*(\d{4}-\d{2}-\d{2})', timeline)
         
         if match:
             return match.group(1) + 'T23:59:59Z'  # ISO format
@@ -88,41 +171,217 @@ class EpicSyncer:
         """
         Check if milestone already exists
         
+        Looks up the run's milestone index (loaded once).
+        
         Args:
-            title: Milestone title to search for
+            title: Epic title (its milestone title is looked up)
         
         Returns:
             Milestone data if exists, None otherwise
+        
+        Raises:
+            GiteaAPIError: If the milestone index can't be loaded
+        """
+        self.milestone_index.ensure_loaded()
+        
+        return self.milestone_index.get_by_title(epic_milestone_title(title))
+    
+    def remember_milestone(
+        self,
+        epic_file: Path,
+        milestone_id: Optional[int],
+        epic_title: Optional[str] = None
+    ):
+        """
+        Map an epic (file name and title) to its milestone
+        
+        Args:
+            epic_file: Path to epic file
+            milestone_id: Milestone ID
+            epic_title: Epic title, if parsed
         """
-        # TODO: Implement milestone listing in GiteaMilestones
-        # For now, we'll create new milestones each time
+        if milestone_id is None:
+            return
+        
+        keys = epic_reference_keys(Path(epic_file).stem)[:1] + epic_reference_keys(epic_title)
+        
+        with self._epic_milestones_lock:
+            for key in keys:
+                self._epic_milestones.setdefault(key, milestone_id)
+    
+    def milestone_for(self, reference) -> Optional[int]:
+        """
+        Resolve a story's epic reference to a milestone ID
+        
+        Uses the epics synced this run, then the milestone index.
+        
+        Args:
+            reference: Epic reference (e.g., 'Epic-001: Patient Portal')
+        
+        Returns:
+            Milestone ID or None
+        """
+        keys = epic_reference_keys(reference)
+        if not keys:
+            return None
+        
+        with self._epic_milestones_lock:
+            for key in keys:
+                if key in self._epic_milestones:
+                    return self._epic_milestones[key]
+        
+        title_keys = [key for key in keys if key.startswith('title:')]
+        if title_keys:
+            try:
+                self.milestone_index.ensure_loaded()
+            except Exception as e:
+                logger.warning(f"Could not index existing milestones: {e}")
+                return None
+            
+            reference_milestones = self._reference_map()
+            for key in title_keys:
+                if key in reference_milestones:
+                    return reference_milestones[key]
+        
         return None
     
-    def sync_epic(self, epic_file: Path, dry_run: bool = False) -> Dict:
+    def _reference_map(self) -> Dict[str, int]:
+        """
+        Title reference keys of the indexed milestones
+        
+        Built once per index load (or milestone added), so resolving a
+        story's epic is a dict lookup instead of a scan of all milestones.
+        
+        Returns:
+            Dict of 'title:<normalized title>' -> milestone ID
+        """
+        index = self.milestone_index
+        
+        with self._epic_milestones_lock:
+            generation = index.generation
+            if self._reference_generation != generation:
+                reference_milestones = {}
+                for milestone in index.milestones():
+                    for key in epic_reference_keys(milestone.get('title')):
+                        if key.startswith('title:'):
+                            reference_milestones.setdefault(key, milestone.get('id'))
+                self._reference_milestones = reference_milestones
+                self._reference_generation = generation
+            
+            return self._reference_milestones
+    
+    def _record_state(
+        self,
+        epic_file: Path,
+        milestone: Dict,
+        payload_hash: Optional[str] = None,
+        fingerprint: Optional[Tuple[str, float, int]] = None
+    ):
+        """
+        Record a synced epic in the state store (no-op without one)
+        
+        Args:
+            epic_file: Path to epic file
+            milestone: Milestone the epic maps to
+            payload_hash: Hash of the payload pushed, if any
+            fingerprint: (content_hash, mtime, size) captured when the
+                file was parsed
+        """
+        if self.state_store is None:
+            return
+        
+        try:
+            self.state_store.record(
+                epic_file,
+                kind='epic',
+                remote_id=milestone.get('id'),
+                payload_hash=payload_hash,
+                fingerprint=fingerprint
+            )
+        except Exception as e:
+            logger.warning(f"Could not record sync state for {epic_file}: {e}")
+    
+    def sync_epic(
+        self,
+        epic_file: Path,
+        dry_run: bool = False,
+        epic_data: Optional[Dict] = None
+    ) -> Dict:
         """
         Sync single epic to Gitea milestone
         
         Args:
             epic_file: Path to epic file
             dry_run: If True, don't create milestone
+            epic_data: Already parsed epic record (see parse_many)
         
         Returns:
             Sync result with status and milestone data
         """
         # Parse epic
-        epic_data = self.parse_epic(epic_file)
+        if epic_data is None:
+            try:
+                epic_data = self.parse_epic(epic_file)
+            except Exception as e:
+                epic_data = {'file_path': str(epic_file), 'error': str(e)}
+        
+        if 'error' in epic_data:
+            logger.error(f"Failed to parse {epic_file}: {epic_data['error']}")
+            return {
+                'status': 'failed',
+                'epic_file': str(epic_file),
+                'error': epic_data['error']
+            }
         
+        # Serialize check-then-create per title across workers
+        with self._title_locks.hold(epic_data['title']):
+            return self._sync_epic_data(epic_file, epic_data, dry_run)
+    
+    def _sync_epic_data(
+        self,
+        epic_file: Path,
+        epic_data: Dict,
+        dry_run: bool = False
+    ) -> Dict:
+        """
+        Push parsed epic data to Gitea (see sync_epic)
+        
+        Args:
+            epic_file: Path to epic file
+            epic_data: Parsed epic data
+            dry_run: If True, don't create milestone
+        
+        Returns:
+            Sync result with status and milestone data
+        """
         title = epic_data['title']
         description = epic_data['description']
         due_date = self._extract_due_date(epic_data)
         
         logger.info(f"Syncing epic: {title}")
         
-        # Check if already exists
-        existing = self._milestone_exists(title)
+        # Check if already exists (never create blindly)
+        try:
+            existing = self._milestone_exists(title)
+        except Exception as e:
+            logger.error(f"Could not check existing milestones for {title}: {e}")
+            return {
+                'status': 'failed',
+                'epic_file': str(epic_file),
+                'error': f"Could not check existing milestones: {e}"
+            }
+        
+        payload_hash = hash_payload({
+            'title': title,
+            'description': description,
+            'due_date': due_date
+        })
         
         if existing:
             logger.info(f"Milestone already exists for epic: {title}")
+            self.remember_milestone(epic_file, existing.get('id'), title)
+            if not dry_run:
+                self._record_state(epic_file, existing, payload_hash, epic_data.get('fingerprint'))
             return {
                 'status': 'exists',
                 'epic_file': str(epic_file),
@@ -143,11 +402,17 @@ class EpicSyncer:
         try:
             milestone = self.milestones.create_epic_milestone(
                 epic_title=title,
-                epic_description=description
+                epic_description=description,
+                due_date=due_date
             )
             
+            self.milestone_index.add(milestone)
+            self.remember_milestone(epic_file, milestone.get('id'), title)
+            
             logger.info(f"✅ Created milestone for epic: {title}")
             
+            self._record_state(epic_file, milestone, payload_hash, epic_data.get('fingerprint'))
+            
             return {
                 'status': 'created',
                 'epic_file': str(epic_file),
@@ -162,28 +427,124 @@ class EpicSyncer:
                 'error': str(e)
             }
     
-    def sync_all_epics(self, dry_run: bool = False) -> Dict:
+    def _changed_epics(
+        self,
+        epic_files: List[Path],
+        results: Dict,
+        prune: bool = True
+    ) -> List[Path]:
+        """
+        Filter out epics unchanged since their last sync
+        
+        Args:
+            epic_files: Discovered epic files
+            results: Summary dict; skipped epics go to 'unchanged'
+            prune: Forget state of files no longer in epic_files
+        
+        Returns:
+            Epic files that need to be parsed and pushed
+        """
+        if self.state_store is None:
+            return epic_files
+        
+        changed = []
+        
+        for epic_file in epic_files:
+            if self.state_store.is_unchanged(epic_file):
+                state = self.state_store.get(epic_file)
+                if state:
+                    self.remember_milestone(epic_file, state.remote_id)
+                results['unchanged'].append({
+                    'status': 'unchanged',
+                    'epic_file': str(epic_file),
+                    'milestone_id': state.remote_id if state else None
+                })
+            else:
+                changed.append(epic_file)
+        
+        if prune:
+            self.state_store.prune('epic', epic_files)
+        
+        return changed
+    
+    def sync_all_epics(
+        self,
+        dry_run: bool = False,
+        force: bool = False,
+        workers: int = 1,
+        parse_workers: Optional[int] = 1,
+        epic_files: Optional[List[Path]] = None
+    ) -> Dict:
         """
         Sync all epics to Gitea milestones
         
         Args:
             dry_run: If True, don't create milestones
+            force: If True, ignore the state store and re-sync every epic
+            workers: Number of epics parsed and pushed concurrently
+                (results keep epic file order)
+            parse_workers: Processes used to parse epics up front
+            epic_files: Only sync these files (default: discover_epics())
         
         Returns:
             Summary with results for all epics
         """
-        epic_files = self.discover_epics()
+        # A subset (watch mode) must not prune the state of other files
+        partial = epic_files is not None
+        if partial:
+            epic_files = [Path(path) for path in epic_files if Path(path).exists()]
+        else:
+            epic_files = self.discover_epics()
         
         results = {
             'created': [],
             'exists': [],
+            'unchanged': [],
             'failed': [],
             'dry_run': []
         }
         
-        for epic_file in epic_files:
-            result = self.sync_epic(epic_file, dry_run=dry_run)
-            
+        if not force:
+            # A dry run leaves the state store untouched
+            epic_files = self._changed_epics(epic_files, results, prune=not (partial or dry_run))
+        
+        # One milestone listing for the whole run (kept across watch batches).
+        # Without it every epic would look new: abort instead.
+        if epic_files:
+            try:
+                if partial:
+                    self.milestone_index.ensure_loaded()
+                else:
+                    self.milestone_index.load()
+            except Exception as e:
+                logger.error(f"❌ Could not index existing milestones, skipping epic sync: {e}")
+                results['failed'].extend(
+                    {
+                        'status': 'failed',
+                        'epic_file': str(epic_file),
+                        'error': f"Could not index existing milestones: {e}"
+                    }
+                    for epic_file in epic_files
+                )
+                return results
+        
+        # Parse everything first (on a process pool unless parse_workers
+        # is 1); unreadable files come back as per-epic 'error' records
+        parsed = {}
+        if epic_files:
+            parsed = parse_many_by_path(epic_files, kind='epic', workers=parse_workers)
+        
+        epic_results = map_bounded(
+            lambda epic_file: self.sync_epic(
+                epic_file,
+                dry_run=dry_run,
+                epic_data=parsed.get(str(epic_file))
+            ),
+            epic_files,
+            workers=workers
+        )
+        
+        for result in epic_results:
             status = result['status']
             results[status].append(result)
         
@@ -192,6 +553,7 @@ class EpicSyncer:
             f"Epic sync complete: "
             f"{len(results['created'])} created, "
             f"{len(results['exists'])} existing, "
+            f"{len(results['unchanged'])} unchanged, "
             f"{len(results['failed'])} failed"
         )
         
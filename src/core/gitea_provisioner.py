@@ -4,11 +4,64 @@ Authors: Khaled Z. & Claude (Anthropic)
 """
 
 import logging
-from typing import Dict, List
-from dataclasses import dataclass
+import threading
+from typing import Dict, List, Optional, Set
+from dataclasses import dataclass, field
+from gitea.client import GiteaAPIError
+from utils.concurrency import map_bounded
 
 logger = logging.getLogger(__name__)
 
+# Title of provisioning issues; the username follows the colon
+PROVISION_ISSUE_PREFIX = "🤖 Provision user:"
+
+# sync.provisioning values accepted as aliases
+MODE_ALIASES = {'issue': 'manual'}
+
+
+def provisioning_username(title: str) -> Optional[str]:
+    """
+    Extract the username from a provisioning issue title
+    
+    Args:
+        title: Issue title
+    
+    Returns:
+        Username, or None if the issue is not a provisioning issue
+    """
+    if not title.startswith(PROVISION_ISSUE_PREFIX):
+        return None
+    return title[len(PROVISION_ISSUE_PREFIX):].strip() or None
+
+
+@dataclass
+class ProvisioningSnapshot:
+    """
+    Existing users and open provisioning issues, fetched once per run
+    
+    Gitea usernames are case-insensitive, so lookups are lowercased.
+    `usernames` is None when the user directory could not be listed
+    (non-admin token); existence is then checked per agent.
+    """
+    usernames: Optional[Set[str]] = None
+    issues: Dict[str, Dict] = field(default_factory=dict)
+    assignee: Optional[str] = None
+    
+    def user_exists(self, username: str) -> Optional[bool]:
+        """True/False, or None if unknown"""
+        if self.usernames is None:
+            return None
+        return username.lower() in self.usernames
+    
+    def add_user(self, username: str):
+        """Record a user created during this run"""
+        if self.usernames is not None:
+            self.usernames.add(username.lower())
+    
+    def issue_for(self, username: str) -> Optional[Dict]:
+        """Open provisioning issue for a username"""
+        return self.issues.get(username.lower())
+
 
 class GiteaProvisioner:
     """
@@ -27,58 +80,101 @@ class GiteaProvisioner:
             gitea_client: GiteaClient instance
             mode: 'manual' or 'auto'
         """
+        mode = MODE_ALIASES.get(mode, mode)
+        
         self.gitea_client = gitea_client
         self.mode = mode
+        # Snapshot shared by provision_agent() calls made without one
+        self._snapshot: Optional[ProvisioningSnapshot] = None
+        self._snapshot_lock = threading.Lock()
         
         if mode not in ['manual', 'auto']:
             raise ValueError(f"Invalid mode: {mode}. Must be 'auto' or 'manual'")
         
         logger.info(f"Initialized Gitea provisioner in '{mode}' mode")
     
-    def _issue_exists_for_agent(self, username: str) -> bool:
+    @staticmethod
+    def username_for(agent) -> str:
         """
-        Check if a provisioning issue already exists for this agent
+        Gitea username of an agent
         
         Args:
-            username: Gitea username (e.g., 'bmad-pm')
+            agent: Agent object
+        
+        Returns:
+            Username (e.g., 'bmad-pm')
+        """
+        return f"bmad-{agent.name}"
+    
+    def snapshot(self) -> ProvisioningSnapshot:
+        """
+        Fetch existing users and open provisioning issues in one pass
         
         Returns:
-            True if issue exists, False otherwise
+            ProvisioningSnapshot shared by all agents of the run
         """
+        snapshot = ProvisioningSnapshot()
+        
         try:
-            # Get all open issues in the repository
-            issues = self.gitea_client.list_issues(state='open')
-            
-            # Check if any issue title contains this agent
-            for issue in issues:
-                title = issue.get('title', '')
-                # Check if username is in the title
-                if username in title or username.replace('bmad-', '') in title:
-                    logger.info(f"📋 Issue already exists for {username}: #{issue['number']}")
-                    return True
-            
-            return False
+            snapshot.usernames = {
+                user['login'].lower()
+                for user in self.gitea_client.iter_users(prefetch=True)
+            }
+            logger.info(f"👥 Loaded {len(snapshot.usernames)} existing users")
+        except GiteaAPIError as e:
+            logger.warning(f"Could not list users, checking agents one by one: {e}")
+        
+        if self.mode == 'manual':
+            try:
+                for issue in self.gitea_client.iter_issues(state='open', prefetch=True):
+                    username = provisioning_username(issue.get('title', ''))
+                    if username:
+                        snapshot.issues.setdefault(username.lower(), issue)
+            except Exception as e:
+                logger.warning(f"Could not check existing issues: {e}")
             
-        except Exception as e:
-            logger.warning(f"Could not check existing issues: {e}")
-            return False  # En cas d'erreur, on assume qu'il n'existe pas
+            # Provisioning issues are assigned to the token owner
+            try:
+                snapshot.assignee = self.gitea_client.get_current_user().get('login')
+            except Exception as e:
+                logger.warning(f"Could not get current user, resolving assignee per issue: {e}")
+        
+        return snapshot
     
-    def _create_provisioning_issue(self, agent, username: str) -> Dict:
+    def shared_snapshot(self) -> ProvisioningSnapshot:
+        """
+        Snapshot fetched on first use and reused by later calls
+        
+        Returns:
+            ProvisioningSnapshot kept for the provisioner's lifetime
+        """
+        with self._snapshot_lock:
+            if self._snapshot is None:
+                self._snapshot = self.snapshot()
+            return self._snapshot
+    
+    def _create_provisioning_issue(
+        self,
+        agent,
+        username: str,
+        assignee: Optional[str] = None
+    ) -> Dict:
         """
         Create a Gitea issue for manual user provisioning
         
         Args:
             agent: Agent object
             username: Suggested Gitea username
+            assignee: Issue assignee (default: current user)
         
         Returns:
             Created issue data
         """
-        # Get current user for assignment
-        current_user = self.gitea_client.get_current_user()
+        if assignee is None:
+            assignee = self.gitea_client.get_current_user().get('login')
         
         # Issue title
-        title = f"🤖 Provision user: {username}"
+        title = f"{PROVISION_ISSUE_PREFIX} {username}"
         # Issue body with instructions
         body = f"""## Agent Information
 
@@ -124,7 +220,7 @@ class GiteaProvisioner:
         issue = self.gitea_client.create_issue(
             title=title,
             body=body,
-            assignee=current_user.get('login')
+            assignee=assignee
         )
         
         logger.info(f"📋 Created provisioning issue #{issue['number']} for {username}")
@@ -161,23 +257,34 @@ class GiteaProvisioner:
         
         return user
     
-    def provision_agent(self, agent) -> Dict:
+    def provision_agent(
+        self,
+        agent,
+        snapshot: Optional[ProvisioningSnapshot] = None
+    ) -> Dict:
         """
         Provision a single agent in Gitea
         
         Args:
             agent: Agent object with name, email, etc.
+            snapshot: Users/issues fetched up front (default: one snapshot
+                fetched on the first call and shared by later ones)
         
         Returns:
             Dict with provisioning status
         """
+        if snapshot is None:
+            snapshot = self.shared_snapshot()
+        
         # Generate Gitea username (e.g., 'bmad-pm')
-        username = f"bmad-{agent.name}"
+        username = self.username_for(agent)
         
         logger.info(f"Provisioning agent: {agent.name} → {username}")
         
         # Check if user exists
-        user_exists = self.gitea_client.user_exists(username)
+        user_exists = snapshot.user_exists(username)
+        if user_exists is None:
+            user_exists = self.gitea_client.user_exists(username)
         
         if user_exists:
             logger.info(f"✅ User {username} already exists")
@@ -190,17 +297,20 @@ class GiteaProvisioner:
         # User doesn't exist - check if issue already exists (manual mode)
         if self.mode == 'manual':
             # Check if issue already created
-            if self._issue_exists_for_agent(username):
-                logger.info(f"⏭️  Issue already exists for {username}, skipping")
+            issue = snapshot.issue_for(username)
+            if issue:
+                logger.info(f"⏭️  Issue #{issue['number']} already exists for {username}, skipping")
                 return {
                     'status': 'pending',
                     'username': username,
                     'email': agent.email,
-                    'issue_exists': True
+                    'issue_exists': True,
+                    'issue_number': issue['number']
                 }
             
             # Create provisioning issue
-            issue = self._create_provisioning_issue(agent, username)
+            issue = self._create_provisioning_issue(agent, username, snapshot.assignee)
+            snapshot.issues[username.lower()] = issue
             
             return {
                 'status': 'pending',
@@ -212,6 +322,7 @@ class GiteaProvisioner:
         # Auto mode - create user directly
         elif self.mode == 'auto':
             user = self._create_user_auto(agent, username)
+            snapshot.add_user(username)
             
             return {
                 'status': 'created',
@@ -220,12 +331,16 @@ class GiteaProvisioner:
                 'user_id': user.get('id')
             }
     
-    def provision_all_agents(self, agents: List) -> Dict:
+    def provision_all_agents(self, agents: List, workers: int = 1) -> Dict:
         """
         Provision all agents
         
+        Existing users and open provisioning issues are fetched once;
+        missing users (or their issues) are then created concurrently.
+        
         Args:
             agents: List of Agent objects
+            workers: Max concurrent creations
         
         Returns:
             Dict with results summary
@@ -237,32 +352,41 @@ class GiteaProvisioner:
             'failed': []
         }
         
-        for agent in agents:
+        snapshot = self.snapshot()
+        
+        # One provisioning per username, even if several manifests list the agent
+        unique_agents = list({self.username_for(agent): agent for agent in agents}.values())
+        
+        def provision(agent) -> Dict:
             try:
-                result = self.provision_agent(agent)
-                
-                status = result['status']
-                
-                if status == 'created':
-                    results['created'].append(result)
-                elif status == 'exists':
-                    results['exists'].append(result)
-                elif status == 'pending':
-                    results['pending'].append(result)
-                
+                result = self.provision_agent(agent, snapshot)
             except Exception as e:
                 logger.error(f"Failed to provision agent {agent.name}: {e}")
-                results['failed'].append({
+                return {
+                    'status': 'failed',
                     'agent': agent.name,
                     'error': str(e)
-                })
+                }
+            
+            if result is None:
+                logger.error(f"Failed to provision agent {agent.name}: unknown mode '{self.mode}'")
+                return {
+                    'status': 'failed',
+                    'agent': agent.name,
+                    'error': f"Unknown provisioning mode: {self.mode}"
+                }
+            return result
+        
+        for result in map_bounded(provision, unique_agents, workers):
+            results[result['status']].append(result)
         
         # Log summary
         logger.info(
             f"Provisioning complete: "
             f"{len(results['created'])} created, "
             f"{len(results['exists'])} existing, "
-            f"{len(results['pending'])} pending"
+            f"{len(results['pending'])} pending, "
+            f"{len(results['failed'])} failed"
         )
         
-        return results
\ No newline at end of file
+        return results
@@ -0,0 +1,362 @@
+"""
+Organization Reconciler - Desired-state org/team/repo provisioning
+
+Compares an OrganizationConfig with one bulk snapshot of the Gitea
+organization and only creates or edits what drifted.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from gitea.organizations import GiteaOrganizations, OrganizationSnapshot
+from core.config_loader import OrganizationConfig, RepositoryConfig, TeamConfig
+
+logger = logging.getLogger(__name__)
+
+
+def team_member_usernames(team_config: TeamConfig, agents: List) -> Optional[List[str]]:
+    """
+    Desired Gitea usernames of a team
+
+    Args:
+        team_config: TeamConfig (members: 'all', 'none' or a list of
+            agent names / usernames)
+        agents: Discovered agents
+
+    Returns:
+        Usernames, or None if membership is not managed
+    """
+    members = team_config.members
+
+    if members == "all":
+        return [f"bmad-{agent.name}" for agent in agents]
+
+    if isinstance(members, list):
+        return [name if name.startswith("bmad-") else f"bmad-{name}" for name in members]
+
+    if members in ("none", "", None):
+        return []
+
+    logger.warning(f"Unknown members setting for team {team_config.name}: {members!r}")
+    return None
+
+
+def team_drift(team: Dict[str, Any], team_config: TeamConfig) -> Dict[str, Any]:
+    """
+    Team settings that differ from the config
+
+    Args:
+        team: Team data from Gitea
+        team_config: Desired team
+
+    Returns:
+        Fields to patch (empty if in sync)
+    """
+    changes = {}
+
+    if (team.get('description') or '') != team_config.description:
+        changes['description'] = team_config.description
+
+    # Gitea reports the owners team as 'owner'; leave it alone
+    if team.get('permission') not in (team_config.permission, 'owner'):
+        changes['permission'] = team_config.permission
+
+    if team.get('includes_all_repositories') != team_config.includes_all_repositories:
+        changes['includes_all_repositories'] = team_config.includes_all_repositories
+
+    # Older Gitea versions don't report units
+    if team.get('units') is not None and sorted(team['units']) != sorted(team_config.units):
+        changes['units'] = team_config.units
+
+    return changes
+
+
+def repo_drift(repo: Dict[str, Any], repo_config: RepositoryConfig) -> Dict[str, Any]:
+    """
+    Repository settings that differ from the config
+
+    auto_init only applies at creation and is not compared. Visibility
+    is only patched when the repository sets enforce_visibility;
+    otherwise it is reported by visibility_drift().
+
+    Args:
+        repo: Repository data from Gitea
+        repo_config: Desired repository
+
+    Returns:
+        Fields to patch (empty if in sync)
+    """
+    changes = {}
+
+    if (repo.get('description') or '') != repo_config.description:
+        changes['description'] = repo_config.description
+
+    if repo_config.enforce_visibility and repo.get('private') != repo_config.private:
+        changes['private'] = repo_config.private
+
+    return changes
+
+
+def visibility_drift(repo: Optional[Dict[str, Any]], repo_config: RepositoryConfig) -> Optional[Dict[str, Any]]:
+    """
+    Visibility mismatch left alone (enforce_visibility off)
+
+    Making a repository public (or private) is not something to do
+    behind the user's back, so it is only reported.
+
+    Args:
+        repo: Repository data from Gitea (None = missing)
+        repo_config: Desired repository
+
+    Returns:
+        {'kind', 'name', 'field', 'current', 'desired'} or None
+    """
+    if repo is None or repo_config.enforce_visibility or repo.get('private') == repo_config.private:
+        return None
+
+    return {
+        'kind': 'repository',
+        'name': repo_config.name,
+        'field': 'private',
+        'current': repo.get('private'),
+        'desired': repo_config.private
+    }
+
+
+class OrganizationReconciler:
+    """
+    Make a Gitea organization match an OrganizationConfig
+
+    One snapshot (organization, teams, repositories) is fetched up front
+    and cached by the GiteaOrganizations manager, so later phases of the
+    same run can reuse it through `snapshot`.
+    """
+
+    def __init__(self, org_manager: GiteaOrganizations, org_config: OrganizationConfig):
+        """
+        Initialize reconciler
+
+        Args:
+            org_manager: GiteaOrganizations instance (owns the snapshot cache)
+            org_config: Desired organization
+        """
+        self.org_manager = org_manager
+        self.org_config = org_config
+
+    @property
+    def snapshot(self) -> OrganizationSnapshot:
+        """Cached organization snapshot (fetched on first use)"""
+        return self.org_manager.snapshot(self.org_config.name)
+
+    def reconcile(
+        self,
+        agents: Optional[List] = None,
+        workers: int = 1,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Create or edit the organization, its teams and repositories
+
+        Args:
+            agents: Discovered agents (team members); None = skip members
+            workers: Max concurrent team membership changes
+            dry_run: Compute the drift without changing anything
+
+        Returns:
+            Dict with created/updated/exists/failed entries
+            ({'kind', 'name', 'changes'}), drift left unpatched
+            (see visibility_drift), per-team member results and elapsed
+            seconds
+        """
+        started = time.monotonic()
+        org_config = self.org_config
+        results = {
+            'created': [],
+            'updated': [],
+            'exists': [],
+            'failed': [],
+            'drift': [],
+            'members': {},
+            'dry_run': dry_run
+        }
+
+        snapshot = self.snapshot
+
+        if not self._reconcile_organization(snapshot, results, dry_run):
+            results['elapsed'] = time.monotonic() - started
+            return results
+
+        for team_config in org_config.teams:
+            team = self._reconcile_item(
+                'team',
+                team_config.name,
+                snapshot.teams.get(team_config.name),
+                lambda: self.org_manager.create_team(
+                    org_config.name,
+                    team_config.name,
+                    team_config.description,
+                    team_config.permission,
+                    team_config.includes_all_repositories,
+                    team_config.units
+                ),
+                lambda team: team_drift(team, team_config),
+                lambda team, changes: self.org_manager.edit_team(org_config.name, team, **changes),
+                results,
+                dry_run
+            )
+
+            usernames = team_member_usernames(team_config, agents) if agents is not None else None
+            if team and usernames is not None and not dry_run:
+                try:
+                    results['members'][team_config.name] = self.org_manager.reconcile_team_members(
+                        team['id'], usernames, workers=workers, prune=team_config.prune_members
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to reconcile members of team {team_config.name}: {e}")
+                    results['failed'].append({
+                        'kind': 'team',
+                        'name': team_config.name,
+                        'error': f"members: {e}"
+                    })
+
+        for repo_config in org_config.repositories:
+            repo = snapshot.repository(repo_config.name)
+
+            drift = visibility_drift(repo, repo_config)
+            if drift:
+                logger.warning(
+                    f"Repository {repo_config.name} is "
+                    f"{'private' if drift['current'] else 'public'} but configured "
+                    f"{'private' if drift['desired'] else 'public'}; "
+                    f"set enforce_visibility to change it"
+                )
+                results['drift'].append(drift)
+
+            self._reconcile_item(
+                'repository',
+                repo_config.name,
+                repo,
+                lambda: self.org_manager.create_repo_in_org(
+                    org_config.name,
+                    repo_config.name,
+                    repo_config.description,
+                    repo_config.private,
+                    repo_config.auto_init
+                ),
+                lambda repo: repo_drift(repo, repo_config),
+                lambda repo, changes: self.org_manager.edit_repo(
+                    org_config.name, repo_config.name, **changes
+                ),
+                results,
+                dry_run
+            )
+
+        results['elapsed'] = time.monotonic() - started
+
+        logger.info(
+            f"Organization {org_config.name} reconciled: "
+            f"{len(results['created'])} created, "
+            f"{len(results['updated'])} updated, "
+            f"{len(results['exists'])} unchanged, "
+            f"{len(results['failed'])} failed "
+            f"({results['elapsed']:.2f}s)"
+        )
+
+        return results
+
+    def _reconcile_organization(
+        self,
+        snapshot: OrganizationSnapshot,
+        results: Dict[str, Any],
+        dry_run: bool
+    ) -> bool:
+        """
+        Create or edit the organization itself
+
+        Returns:
+            True if teams and repositories can be reconciled
+        """
+        org_config = self.org_config
+
+        if not snapshot.exists and not org_config.create_if_missing:
+            logger.warning(f"Organization {org_config.name} missing and create_if_missing is off")
+            results['failed'].append({
+                'kind': 'organization',
+                'name': org_config.name,
+                'error': 'organization does not exist'
+            })
+            return False
+
+        organization = self._reconcile_item(
+            'organization',
+            org_config.name,
+            snapshot.organization,
+            lambda: self.org_manager.create_organization(org_config.name, org_config.description),
+            lambda org: (
+                {'description': org_config.description}
+                if (org.get('description') or '') != org_config.description
+                else {}
+            ),
+            lambda org, changes: self.org_manager.edit_organization(org_config.name, **changes),
+            results,
+            dry_run
+        )
+
+        # In dry-run a missing organization is reported with all its
+        # teams and repositories as to-be-created
+        return organization is not None or dry_run
+
+    def _reconcile_item(
+        self,
+        kind: str,
+        name: str,
+        current: Optional[Dict[str, Any]],
+        create,
+        drift,
+        edit,
+        results: Dict[str, Any],
+        dry_run: bool
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Create a missing object or patch its drifted fields
+
+        Args:
+            kind: 'organization', 'team' or 'repository'
+            name: Object name
+            current: Object data from the snapshot (None = missing)
+            create: Callable creating the object
+            drift: Callable(current) returning the fields to patch
+            edit: Callable(current, changes) patching the object
+            results: Results dict to append to
+            dry_run: Record the action without calling the API
+
+        Returns:
+            Object data (None if missing in dry-run or on failure)
+        """
+        entry = {'kind': kind, 'name': name}
+
+        try:
+            if current is None:
+                if not dry_run:
+                    current = create()
+                results['created'].append(entry)
+                return current
+
+            changes = drift(current)
+            if not changes:
+                results['exists'].append(entry)
+                return current
+
+            entry['changes'] = changes
+            if not dry_run:
+                current = edit(current, changes)
+            results['updated'].append(entry)
+            return current
+
+        except Exception as e:
+            logger.error(f"Failed to reconcile {kind} {name}: {e}")
+            results['failed'].append({**entry, 'error': str(e)})
+            return None
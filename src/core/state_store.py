@@ -0,0 +1,259 @@
+"""
+Sync State Store - Persistent per-artifact sync state
+
+Records, for every synced artifact file, its content hash and mtime,
+the Gitea object it maps to, and the hash of the payload last pushed,
+so unchanged artifacts can be skipped without API calls.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    remote_id INTEGER,
+    payload_hash TEXT,
+    synced_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class ArtifactState:
+    """Stored sync state of one artifact file"""
+    path: str
+    kind: str
+    content_hash: str
+    mtime: float
+    size: int
+    remote_id: Optional[int] = None
+    payload_hash: Optional[str] = None
+    synced_at: float = 0.0
+
+
+def hash_file(file_path: Path) -> str:
+    """
+    Compute SHA-256 of a file's content
+
+    Args:
+        file_path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_payload(payload: Dict[str, Any]) -> str:
+    """
+    Compute a stable hash of the payload pushed to Gitea
+
+    Args:
+        payload: JSON-serializable payload
+
+    Returns:
+        Hex digest
+    """
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class SyncStateStore:
+    """SQLite-backed store of artifact sync state"""
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the state database
+
+        Args:
+            db_path: SQLite file path (e.g., .cache/medical.state.db)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+
+        logger.info(f"Opened sync state store: {self.db_path}")
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        return str(Path(file_path).resolve())
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, file_path: Path) -> Optional[ArtifactState]:
+        """
+        Get stored state of an artifact
+
+        Args:
+            file_path: Artifact file path
+
+        Returns:
+            ArtifactState or None if never synced
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, kind, content_hash, mtime, size, remote_id, "
+                "payload_hash, synced_at FROM artifacts WHERE path = ?",
+                (self._key(file_path),)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return ArtifactState(*row)
+
+    def fingerprint(self, file_path: Path) -> Tuple[str, float, int]:
+        """
+        Get (content_hash, mtime, size) of a file
+
+        Args:
+            file_path: Artifact file path
+
+        Returns:
+            Tuple of content hash, mtime and size
+        """
+        stat = Path(file_path).stat()
+        return hash_file(file_path), stat.st_mtime, stat.st_size
+
+    def is_unchanged(self, file_path: Path, payload_hash: Optional[str] = None) -> bool:
+        """
+        Check whether an artifact is unchanged since its last sync
+
+        Matching mtime and size short-circuit without reading the file;
+        otherwise the content hash decides (a touched but identical file
+        is still unchanged, and its new mtime is recorded).
+
+        Args:
+            file_path: Artifact file path
+            payload_hash: Hash of the payload the artifact maps to now; if
+                given, it must match the one last pushed (the payload can
+                also depend on inputs outside the file)
+
+        Returns:
+            True if previously synced, content is identical and (when
+            checked) the payload is the same
+        """
+        state = self.get(file_path)
+        if state is None or state.remote_id is None:
+            return False
+
+        if payload_hash is not None and state.payload_hash != payload_hash:
+            return False
+
+        try:
+            stat = Path(file_path).stat()
+        except OSError:
+            return False
+
+        if stat.st_mtime == state.mtime and stat.st_size == state.size:
+            return True
+
+        if hash_file(file_path) != state.content_hash:
+            return False
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE artifacts SET mtime = ?, size = ? WHERE path = ?",
+                (stat.st_mtime, stat.st_size, state.path)
+            )
+            self._conn.commit()
+
+        return True
+
+    def record(
+        self,
+        file_path: Path,
+        kind: str,
+        remote_id: Optional[int],
+        payload_hash: Optional[str] = None,
+        fingerprint: Optional[Tuple[str, float, int]] = None
+    ):
+        """
+        Record a successful sync of an artifact
+
+        Pass the fingerprint captured when the file was parsed: taking it
+        now would mark edits made during the sync as already pushed.
+
+        Args:
+            file_path: Artifact file path
+            kind: Artifact kind ('epic' or 'story')
+            remote_id: Gitea object it maps to (milestone id / issue number)
+            payload_hash: Hash of the payload pushed (see hash_payload)
+            fingerprint: (content_hash, mtime, size) of the synced content
+                (default: the file as it is now)
+        """
+        if fingerprint is None:
+            fingerprint = self.fingerprint(file_path)
+        content_hash, mtime, size = fingerprint
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artifacts "
+                "(path, kind, content_hash, mtime, size, remote_id, payload_hash, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._key(file_path), kind, content_hash, mtime, size,
+                 remote_id, payload_hash, time.time())
+            )
+            self._conn.commit()
+
+    def forget(self, file_path: Path):
+        """
+        Drop stored state of an artifact (forces a re-sync)
+
+        Args:
+            file_path: Artifact file path
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM artifacts WHERE path = ?", (self._key(file_path),)
+            )
+            self._conn.commit()
+
+    def prune(self, kind: str, existing_files: Iterable[Path]) -> int:
+        """
+        Remove entries of a kind whose files no longer exist
+
+        Args:
+            kind: Artifact kind ('epic' or 'story')
+            existing_files: Files currently on disk
+
+        Returns:
+            Number of removed entries
+        """
+        keep = {self._key(f) for f in existing_files}
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM artifacts WHERE kind = ?", (kind,)
+            ).fetchall()
+            stale = [(path,) for (path,) in rows if path not in keep]
+            self._conn.executemany("DELETE FROM artifacts WHERE path = ?", stale)
+            self._conn.commit()
+
+        return len(stale)
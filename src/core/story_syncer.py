@@ -7,9 +7,14 @@ Authors: Khaled Z. & Claude (Anthropic)
 import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from parsers.story_parser import StoryParser
-from gitea.issues import GiteaIssues
+from parsers.bulk import parse_many, parse_many_by_path
+from gitea.issues import STORY_LABELS, GiteaIssues, issue_changes
+from gitea.index import IssueIndex
+from gitea.labels import LabelRegistry
+from core.state_store import SyncStateStore, hash_payload
+from utils.concurrency import map_bounded
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +22,16 @@ logger = logging.getLogger(__name__)
 class StorySyncer:
     """Synchronize BMad stories to Gitea issues"""
     
-    def __init__(self, gitea_client, bmad_artifacts_path: Path, agents: List):
+    def __init__(
+        self,
+        gitea_client,
+        bmad_artifacts_path: Path,
+        agents: List,
+        issue_index: Optional[IssueIndex] = None,
+        state_store: Optional[SyncStateStore] = None,
+        label_registry: Optional[LabelRegistry] = None,
+        epic_syncer=None
+    ):
         """
         Initialize story syncer
         
@@ -25,9 +39,20 @@ class StorySyncer:
             gitea_client: GiteaClient instance
             bmad_artifacts_path: Path to BMad artifacts directory
             agents: List of Agent objects (for assignee mapping)
+            issue_index: Shared IssueIndex (built lazily if omitted)
+            state_store: Sync state store for incremental sync (optional)
+            label_registry: Shared LabelRegistry (built lazily if omitted)
+            epic_syncer: EpicSyncer run first; its epic -> milestone map
+                sets the milestone of story issues (optional)
         """
         self.gitea_client = gitea_client
-        self.issues = GiteaIssues(gitea_client)
+        self.label_registry = (
+            label_registry if label_registry is not None else LabelRegistry(gitea_client)
+        )
+        self.issues = GiteaIssues(gitea_client, labels=self.label_registry)
+        self.issue_index = issue_index if issue_index is not None else IssueIndex(gitea_client)
+        self.state_store = state_store
+        self.epic_syncer = epic_syncer
         self.artifacts_path = Path(bmad_artifacts_path)
         self.stories_path = self.artifacts_path / "stories"
         self.agents = {agent.name: agent for agent in agents}
@@ -45,7 +70,7 @@ class StorySyncer:
         if not self.stories_path.exists():
             return []
         
-        story_files = list(self.stories_path.glob("story-*.md"))
+        story_files = sorted(self.stories_path.glob("story-*.md"))
         logger.info(f"Discovered {len(story_files)} story files")
         
         return story_files
@@ -65,6 +90,27 @@ class StorySyncer:
         
         return story_data
     
+    def parse_stories(
+        self,
+        story_files: Optional[List[Path]] = None,
+        workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Parse many story files at once on a process pool
+        
+        Args:
+            story_files: Files to parse (default: discover_stories())
+            workers: Worker processes (None = CPU count)
+        
+        Returns:
+            Parsed story records in file order; unreadable files yield
+            {'file_path', 'error'} records
+        """
+        if story_files is None:
+            story_files = self.discover_stories()
+        
+        return parse_many(story_files, kind='story', workers=workers)
+    
     def _extract_assignee(self, story_data: Dict) -> Optional[str]:
         """
         Extract assignee from story data
@@ -188,62 +234,154 @@ class StorySyncer:
         
         return "\n\n".join(body_parts)
     
-    def _issue_exists(self, story_title: str) -> Optional[Dict]:
+    def _issue_exists(
+        self,
+        story_title: str,
+        story_id: Optional[str] = None
+    ) -> Optional[Dict]:
         """
         Check if issue already exists for this story
         
+        Looks up the run's issue index (loaded once) by title, then by
+        story ID so a renamed story still maps to its issue. The ID
+        fallback only matches issues titled "Story-<id>: ...", as created
+        by this syncer.
+        
         Args:
             story_title: Story title to search for
+            story_id: Story ID from the filename (e.g., '001')
         
         Returns:
             Issue data if exists, None otherwise
+        
+        Raises:
+            GiteaAPIError: If the issue index can't be loaded
         """
-        try:
-            issues = self.gitea_client.list_issues(state='all')
-            
-            for issue in issues:
-                if issue['title'] == story_title:
-                    return issue
-            
-            return None
+        self.issue_index.ensure_loaded()
+        
+        existing = self.issue_index.get_by_title(story_title)
+        
+        if existing is None and story_id and story_id.isdigit():
+            existing = self.issue_index.get_by_story_id(story_id)
+        
+        return existing
+    
+    def _record_state(
+        self,
+        story_file: Path,
+        issue: Dict,
+        payload_hash: Optional[str] = None,
+        fingerprint: Optional[Tuple[str, float, int]] = None
+    ):
+        """
+        Record a synced story in the state store (no-op without one)
         
+        Args:
+            story_file: Path to story file
+            issue: Issue the story maps to
+            payload_hash: Hash of the payload pushed, if any
+            fingerprint: (content_hash, mtime, size) captured when the
+                file was parsed
+        """
+        if self.state_store is None:
+            return
+        
+        try:
+            self.state_store.record(
+                story_file,
+                kind='story',
+                remote_id=issue.get('number'),
+                payload_hash=payload_hash,
+                fingerprint=fingerprint
+            )
         except Exception as e:
-            logger.warning(f"Could not check existing issues: {e}")
-            return None
+            logger.warning(f"Could not record sync state for {story_file}: {e}")
     
-    def sync_story(self, story_file: Path, dry_run: bool = False) -> Dict:
+    def sync_story(
+        self,
+        story_file: Path,
+        dry_run: bool = False,
+        story_data: Optional[Dict] = None
+    ) -> Dict:
         """
         Sync single story to Gitea issue
         
         Args:
             story_file: Path to story file
             dry_run: If True, don't create issue
+            story_data: Already parsed story record (see parse_many)
         
         Returns:
             Sync result with status and issue data
         """
         # Parse story
-        story_data = self.parse_story(story_file)
+        if story_data is None:
+            try:
+                story_data = self.parse_story(story_file)
+            except Exception as e:
+                story_data = {'file_path': str(story_file), 'error': str(e)}
+        
+        if 'error' in story_data:
+            logger.error(f"Failed to parse {story_file}: {story_data['error']}")
+            return {
+                'status': 'failed',
+                'story_file': str(story_file),
+                'error': story_data['error']
+            }
         
-        title = story_data['title']
-        body = self._build_issue_body(story_data)
-        assignee = self._extract_assignee(story_data)
-        status = self._extract_status(story_data)
-        labels = self._extract_labels(story_data)
+        # Serialize check-then-create per title across workers
+        with self.issue_index.claim(story_data['title']):
+            return self._sync_story_data(story_file, story_data, dry_run)
+    
+    def _sync_story_data(
+        self,
+        story_file: Path,
+        story_data: Dict,
+        dry_run: bool = False
+    ) -> Dict:
+        """
+        Push parsed story data to Gitea (see sync_story)
         
-        logger.info(f"Syncing story: {title}")
+        Args:
+            story_file: Path to story file
+            story_data: Parsed story data
+            dry_run: If True, don't create issue
         
-        # Check if already exists
-        existing = self._issue_exists(title)
+        Returns:
+            Sync result with status and issue data
+        """
+        payload = self._story_payload(story_data)
+        title = payload['title']
+        body = payload['body']
+        assignee = payload['assignee']
+        status = payload['status']
+        labels = payload['labels']
         
-        if existing:
-            logger.info(f"Issue already exists for story: {title}")
+        logger.info(f"Syncing story: {title}")
+        
+        # Check if already exists (never create blindly)
+        try:
+            existing = self._issue_exists(title, story_data.get('story_id'))
+        except Exception as e:
+            logger.error(f"Could not check existing issues for {title}: {e}")
             return {
-                'status': 'exists',
+                'status': 'failed',
                 'story_file': str(story_file),
-                'issue': existing
+                'error': f"Could not check existing issues: {e}"
             }
         
+        payload_hash = hash_payload(payload)
+        
+        if existing:
+            return self._update_story_issue(
+                story_file,
+                existing,
+                self._desired_issue(story_data, title, body, assignee, labels, status, dry_run),
+                payload_hash,
+                dry_run,
+                fingerprint=story_data.get('fingerprint')
+            )
+        
         if dry_run:
             logger.info(f"DRY RUN: Would create issue for: {title}")
             return {
@@ -259,18 +397,25 @@ class StorySyncer:
             issue = self.issues.create_story_issue(
                 story_title=title,
                 story_body=body,
-                assignee=assignee
+                assignee=assignee,
+                labels=labels,
+                milestone=payload['milestone']
             )
+            self.issue_index.add(issue)
 
             # Close issue if status is "Done"
             if status.lower() == 'done':
                 issue_number = issue.get('number')
                 if issue_number:
-                    self.issues.close_issue(issue_number)
+                    closed = self.issues.close_issue(issue_number)
+                    if closed:
+                        self.issue_index.add(closed)
                     logger.info(f"Story {title} is marked as Done - closed issue #{issue_number}")
 
             logger.info(f"✅ Created issue for story: {title}")
             
+            self._record_state(story_file, issue, payload_hash, story_data.get('fingerprint'))
+            
             return {
                 'status': 'created',
                 'story_file': str(story_file),
@@ -286,28 +431,324 @@ class StorySyncer:
                 'error': str(e)
             }
     
-    def sync_all_stories(self, dry_run: bool = False) -> Dict:
+    def _story_payload(self, story_data: Dict) -> Dict:
+        """
+        Everything a story's issue is built from
+        
+        Includes the assignee and milestone, which come from the agent and
+        epic mappings rather than the story file: its hash is what change
+        detection compares.
+        
+        Args:
+            story_data: Parsed story data
+        
+        Returns:
+            Dict with title, body, assignee, labels, status and milestone
+        """
+        return {
+            'title': story_data['title'],
+            'body': self._build_issue_body(story_data),
+            'assignee': self._extract_assignee(story_data),
+            'labels': self._extract_labels(story_data),
+            'status': self._extract_status(story_data),
+            'milestone': self._desired_milestone(story_data)
+        }
+    
+    def _desired_issue(
+        self,
+        story_data: Dict,
+        title: str,
+        body: str,
+        assignee: Optional[str],
+        labels: List[str],
+        status: str,
+        dry_run: bool = False
+    ) -> Dict:
+        """
+        Desired issue fields for a story (issue_changes keyword arguments)
+        
+        Args:
+            story_data: Parsed story data
+            title: Issue title
+            body: Issue body
+            assignee: Assignee username (None = leave as is)
+            labels: Story label names
+            status: Story status (state is left as is when 'Unknown')
+            dry_run: If True, keep labels that don't exist yet
+        
+        Returns:
+            Desired state dict
+        """
+        label_names = list(dict.fromkeys(STORY_LABELS + labels))
+        if not dry_run:
+            # Labels that could not be created would never converge
+            label_names = [name for name in label_names if name in self.label_registry]
+        
+        state = None
+        if status.lower() == 'done':
+            state = 'closed'
+        elif status != 'Unknown':
+            state = 'open'
+        
+        return {
+            'title': title,
+            'body': body,
+            'assignee': assignee,
+            'labels': label_names,
+            'state': state,
+            'milestone': self._desired_milestone(story_data)
+        }
+    
+    def _desired_milestone(self, story_data: Dict) -> Optional[int]:
+        """
+        Milestone ID a story's issue belongs to (None = not managed)
+        
+        Args:
+            story_data: Parsed story data
+        
+        Returns:
+            Milestone ID or None
+        """
+        if self.epic_syncer is None:
+            return None
+        
+        return self.epic_syncer.milestone_for(story_data.get('epic'))
+    
+    def _update_story_issue(
+        self,
+        story_file: Path,
+        existing: Dict,
+        desired: Dict,
+        payload_hash: str,
+        dry_run: bool = False,
+        fingerprint: Optional[Tuple[str, float, int]] = None
+    ) -> Dict:
+        """
+        Bring an existing issue in line with its story
+        
+        Compares against the indexed issue, so nothing is sent when the
+        issue is already up to date.
+        
+        Args:
+            story_file: Path to story file
+            existing: Indexed issue data
+            desired: Output of _desired_issue
+            payload_hash: Hash of the story payload
+            dry_run: If True, only report the changes
+            fingerprint: File fingerprint captured when parsing
+        
+        Returns:
+            Sync result ('exists', 'updated', 'dry_run' or 'failed')
+        """
+        title = desired['title']
+        changes = issue_changes(existing, **desired)
+        
+        if not changes:
+            logger.info(f"Issue already up to date for story: {title}")
+            if not dry_run:
+                self._record_state(story_file, existing, payload_hash, fingerprint)
+            return {
+                'status': 'exists',
+                'story_file': str(story_file),
+                'issue': existing
+            }
+        
+        if dry_run:
+            logger.info(
+                f"DRY RUN: Would update issue #{existing.get('number')} "
+                f"({', '.join(sorted(changes))}) for: {title}"
+            )
+            return {
+                'status': 'dry_run',
+                'story_file': str(story_file),
+                'title': title,
+                'issue_number': existing.get('number'),
+                'changes': sorted(changes)
+            }
+        
+        try:
+            issue = self.issues.apply_changes(existing, changes)
+            self.issue_index.add(issue)
+            self._record_state(story_file, issue, payload_hash, fingerprint)
+            
+            logger.info(f"✅ Updated issue #{issue.get('number')} for story: {title}")
+            
+            return {
+                'status': 'updated',
+                'story_file': str(story_file),
+                'issue': issue,
+                'changes': sorted(changes)
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to update issue for {title}: {e}")
+            return {
+                'status': 'failed',
+                'story_file': str(story_file),
+                'error': str(e)
+            }
+    
+    def _changed_stories(
+        self,
+        story_files: List[Path],
+        parsed: Dict[str, Dict],
+        results: Dict,
+        prune: bool = True
+    ) -> List[Path]:
+        """
+        Filter out stories unchanged since their last sync
+        
+        A story is unchanged when its file is and the payload it maps to
+        now (assignee and milestone included) hashes to the one last
+        pushed, so new agent or epic mappings still reach the issue.
+        
+        Args:
+            story_files: Discovered story files
+            parsed: Parsed story records keyed by file path
+            results: Summary dict; skipped stories go to 'unchanged'
+            prune: Forget state of files no longer in story_files
+        
+        Returns:
+            Story files that need to be pushed
+        """
+        if self.state_store is None:
+            return story_files
+        
+        changed = []
+        
+        for story_file in story_files:
+            story_data = parsed.get(str(story_file))
+            if story_data is None or 'error' in story_data:
+                changed.append(story_file)
+                continue
+            
+            payload_hash = hash_payload(self._story_payload(story_data))
+            
+            if self.state_store.is_unchanged(story_file, payload_hash):
+                state = self.state_store.get(story_file)
+                results['unchanged'].append({
+                    'status': 'unchanged',
+                    'story_file': str(story_file),
+                    'issue_number': state.remote_id if state else None
+                })
+            else:
+                changed.append(story_file)
+        
+        if prune:
+            self.state_store.prune('story', story_files)
+        
+        return changed
+    
+    def _reconcile_labels(self, stories: List[Dict], dry_run: bool = False) -> Dict:
+        """
+        Create all labels the stories need in one pass, before any issue
+        
+        Args:
+            stories: Parsed story data
+            dry_run: If True, only report missing labels
+        
+        Returns:
+            LabelRegistry.reconcile summary
+        """
+        names = list(STORY_LABELS)
+        for story_data in stories:
+            if 'error' not in story_data:
+                names.extend(self._extract_labels(story_data))
+        
+        try:
+            return self.label_registry.reconcile(names, dry_run=dry_run)
+        except Exception as e:
+            logger.warning(f"Could not reconcile labels: {e}")
+            return {'created': [], 'existing': [], 'failed': names}
+    
+    def sync_all_stories(
+        self,
+        dry_run: bool = False,
+        force: bool = False,
+        workers: int = 1,
+        parse_workers: Optional[int] = 1,
+        story_files: Optional[List[Path]] = None
+    ) -> Dict:
         """
         Sync all stories to Gitea issues
         
         Args:
             dry_run: If True, don't create issues
+            force: If True, ignore the state store and re-sync every story
+            workers: Number of stories parsed and pushed concurrently
+                (results keep story file order)
+            parse_workers: Processes used to parse stories up front
+            story_files: Only sync these files (default: discover_stories())
         
         Returns:
-            Summary with results for all stories
+            Summary with results for all stories, plus the label
+            reconciliation summary under 'labels'
         """
-        story_files = self.discover_stories()
+        # A subset (watch mode) must not prune the state of other files
+        partial = story_files is not None
+        if partial:
+            story_files = [Path(path) for path in story_files if Path(path).exists()]
+        else:
+            story_files = self.discover_stories()
         
         results = {
             'created': [],
+            'updated': [],
             'exists': [],
+            'unchanged': [],
             'failed': [],
             'dry_run': []
         }
         
-        for story_file in story_files:
-            result = self.sync_story(story_file, dry_run=dry_run)
-            
+        # Parse everything first (on a process pool unless parse_workers
+        # is 1); unreadable files come back as per-story 'error' records
+        parsed = {}
+        if story_files:
+            parsed = parse_many_by_path(story_files, kind='story', workers=parse_workers)
+        
+        if not force:
+            # A dry run leaves the state store untouched
+            story_files = self._changed_stories(
+                story_files, parsed, results, prune=not (partial or dry_run)
+            )
+        
+        # One issue listing for the whole run (kept across watch batches).
+        # Without it every story would look new: abort instead.
+        if story_files:
+            try:
+                if partial:
+                    self.issue_index.ensure_loaded()
+                else:
+                    self.issue_index.load()
+            except Exception as e:
+                logger.error(f"❌ Could not index existing issues, skipping story sync: {e}")
+                results['failed'].extend(
+                    {
+                        'status': 'failed',
+                        'story_file': str(story_file),
+                        'error': f"Could not index existing issues: {e}"
+                    }
+                    for story_file in story_files
+                )
+                return results
+        
+        # Labels are resolved up front so issue creation needs no lookups
+        if story_files:
+            results['labels'] = self._reconcile_labels(
+                [parsed[str(story_file)] for story_file in story_files], dry_run=dry_run
+            )
+        
+        story_results = map_bounded(
+            lambda story_file: self.sync_story(
+                story_file,
+                dry_run=dry_run,
+                story_data=parsed.get(str(story_file))
+            ),
+            story_files,
+            workers=workers
+        )
+        
+        for result in story_results:
             status = result['status']
             results[status].append(result)
         
@@ -315,7 +756,9 @@ class StorySyncer:
         logger.info(
             f"Story sync complete: "
             f"{len(results['created'])} created, "
+            f"{len(results['updated'])} updated, "
             f"{len(results['exists'])} existing, "
+            f"{len(results['unchanged'])} unchanged, "
             f"{len(results['failed'])} failed"
         )
         
@@ -0,0 +1,528 @@
+"""
+Sync Plan - Precomputed, reviewable artifact sync
+
+Builds a serializable plan (create / update / close / skip per artifact,
+labels and milestones to create) from one bulk fetch of the remote
+state, and applies it later with batching and bounded concurrency.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from parsers.bulk import parse_many_by_path
+from gitea.issues import STORY_LABELS, issue_changes
+from core.epic_syncer import epic_reference_keys
+from core.state_store import hash_file, hash_payload
+from utils.concurrency import map_bounded
+
+logger = logging.getLogger(__name__)
+
+PLAN_VERSION = 1
+
+# Plan actions
+CREATE = 'create'
+UPDATE = 'update'
+CLOSE = 'close'
+SKIP = 'skip'
+
+
+@dataclass
+class PlannedAction:
+    """What to do with one artifact file"""
+    kind: str
+    file: str
+    action: str
+    title: str
+    reason: str = ''
+    source_hash: Optional[str] = None
+    source_mtime: Optional[float] = None
+    source_size: Optional[int] = None
+    payload_hash: Optional[str] = None
+    remote_id: Optional[int] = None
+    payload: Dict[str, Any] = field(default_factory=dict)
+    changes: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SyncPlan:
+    """Serializable sync plan for one project/repository"""
+    project: str
+    repository: str
+    created_at: float
+    labels_to_create: List[str] = field(default_factory=list)
+    actions: List[PlannedAction] = field(default_factory=list)
+    version: int = PLAN_VERSION
+
+    @property
+    def milestones_to_create(self) -> List[str]:
+        """Titles of the epics that get a new milestone"""
+        return [
+            action.title for action in self.actions
+            if action.kind == 'epic' and action.action == CREATE
+        ]
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        Count actions per artifact kind
+
+        Returns:
+            {'epic': {'create': n, ...}, 'story': {...}}
+        """
+        counts: Dict[str, Dict[str, int]] = {}
+        for action in self.actions:
+            per_kind = counts.setdefault(action.kind, {})
+            per_kind[action.action] = per_kind.get(action.action, 0) + 1
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['milestones_to_create'] = self.milestones_to_create
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SyncPlan':
+        if data.get('version') != PLAN_VERSION:
+            raise ValueError(f"Unsupported plan version: {data.get('version')}")
+
+        return cls(
+            project=data['project'],
+            repository=data['repository'],
+            created_at=data['created_at'],
+            labels_to_create=list(data.get('labels_to_create', [])),
+            actions=[PlannedAction(**action) for action in data.get('actions', [])],
+            version=data['version']
+        )
+
+    def save(self, path: Path):
+        """
+        Write the plan as JSON
+
+        Args:
+            path: Output file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False), encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: Path) -> 'SyncPlan':
+        """
+        Read a plan written by save()
+
+        Args:
+            path: Plan file
+
+        Returns:
+            SyncPlan
+        """
+        return cls.from_dict(json.loads(Path(path).read_text(encoding='utf-8')))
+
+
+class SyncPlanner:
+    """Build and apply sync plans with an EpicSyncer and a StorySyncer"""
+
+    def __init__(self, epic_syncer, story_syncer, project: str = ''):
+        """
+        Initialize planner
+
+        Args:
+            epic_syncer: EpicSyncer
+            story_syncer: StorySyncer (its issue index and label registry
+                hold the remote state)
+            project: Project name recorded in the plan
+        """
+        self.epic_syncer = epic_syncer
+        self.story_syncer = story_syncer
+        self.project = project
+        self.client = story_syncer.gitea_client
+        # Reference keys of epics whose milestone only exists after apply
+        self._pending_epics = set()
+
+    def _unchanged(self, file_path: Path, kind: str, data: Optional[Dict] = None) -> bool:
+        """
+        Whether the state store has the file as synced and unchanged
+
+        Args:
+            file_path: Artifact file
+            kind: 'epic' or 'story'
+            data: Parsed story, whose payload hash must match as well
+        """
+        syncer = self.epic_syncer if kind == 'epic' else self.story_syncer
+        state_store = syncer.state_store
+        if state_store is None:
+            return False
+
+        payload_hash = None
+        if data is not None:
+            if 'error' in data:
+                return False
+            payload_hash = hash_payload(syncer._story_payload(data))
+
+        return state_store.is_unchanged(file_path, payload_hash)
+
+    def _parse_all(self, files: List[Path], kind: str, parse_workers: Optional[int]) -> Dict[str, Dict]:
+        """Parse files up front; unreadable files come back as error records"""
+        if not files:
+            return {}
+
+        return parse_many_by_path(files, kind=kind, workers=parse_workers)
+
+    def build(self, force: bool = False, parse_workers: Optional[int] = 1) -> SyncPlan:
+        """
+        Compute the plan from one listing each of issues, labels and
+        milestones (no change is made)
+
+        Args:
+            force: If True, ignore the state store
+            parse_workers: Processes used to parse artifacts (None = CPU count)
+
+        Returns:
+            SyncPlan
+        """
+        story_syncer = self.story_syncer
+        story_syncer.issue_index.load()
+        story_syncer.label_registry.load()
+        self.epic_syncer.milestone_index.load()
+
+        plan = SyncPlan(
+            project=self.project,
+            repository=self.client.repo_path,
+            created_at=time.time()
+        )
+
+        epic_files = self.epic_syncer.discover_epics()
+        story_files = story_syncer.discover_stories()
+
+        pending_epics = [path for path in epic_files if force or not self._unchanged(path, 'epic')]
+        parsed_epics = self._parse_all(pending_epics, 'epic', parse_workers)
+
+        self._pending_epics = set()
+        for epic_file in epic_files:
+            epic_data = parsed_epics.get(str(epic_file))
+            plan.actions.append(self._plan_epic(epic_file, epic_data))
+
+        # Stories are parsed before the unchanged check: their payload
+        # also depends on the epic milestones resolved above
+        parsed_stories = self._parse_all(story_files, 'story', parse_workers)
+        if not force:
+            parsed_stories = {
+                path: data for path, data in parsed_stories.items()
+                if not self._unchanged(Path(path), 'story', data)
+            }
+
+        label_names = list(STORY_LABELS)
+        for story_file in story_files:
+            story_data = parsed_stories.get(str(story_file))
+            plan.actions.append(self._plan_story(story_file, story_data))
+            if story_data and 'error' not in story_data:
+                label_names.extend(story_syncer._extract_labels(story_data))
+
+        plan.labels_to_create = story_syncer.label_registry.reconcile(
+            label_names, dry_run=True
+        )['created']
+
+        logger.info(f"Sync plan: {plan.counts()}, {len(plan.labels_to_create)} labels to create")
+        return plan
+
+    @staticmethod
+    def _source(data: Dict) -> Dict[str, Any]:
+        """source_hash / source_mtime / source_size of the content parsed"""
+        content_hash, mtime, size = data['fingerprint']
+        return {'source_hash': content_hash, 'source_mtime': mtime, 'source_size': size}
+
+    def _plan_epic(self, epic_file: Path, epic_data: Optional[Dict]) -> PlannedAction:
+        """Plan one epic (None = unchanged since last sync)"""
+        if epic_data is None:
+            state_store = self.epic_syncer.state_store
+            state = state_store.get(epic_file) if state_store is not None else None
+            if state:
+                self.epic_syncer.remember_milestone(epic_file, state.remote_id)
+            return PlannedAction('epic', str(epic_file), SKIP, epic_file.stem, reason='unchanged')
+
+        if 'error' in epic_data:
+            return PlannedAction('epic', str(epic_file), SKIP, epic_file.stem, reason=epic_data['error'])
+
+        title = epic_data['title']
+        description = epic_data['description']
+        due_date = self.epic_syncer._extract_due_date(epic_data)
+        payload_hash = hash_payload({
+            'title': title,
+            'description': description,
+            'due_date': due_date
+        })
+
+        existing = self.epic_syncer._milestone_exists(title)
+
+        if existing:
+            self.epic_syncer.remember_milestone(epic_file, existing.get('id'), title)
+            return PlannedAction(
+                'epic', str(epic_file), SKIP, title,
+                reason='exists',
+                **self._source(epic_data),
+                payload_hash=payload_hash,
+                remote_id=existing.get('id')
+            )
+
+        self._pending_epics.update(epic_reference_keys(epic_file.stem)[:1])
+        self._pending_epics.update(epic_reference_keys(title))
+        
+        return PlannedAction(
+            'epic', str(epic_file), CREATE, title,
+            **self._source(epic_data),
+            payload_hash=payload_hash,
+            payload={'title': title, 'description': description, 'due_date': due_date}
+        )
+
+    def _plan_story(self, story_file: Path, story_data: Optional[Dict]) -> PlannedAction:
+        """Plan one story (None = unchanged since last sync)"""
+        syncer = self.story_syncer
+
+        if story_data is None:
+            return PlannedAction('story', str(story_file), SKIP, story_file.stem, reason='unchanged')
+
+        if 'error' in story_data:
+            return PlannedAction('story', str(story_file), SKIP, story_file.stem, reason=story_data['error'])
+
+        story_payload = syncer._story_payload(story_data)
+        title = story_payload['title']
+        body = story_payload['body']
+        assignee = story_payload['assignee']
+        status = story_payload['status']
+        labels = story_payload['labels']
+        milestone = story_payload['milestone']
+        payload_hash = hash_payload(story_payload)
+
+        epic = story_data.get('epic') or ''
+        # Epic milestone created by this plan: resolved when applying
+        pending_milestone = milestone is None and bool(
+            self._pending_epics & set(epic_reference_keys(epic))
+        )
+
+        existing = syncer._issue_exists(title, story_data.get('story_id'))
+
+        if existing is None:
+            return PlannedAction(
+                'story', str(story_file), CREATE, title,
+                **self._source(story_data),
+                payload_hash=payload_hash,
+                payload={
+                    'title': title,
+                    'body': body,
+                    'assignee': assignee,
+                    'labels': labels,
+                    'milestone': milestone,
+                    'epic': epic,
+                    'story_id': story_data.get('story_id'),
+                    'close': status.lower() == 'done'
+                }
+            )
+
+        desired = syncer._desired_issue(story_data, title, body, assignee, labels, status, dry_run=True)
+        changes = issue_changes(existing, **desired)
+        if pending_milestone:
+            changes['milestone'] = None
+
+        if not changes:
+            action, reason = SKIP, 'up to date'
+        elif list(changes) == ['state'] and changes['state'] == 'closed':
+            action, reason = CLOSE, ''
+        else:
+            action, reason = UPDATE, ''
+
+        return PlannedAction(
+            'story', str(story_file), action, title,
+            reason=reason,
+            **self._source(story_data),
+            payload_hash=payload_hash,
+            remote_id=existing.get('number'),
+            payload={'epic': epic},
+            changes=changes
+        )
+
+    def apply(self, plan: SyncPlan, workers: int = 1) -> Dict[str, List[Dict]]:
+        """
+        Execute a plan: labels in one reconciliation pass, then milestones,
+        then issues, each phase fanned out over `workers` threads
+
+        Artifacts edited since the plan was built are reported as 'stale'
+        and left alone. Creations are checked against freshly listed
+        milestones/issues, so re-applying a plan (or applying it after a
+        sync) reports 'exists' instead of creating duplicates.
+
+        Args:
+            plan: Plan from build() / SyncPlan.load()
+            workers: Concurrent API calls per phase
+
+        Returns:
+            Results keyed by outcome ('created', 'exists', 'updated',
+            'closed', 'skipped', 'stale', 'failed')
+        """
+        results = {
+            'created': [],
+            'exists': [],
+            'updated': [],
+            'closed': [],
+            'skipped': [],
+            'stale': [],
+            'failed': []
+        }
+
+        # Label ids are only needed when issues get labels
+        registry = self.story_syncer.label_registry
+        if any(action.kind == 'story' and action.action in (CREATE, UPDATE) for action in plan.actions):
+            registry.load()
+        if plan.labels_to_create:
+            label_summary = registry.reconcile(plan.labels_to_create)
+            for name in label_summary['failed']:
+                results['failed'].append({'kind': 'label', 'title': name, 'error': 'label creation failed'})
+
+        for kind in ('epic', 'story'):
+            actions = [action for action in plan.actions if action.kind == kind]
+            index_error = self._load_index(kind, actions)
+            outcomes = map_bounded(
+                lambda action: self._apply_action(action, index_error),
+                actions,
+                workers=workers
+            )
+            for action, outcome in zip(actions, outcomes):
+                status, detail = outcome
+                results[status].append({
+                    'kind': action.kind,
+                    'file': action.file,
+                    'title': action.title,
+                    'action': action.action,
+                    **detail
+                })
+
+        logger.info(
+            "Plan applied: " + ", ".join(f"{len(items)} {status}" for status, items in results.items())
+        )
+        return results
+
+    def _load_index(self, kind: str, actions: List[PlannedAction]) -> Optional[str]:
+        """
+        Re-list milestones (epics) or issues (stories) before creating any
+
+        Args:
+            kind: 'epic' or 'story'
+            actions: Planned actions of that kind
+
+        Returns:
+            Error message if the listing failed (creations are then
+            refused), None otherwise
+        """
+        if not any(action.action == CREATE for action in actions):
+            return None
+
+        index = self.epic_syncer.milestone_index if kind == 'epic' else self.story_syncer.issue_index
+        try:
+            index.load()
+        except Exception as e:
+            logger.error(f"❌ Could not index existing {kind}s, skipping their creation: {e}")
+            return str(e)
+        return None
+
+    def _apply_action(self, action: PlannedAction, index_error: Optional[str] = None):
+        """Apply one planned action; returns (outcome, detail)"""
+        file_path = Path(action.file)
+
+        if action.action == SKIP:
+            if action.reason in ('exists', 'up to date') and self._still_current(action):
+                self._record(action, {'id': action.remote_id, 'number': action.remote_id})
+            return 'skipped', {'reason': action.reason}
+
+        if not self._still_current(action):
+            logger.warning(f"{file_path.name} changed since the plan was built, skipped")
+            return 'stale', {}
+
+        if action.action == CREATE and index_error is not None:
+            return 'failed', {'error': f"Could not index existing {action.kind}s: {index_error}"}
+
+        try:
+            if action.kind == 'epic':
+                epic_syncer = self.epic_syncer
+                with epic_syncer._title_locks.hold(action.title):
+                    existing = epic_syncer._milestone_exists(action.title)
+                    if existing:
+                        epic_syncer.remember_milestone(file_path, existing.get('id'), action.title)
+                        self._record(action, existing)
+                        return 'exists', {'remote_id': existing.get('id')}
+
+                    milestone = epic_syncer.milestones.create_epic_milestone(
+                        epic_title=action.payload['title'],
+                        epic_description=action.payload['description'],
+                        due_date=action.payload.get('due_date')
+                    )
+                    epic_syncer.milestone_index.add(milestone)
+                epic_syncer.remember_milestone(file_path, milestone.get('id'), action.title)
+                self._record(action, milestone)
+                return 'created', {'remote_id': milestone.get('id')}
+
+            issues = self.story_syncer.issues
+            index = self.story_syncer.issue_index
+
+            if action.action == CREATE:
+                payload = action.payload
+                with index.claim(payload['title']):
+                    existing = self.story_syncer._issue_exists(payload['title'], payload.get('story_id'))
+                    if existing:
+                        self._record(action, existing)
+                        return 'exists', {'remote_id': existing.get('number')}
+
+                    issue = issues.create_story_issue(
+                        story_title=payload['title'],
+                        story_body=payload['body'],
+                        assignee=payload['assignee'],
+                        labels=payload['labels'],
+                        milestone=payload.get('milestone') or self.epic_syncer.milestone_for(payload.get('epic'))
+                    )
+                    if payload.get('close') and issue.get('number'):
+                        issue = issues.close_issue(issue['number']) or issue
+                    index.add(issue)
+                self._record(action, issue)
+                return 'created', {'remote_id': issue.get('number')}
+
+            changes = dict(action.changes)
+            if 'milestone' in changes and changes['milestone'] is None:
+                changes['milestone'] = self.epic_syncer.milestone_for(action.payload.get('epic'))
+                if changes['milestone'] is None:
+                    del changes['milestone']
+
+            current = index.get_by_number(action.remote_id) or {'number': action.remote_id}
+            issue = issues.apply_changes(current, changes) if changes else current
+            if issue.get('title'):
+                index.add(issue)
+            self._record(action, issue)
+            return ('closed' if action.action == CLOSE else 'updated'), {
+                'remote_id': action.remote_id,
+                'changes': sorted(changes)
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to {action.action} {action.kind} {action.title}: {e}")
+            return 'failed', {'error': str(e)}
+
+    def _still_current(self, action: PlannedAction) -> bool:
+        """Whether the artifact file is unchanged since planning"""
+        try:
+            return action.source_hash is not None and hash_file(Path(action.file)) == action.source_hash
+        except OSError:
+            return False
+
+    def _record(self, action: PlannedAction, remote: Dict):
+        """Record the applied artifact in the state store (as planned)"""
+        file_path = Path(action.file)
+        fingerprint = None
+        if action.source_mtime is not None:
+            fingerprint = (action.source_hash, action.source_mtime, action.source_size)
+
+        if action.kind == 'epic':
+            self.epic_syncer._record_state(file_path, remote, action.payload_hash, fingerprint)
+        else:
+            self.story_syncer._record_state(file_path, remote, action.payload_hash, fingerprint)
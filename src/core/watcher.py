@@ -0,0 +1,271 @@
+"""
+Artifact Watcher - Filesystem notifications for watch mode
+
+Collects file changes under the watched BMad directories (inotify via
+watchdog, or a polling fallback) and hands them out in debounced batches.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import fnmatch
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+except ImportError:  # pragma: no cover - optional dependency
+    FileSystemEventHandler = object
+    Observer = PollingObserver = None
+
+logger = logging.getLogger(__name__)
+
+# Events that change file content; inotify also reports opens and
+# read-only closes, which the sync itself would trigger
+WRITE_EVENTS = {'created', 'modified', 'deleted', 'moved', 'closed'}
+
+
+def is_ignored(path: Path, patterns: Iterable[str]) -> bool:
+    """
+    Check a path against bmad.ignore patterns
+
+    A pattern matches the file name or any directory in the path
+    (e.g. '*.pyc', '__pycache__', '.git').
+
+    Args:
+        path: File path
+        patterns: fnmatch-style patterns
+
+    Returns:
+        True if the path should be ignored
+    """
+    parts = Path(path).parts
+    return any(
+        fnmatch.fnmatch(part, pattern)
+        for pattern in patterns
+        for part in parts
+    )
+
+
+class ChangeBatcher:
+    """
+    Coalesce file change events into debounced batches
+
+    A batch is released once no event arrived for `debounce` seconds, or
+    `max_latency` seconds after its first event, whichever comes first.
+    """
+
+    def __init__(self, debounce: float = 2.0, max_latency: float = 30.0):
+        """
+        Initialize batcher
+
+        Args:
+            debounce: Quiet period closing a batch (seconds)
+            max_latency: Max time a change waits in a batch (seconds)
+        """
+        self.debounce = debounce
+        self.max_latency = max(max_latency, debounce)
+        self._cond = threading.Condition()
+        self._pending: Set[Path] = set()
+        self._first_event: Optional[float] = None
+        self._last_event: Optional[float] = None
+
+    def add(self, path: Path):
+        """
+        Record a changed path
+
+        Args:
+            path: Created, modified or deleted file
+        """
+        now = time.monotonic()
+
+        with self._cond:
+            self._pending.add(Path(path))
+            if self._first_event is None:
+                self._first_event = now
+            self._last_event = now
+            self._cond.notify_all()
+
+    def _due_in(self, now: float) -> Optional[float]:
+        """Seconds until the pending batch is due (None = no batch)"""
+        if self._first_event is None:
+            return None
+
+        return max(0.0, min(
+            self._last_event + self.debounce,
+            self._first_event + self.max_latency
+        ) - now)
+
+    def next_batch(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Block until a batch is due or timeout expires
+
+        Args:
+            timeout: Max seconds to wait (None = forever)
+
+        Returns:
+            Changed paths (empty if the timeout expired first)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                due_in = self._due_in(now)
+
+                if due_in == 0.0:
+                    batch = self._pending
+                    self._pending = set()
+                    self._first_event = self._last_event = None
+                    return batch
+
+                if deadline is not None and now >= deadline:
+                    return set()
+
+                waits = [wait for wait in (due_in, deadline and deadline - now) if wait is not None]
+                self._cond.wait(min(waits) if waits else None)
+
+
+class _BatchingHandler(FileSystemEventHandler):
+    """watchdog handler feeding a ChangeBatcher"""
+
+    def __init__(self, batcher: ChangeBatcher, ignore: List[str]):
+        super().__init__()
+        self.batcher = batcher
+        self.ignore = ignore
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in WRITE_EVENTS:
+            return
+
+        for path in (getattr(event, 'src_path', None), getattr(event, 'dest_path', None)):
+            if path and not is_ignored(Path(os.fsdecode(path)), self.ignore):
+                self.batcher.add(Path(os.fsdecode(path)))
+
+
+class ArtifactWatcher:
+    """
+    Watch directories and feed changed files into a ChangeBatcher
+
+    Uses native notifications (inotify on Linux) through watchdog, and
+    falls back to polling when watchdog is missing or the native
+    observer cannot start (e.g. inotify watch limit reached).
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        batcher: ChangeBatcher,
+        ignore: Optional[List[str]] = None,
+        poll_interval: float = 2.0,
+        use_polling: bool = False
+    ):
+        """
+        Initialize watcher
+
+        Args:
+            paths: Directories to watch (recursively)
+            batcher: Batcher receiving changed paths
+            ignore: bmad.ignore patterns
+            poll_interval: Scan interval of the polling fallback (seconds)
+            use_polling: Force the polling fallback
+        """
+        self.paths = [Path(path) for path in dict.fromkeys(paths) if Path(path).is_dir()]
+        self.batcher = batcher
+        self.ignore = list(ignore or [])
+        self.poll_interval = poll_interval
+        self.use_polling = use_polling
+        self.mode = None
+        self._observer = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> str:
+        """
+        Start watching
+
+        Returns:
+            Backend in use ('inotify', 'watchdog-polling' or 'polling')
+        """
+        if Observer is not None:
+            handler = _BatchingHandler(self.batcher, self.ignore)
+
+            observer_types = [(PollingObserver, 'watchdog-polling')]
+            if not self.use_polling:
+                observer_types.insert(0, (Observer, 'inotify'))
+
+            for observer_type, mode in observer_types:
+                observer = observer_type(timeout=self.poll_interval)
+                try:
+                    for path in self.paths:
+                        observer.schedule(handler, str(path), recursive=True)
+                    observer.start()
+                except OSError as e:
+                    logger.warning(f"Could not start {mode} observer: {e}")
+                    continue
+
+                self._observer = observer
+                self.mode = mode
+                break
+
+        if self._observer is None:
+            self._thread = threading.Thread(
+                target=self._poll_loop,
+                name='bmad-watch',
+                daemon=True
+            )
+            self._thread.start()
+            self.mode = 'polling'
+
+        logger.info(f"Watching {len(self.paths)} directories ({self.mode})")
+        return self.mode
+
+    def stop(self):
+        """Stop watching"""
+        self._stop.set()
+
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _snapshot(self) -> Dict[Path, float]:
+        """mtime of every watched, non-ignored file"""
+        snapshot = {}
+
+        for root in self.paths:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [name for name in dirnames if not is_ignored(Path(name), self.ignore)]
+
+                for name in filenames:
+                    path = Path(dirpath) / name
+                    if is_ignored(path, self.ignore):
+                        continue
+                    try:
+                        snapshot[path] = path.stat().st_mtime_ns
+                    except OSError:
+                        continue
+
+        return snapshot
+
+    def _poll_loop(self):
+        """Polling fallback: diff directory snapshots"""
+        previous = self._snapshot()
+
+        while not self._stop.wait(self.poll_interval):
+            current = self._snapshot()
+
+            for path in current.keys() | previous.keys():
+                if current.get(path) != previous.get(path):
+                    self.batcher.add(path)
+
+            previous = current
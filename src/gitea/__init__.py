@@ -7,5 +7,7 @@ Authors: Khaled Z. & Claude (Anthropic)
 """
 
 from .client import GiteaClient
+from .http_cache import ResponseCache
+from .labels import LabelRegistry
 
-__all__ = ["GiteaClient"]
\ No newline at end of file
+__all__ = ["GiteaClient", "LabelRegistry", "ResponseCache"]
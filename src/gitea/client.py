@@ -8,8 +8,17 @@ Authors: Khaled Z. & Claude (Anthropic)
 
 import requests
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Any
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+
+from .http_cache import ResponseCache
+from .metrics import RequestMetrics, payload_size
+from .pagination import DEFAULT_PAGE_SIZE, paginate
+from .retry import RetryPolicies, RetryPolicy, RetryStats
+from .throttle import RequestThrottle
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +38,16 @@ class GiteaClient:
         organization: str = "",
         repository: str = "",
         timeout: int = 30,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        retry_policies: Optional[RetryPolicies] = None,
+        rate_limit: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        throttle: Optional[RequestThrottle] = None,
+        cache: Optional[ResponseCache] = None
     ):
         """
         Initialize Gitea client
@@ -41,6 +59,19 @@ class GiteaClient:
             repository: Repository name
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Max keep-alive connections kept open per host
+            pool_block: Block when a host's pool is exhausted instead of
+                opening extra throwaway connections (hard per-host limit)
+            page_size: Items requested per page on list endpoints
+            retry_policies: Retry policy (default + per-endpoint overrides)
+                for transient failures
+            rate_limit: Max requests per second (None = unlimited)
+            max_concurrency: Max requests in flight (None = unlimited)
+            throttle: Existing RequestThrottle to share with other clients
+                (overrides rate_limit/max_concurrency)
+            cache: Conditional GET cache for read-heavy endpoints
+                (None = every GET fetches the full body)
         """
         self.base_url = base_url.rstrip('/')
         self.token = token
@@ -48,6 +79,19 @@ class GiteaClient:
         self.repository = repository
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.page_size = page_size
+        self.retry_policies = retry_policies or RetryPolicies()
+        self.retry_stats = RetryStats()
+        self.metrics = RequestMetrics()
+        self.throttle = throttle or RequestThrottle(
+            rate_limit=rate_limit,
+            max_concurrency=max_concurrency
+        )
+        self.cache = cache
+        
+        # Token owner, resolved on first use (see get_current_user)
+        self._current_user: Optional[Dict] = None
+        self._identity_lock = threading.Lock()
         
         # API version
         self.api_base = f"{self.base_url}/api/v1"
@@ -59,8 +103,248 @@ class GiteaClient:
             'Accept': 'application/json'
         }
         
+        # Pooled keep-alive session, shared by every helper built on this client
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.verify = verify_ssl
+        self.session.mount('http://', self._adapter)
+        self.session.mount('https://', self._adapter)
+        
         logger.info(f"Initialized Gitea client for {self.base_url}")
     
+    def close(self):
+        """Close the HTTP session, release pooled connections and save the cache"""
+        if self.cache is not None:
+            self.cache.save()
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Get connection pool statistics
+        
+        Returns:
+            Dict with hosts, connections_opened, requests,
+            reused_connections and idle_connections counters
+        """
+        stats = {
+            'hosts': 0,
+            'connections_opened': 0,
+            'requests': 0,
+            'reused_connections': 0,
+            'idle_connections': 0
+        }
+        
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            
+            stats['hosts'] += 1
+            stats['connections_opened'] += pool.num_connections
+            stats['requests'] += pool.num_requests
+            if pool.pool is not None:
+                stats['idle_connections'] += sum(
+                    1 for conn in list(pool.pool.queue) if conn is not None
+                )
+        
+        stats['reused_connections'] = max(
+            stats['requests'] - stats['connections_opened'], 0
+        )
+        return stats
+    
+    def _request(
+        self,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Send HTTP request through the pooled session
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, PATCH)
+            url: Absolute request URL
+            **kwargs: Extra arguments for requests (json, params, headers)
+            
+        Returns:
+            Response object
+            
+        Raises:
+            GiteaAPIError: If request fails
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        
+        endpoint = url[len(self.api_base):] if url.startswith(self.api_base) else url
+        policy = self.retry_policies.policy_for(method, endpoint)
+        sent = payload_size(kwargs.get('json'))
+        attempt = 0
+        
+        # Conditional GET: serve fresh entries, revalidate stale ones
+        cache_key = cached = None
+        if self.cache is not None:
+            cache_key = self.cache.key_for(method, endpoint, url, kwargs.get('params'))
+            if cache_key is not None:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    if cached.fresh:
+                        logger.debug(f"{method} {url} (cached)")
+                        return self.cache.hit(cached)
+                    kwargs['headers'] = {**(kwargs.get('headers') or {}), **cached.validators()}
+        
+        while True:
+            attempt += 1
+            logger.debug(f"{method} {url}")
+            
+            try:
+                with self.throttle.slot():
+                    started = time.perf_counter()
+                    try:
+                        response = self.session.request(method=method, url=url, **kwargs)
+                    finally:
+                        elapsed = time.perf_counter() - started
+            
+            except requests.exceptions.RequestException as e:
+                self.metrics.record_call(method, endpoint, elapsed, bytes_sent=sent)
+                
+                if policy.should_retry_error(method, e, attempt):
+                    self._wait_before_retry(
+                        method, url, type(e).__name__, policy.backoff(attempt), attempt
+                    )
+                    continue
+                
+                self.retry_stats.record_failure()
+                self.metrics.record_error(method, endpoint)
+                error_msg = f"Request failed: {e}"
+                logger.error(error_msg)
+                raise GiteaAPIError(error_msg)
+            
+            # Log response status
+            logger.debug(f"Response: {response.status_code}")
+            self.metrics.record_call(
+                method,
+                endpoint,
+                elapsed,
+                status=response.status_code,
+                bytes_sent=sent,
+                bytes_received=len(response.content or b'')
+            )
+            
+            if policy.should_retry_status(method, response.status_code, attempt):
+                self._wait_before_retry(
+                    method,
+                    url,
+                    str(response.status_code),
+                    policy.backoff(attempt, response.headers.get('Retry-After')),
+                    attempt
+                )
+                continue
+            
+            break
+        
+        if self.cache is not None:
+            if cache_key is not None:
+                if response.status_code == 304 and cached is not None:
+                    return self.cache.not_modified(cache_key, cached, response)
+                self.cache.store(cache_key, endpoint, response)
+            elif response.ok:
+                self.cache.invalidate(method, endpoint)
+        
+        try:
+            # Raise for HTTP errors
+            response.raise_for_status()
+            
+            return response
+        
+        except requests.exceptions.HTTPError as e:
+            if response.status_code in policy.retry_statuses:
+                self.retry_stats.record_failure()
+            self.metrics.record_error(method, endpoint)
+            
+            error_msg = f"HTTP error: {e}"
+            if e.response is not None:
+                try:
+                    error_data = e.response.json()
+                    error_msg = f"HTTP {e.response.status_code}: {error_data.get('message', str(e))}"
+                except:
+                    pass
+            
+            logger.error(error_msg)
+            raise GiteaAPIError(error_msg)
+    
+    def _wait_before_retry(
+        self,
+        method: str,
+        url: str,
+        reason: str,
+        delay: float,
+        attempt: int
+    ):
+        """
+        Record a retry and sleep before the next attempt
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            reason: Status code or exception name that triggered the retry
+            delay: Seconds to wait
+            attempt: Attempt number that just failed
+        """
+        self.retry_stats.record_retry(reason)
+        self.metrics.record_retry(
+            method, url[len(self.api_base):] if url.startswith(self.api_base) else url
+        )
+        logger.warning(
+            f"{method} {url} failed ({reason}), "
+            f"retrying in {delay:.1f}s (attempt {attempt + 1})"
+        )
+        time.sleep(delay)
+    
+    def set_retry_policy(self, pattern: str, policy: RetryPolicy):
+        """
+        Override the retry policy for matching endpoints
+        
+        Args:
+            pattern: "METHOD /path/glob" (e.g. "POST /admin/users"),
+                matched against the endpoint without /api/v1
+            policy: RetryPolicy to apply
+        """
+        self.retry_policies.set_override(pattern, policy)
+    
+    def get(self, path: str, **kwargs) -> requests.Response:
+        """GET a path relative to the Gitea base URL (e.g. /api/v1/orgs/x)"""
+        return self._request('GET', f"{self.base_url}{path}", **kwargs)
+    
+    def post(self, path: str, **kwargs) -> requests.Response:
+        """POST to a path relative to the Gitea base URL"""
+        return self._request('POST', f"{self.base_url}{path}", **kwargs)
+    
+    def put(self, path: str, **kwargs) -> requests.Response:
+        """PUT to a path relative to the Gitea base URL"""
+        return self._request('PUT', f"{self.base_url}{path}", **kwargs)
+    
+    def patch(self, path: str, **kwargs) -> requests.Response:
+        """PATCH a path relative to the Gitea base URL"""
+        return self._request('PATCH', f"{self.base_url}{path}", **kwargs)
+    
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        """DELETE a path relative to the Gitea base URL"""
+        return self._request('DELETE', f"{self.base_url}{path}", **kwargs)
+    
     def _make_request(
         self,
         method: str,
@@ -99,49 +383,39 @@ class GiteaClient:
         print(f"DEBUG final URL: {url}")                 # ← AJOUTER
         """
         
-        logger.debug(f"{method} {url}")
-
-
-        logger.debug(f"{method} {url}")
+        response = self._request(method, url, json=data, params=params)
         
-        try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                json=data,
-                params=params,
-                timeout=self.timeout,
-                verify=self.verify_ssl
-            )
-            
-            # Log response status
-            logger.debug(f"Response: {response.status_code}")
-            
-            # Raise for HTTP errors
-            response.raise_for_status()
-            
-            # Return JSON if available
-            if response.content:
-                return response.json()
-            return None
+        # Return JSON if available
+        if response.content:
+            return response.json()
+        return None
+    
+    def _iter_endpoint(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        prefetch: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Lazily iterate over every page of a list endpoint
         
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"HTTP error: {e}"
-            if e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg = f"HTTP {e.response.status_code}: {error_data.get('message', str(e))}"
-                except:
-                    pass
+        Args:
+            endpoint: API endpoint (without /api/v1 prefix)
+            params: Extra URL query parameters
+            prefetch: Fetch the next page while the current one is consumed
             
-            logger.error(error_msg)
-            raise GiteaAPIError(error_msg)
+        Yields:
+            Items from all pages
+        """
+        url = f"{self.api_base}{endpoint}"
+        base_params = dict(params or {})
         
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Request failed: {e}"
-            logger.error(error_msg)
-            raise GiteaAPIError(error_msg)
+        def fetch_page(page: int, limit: int):
+            return self._request(
+                'GET', url, params={**base_params, 'page': page, 'limit': limit}
+            )
+        
+        return paginate(fetch_page, limit=self.page_size, prefetch=prefetch)
     
     def get_user(self, username: str) -> Optional[Dict]:
         """
@@ -177,6 +451,19 @@ class GiteaClient:
 
 
 
+    def iter_users(self, prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Iterate over every user of the instance, page by page
+        (requires admin token)
+        
+        Args:
+            prefetch: Fetch the next page concurrently
+            
+        Yields:
+            User data
+        """
+        return self._iter_endpoint('/admin/users', prefetch=prefetch)
+    
     def create_user(
         self,
         username: str,
@@ -214,8 +501,9 @@ class GiteaClient:
         self,
         title: str,
         body: str = "",
-        labels: Optional[List[str]] = None,
-        assignee: Optional[str] = None
+        labels: Optional[List[int]] = None,
+        assignee: Optional[str] = None,
+        milestone: Optional[int] = None
     ) -> Dict:
         """
         Create an issue in the configured repository
@@ -223,36 +511,50 @@ class GiteaClient:
         Args:
             title: Issue title
             body: Issue body/description
-            labels: List of label names
+            labels: List of label IDs (see LabelRegistry.ids_for)
             assignee: Username to assign
+            milestone: Milestone ID
             
         Returns:
             Created issue data
         """
-        # Determine repository path
-        if self.organization:
-            repo_path = f"/repos/{self.organization}/{self.repository}/issues"
-        else:
-            # Assume user repository
-            user = self.get_current_user()
-            repo_path = f"/repos/{user['login']}/{self.repository}/issues"
-        
         data = {
             'title': title,
             'body': body
         }
-        """        
         if labels:
             data['labels'] = labels
-        """        
         if assignee:
             data['assignee'] = assignee
+        if milestone:
+            data['milestone'] = milestone
         
-        return self._make_request('POST', repo_path, data=data)
+        return self._make_request('POST', f"/repos/{self.repo_path}/issues", data=data)
+
+    def iter_issues(
+        self,
+        state: str = 'open',
+        prefetch: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Iterate over issues in repository, page by page
+        
+        Args:
+            state: Issue state ('open', 'closed', 'all')
+            prefetch: Fetch the next page concurrently
+            
+        Yields:
+            Issue data
+        """
+        return self._iter_endpoint(
+            f"/repos/{self.repo_path}/issues",
+            params={'state': state},
+            prefetch=prefetch
+        )
 
     def list_issues(self, state: str = 'open') -> List[Dict]:
         """
-        List issues in repository
+        List issues in repository (all pages)
 
         Args:
             state: Issue state ('open', 'closed', 'all')
@@ -261,21 +563,7 @@ class GiteaClient:
             List of issues
         """
         try:
-            # Build repo path
-            if self.organization:
-                repo_path = f"{self.organization}/{self.repository}"
-            else:
-                # Get current user for personal repos
-                current_user = self.get_current_user()
-                repo_path = f"{current_user['login']}/{self.repository}"
-
-            # List issues
-            endpoint = f"/repos/{repo_path}/issues"
-            params = {'state': state}
-
-            issues = self._make_request('GET', endpoint, params=params)
-
-            return issues if issues else []
+            return list(self.iter_issues(state=state, prefetch=True))
 
         except Exception as e:
             logger.error(f"Failed to list issues: {e}")
@@ -287,7 +575,8 @@ class GiteaClient:
         state: Optional[str] = None,
         title: Optional[str] = None,
         body: Optional[str] = None,
-        assignee: Optional[str] = None
+        assignee: Optional[str] = None,
+        milestone: Optional[int] = None
     ) -> Dict:
         """
         Update an issue in the configured repository
@@ -298,18 +587,12 @@ class GiteaClient:
             title: New title
             body: New body/description
             assignee: New assignee username
+            milestone: New milestone ID
 
         Returns:
             Updated issue data
         """
-        # Build repo path
-        if self.organization:
-            repo_path = f"{self.organization}/{self.repository}"
-        else:
-            user = self.get_current_user()
-            repo_path = f"{user['login']}/{self.repository}"
-
-        endpoint = f"/repos/{repo_path}/issues/{issue_number}"
+        endpoint = f"/repos/{self.repo_path}/issues/{issue_number}"
 
         # Build update data
         data = {}
@@ -321,9 +604,25 @@ class GiteaClient:
             data['body'] = body
         if assignee is not None:
             data['assignee'] = assignee
+        if milestone is not None:
+            data['milestone'] = milestone
 
         return self._make_request('PATCH', endpoint, data=data)
 
+    def add_issue_labels(self, issue_number: int, label_ids: List[int]) -> List[Dict]:
+        """
+        Add labels to an issue (existing labels are kept)
+
+        Args:
+            issue_number: Issue number
+            label_ids: Label IDs to add
+
+        Returns:
+            All labels of the issue
+        """
+        endpoint = f"/repos/{self.repo_path}/issues/{issue_number}/labels"
+
+        return self._make_request('POST', endpoint, data={'labels': label_ids})
 
 
 
@@ -335,29 +634,119 @@ class GiteaClient:
 
 
 
-    def get_current_user(self) -> Dict:
+
+    def get_current_user(self, refresh: bool = False) -> Dict:
         """
         Get current authenticated user
         
+        Fetched once per client and shared by every thread; concurrent
+        first calls wait for a single request.
+        
+        Args:
+            refresh: Fetch it again even if already known
+        
         Returns:
             Current user data
         """
-        return self._make_request('GET', '/user')
+        user = self._current_user
+        if user is not None and not refresh:
+            return user
+        
+        with self._identity_lock:
+            if self._current_user is None or refresh:
+                self._current_user = self._make_request('GET', '/user')
+            return self._current_user
+    
+    @property
+    def repo_owner(self) -> str:
+        """Owner of the configured repository (organization, else token owner)"""
+        return self.organization or self.get_current_user()['login']
+    
+    @property
+    def repo_path(self) -> str:
+        """owner/repository of the configured repository (e.g. 'org/repo')"""
+        return f"{self.repo_owner}/{self.repository}"
+    
+    def iter_labels(self, prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Iterate over labels in repository, page by page
+        
+        Args:
+            prefetch: Fetch the next page concurrently
+            
+        Yields:
+            Label data
+        """
+        endpoint = f"/repos/{self.repo_path}/labels"
+        
+        return self._iter_endpoint(endpoint, prefetch=prefetch)
     
     def list_labels(self) -> List[Dict]:
         """
-        List all labels in repository
+        List all labels in repository (all pages)
         
         Returns:
             List of labels
         """
-        if self.organization:
-            endpoint = f"/repos/{self.organization}/{self.repository}/labels"
-        else:
-            user = self.get_current_user()
-            endpoint = f"/repos/{user['login']}/{self.repository}/labels"
+        return list(self.iter_labels())
+    
+    def iter_milestones(
+        self,
+        state: str = 'all',
+        prefetch: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Iterate over milestones in repository, page by page
+        
+        Args:
+            state: Milestone state ('open', 'closed', 'all')
+            prefetch: Fetch the next page concurrently
+            
+        Yields:
+            Milestone data
+        """
+        endpoint = f"/repos/{self.repo_path}/milestones"
+        
+        return self._iter_endpoint(endpoint, params={'state': state}, prefetch=prefetch)
+    
+    def iter_org_teams(self, org_name: str, prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Iterate over an organization's teams, page by page
+        
+        Args:
+            org_name: Organization name
+            prefetch: Fetch the next page concurrently
+            
+        Yields:
+            Team data
+        """
+        return self._iter_endpoint(f"/orgs/{org_name}/teams", prefetch=prefetch)
+    
+    def iter_org_repos(self, org_name: str, prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Iterate over an organization's repositories, page by page
         
-        return self._make_request('GET', endpoint)
+        Args:
+            org_name: Organization name
+            prefetch: Fetch the next page concurrently
+            
+        Yields:
+            Repository data
+        """
+        return self._iter_endpoint(f"/orgs/{org_name}/repos", prefetch=prefetch)
+    
+    def iter_team_members(self, team_id: int, prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Iterate over a team's members, page by page
+        
+        Args:
+            team_id: Team ID
+            prefetch: Fetch the next page concurrently
+            
+        Yields:
+            User data
+        """
+        return self._iter_endpoint(f"/teams/{team_id}/members", prefetch=prefetch)
     
     def create_label(
         self,
@@ -376,11 +765,7 @@ class GiteaClient:
         Returns:
             Created label data
         """
-        if self.organization:
-            endpoint = f"/repos/{self.organization}/{self.repository}/labels"
-        else:
-            user = self.get_current_user()
-            endpoint = f"/repos/{user['login']}/{self.repository}/labels"
+        endpoint = f"/repos/{self.repo_path}/labels"
         
         # Remove # from color if present
         color = color.lstrip('#')
@@ -401,7 +786,7 @@ class GiteaClient:
             True if connection successful
         """
         try:
-            user = self.get_current_user()
+            user = self.get_current_user(refresh=True)
             logger.info(f"✅ Connected to Gitea as: {user['login']}")
             return True
         except Exception as e:
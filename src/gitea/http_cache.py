@@ -0,0 +1,460 @@
+"""
+Gitea HTTP Cache
+
+Conditional GET cache for read-heavy endpoints (current user, users,
+labels, milestones, issue listings). Response bodies are stored with
+their ETag/Last-Modified validators: a fresh entry (within its TTL) is
+served without a request, a stale one is revalidated with
+If-None-Match/If-Modified-Since and reused on 304. Writes made through
+the client invalidate the cached resource. The cache can be persisted
+to disk so validators survive between runs.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+from requests.structures import CaseInsensitiveDict
+from requests.utils import parse_header_links
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+# Cacheable endpoints and their TTL in seconds: within the TTL an entry
+# is served without a request, afterwards it is revalidated (0 = always
+# revalidate). First matching pattern wins.
+DEFAULT_CACHE_RULES: Dict[str, float] = {
+    '/user': 300,
+    '/users/*': 60,
+    '/repos/*/*/labels': 0,
+    '/repos/*/*/milestones': 0,
+    '/repos/*/*/issues': 0,
+}
+
+# Writes whose effect shows up under another path
+INVALIDATION_ALIASES: List[Tuple[str, str]] = [
+    ('/admin/users', '/users'),
+]
+
+# Response headers kept with a cached body (validators and pagination)
+STORED_HEADERS = ('ETag', 'Last-Modified', 'Link', 'X-Total-Count', 'Content-Type')
+
+SAFE_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+class CachedResponse:
+    """Minimal requests.Response look-alike for a cached body"""
+
+    status_code = 200
+    reason = 'OK'
+    ok = True
+    from_cache = True
+
+    def __init__(self, url: str, headers: Dict[str, str], content: bytes):
+        self.url = url
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+
+    @property
+    def links(self) -> Dict[str, Dict]:
+        """Parsed Link header, keyed by rel (same as requests)"""
+        header = self.headers.get('link')
+        resolved = {}
+
+        if header:
+            for link in parse_header_links(header):
+                resolved[link.get('rel') or link.get('url')] = link
+
+        return resolved
+
+    def json(self) -> Any:
+        return json.loads(self.content) if self.content else None
+
+    def raise_for_status(self):
+        pass
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body and its validators"""
+    url: str
+    path: str
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    stored_at: float = 0.0
+    ttl: float = 0.0
+
+    @property
+    def fresh(self) -> bool:
+        """Still within its TTL (servable without a request)"""
+        return time.time() - self.stored_at < self.ttl
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Conditional request headers for revalidation
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (may be empty)
+        """
+        headers = {}
+        if 'ETag' in self.headers:
+            headers['If-None-Match'] = self.headers['ETag']
+        if 'Last-Modified' in self.headers:
+            headers['If-Modified-Since'] = self.headers['Last-Modified']
+        return headers
+
+    def response(self) -> CachedResponse:
+        return CachedResponse(self.url, self.headers, self.content)
+
+
+class ResponseCache:
+    """
+    Thread-safe conditional GET cache shared by a client's helpers
+
+    Entries are keyed by URL and query parameters, bounded in number
+    (least recently used evicted first). Responses without validators
+    are only kept when their endpoint has a TTL.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, float]] = None,
+        path: Optional[Union[str, Path]] = None,
+        identity: str = "",
+        max_entries: int = 2048
+    ):
+        """
+        Initialize cache
+
+        Args:
+            rules: Endpoint pattern -> TTL in seconds
+                (default: DEFAULT_CACHE_RULES)
+            path: JSON file to load from and save() to (None = memory only)
+            identity: Who the responses belong to (e.g. API token); a
+                persisted cache written for another identity is ignored
+            max_entries: Max cached responses
+        """
+        self.rules = dict(DEFAULT_CACHE_RULES if rules is None else rules)
+        self.path = Path(path) if path else None
+        self.identity = hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]
+        self.max_entries = max_entries
+
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.invalidated = 0
+
+        if self.path is not None:
+            self.load()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Optional[Dict],
+        path: Optional[Union[str, Path]] = None,
+        identity: str = ""
+    ) -> Optional['ResponseCache']:
+        """
+        Build a cache from the gitea.cache section of a project YAML
+
+        Args:
+            config: {enabled, persist, max_entries, ttl: {"/users/*": 60}}
+            path: File used when persist is true
+            identity: Who the responses belong to (e.g. API token)
+
+        Returns:
+            ResponseCache, or None if disabled
+        """
+        config = dict(config or {})
+        if not config.get('enabled', True):
+            return None
+
+        rules = dict(DEFAULT_CACHE_RULES)
+        rules.update(config.get('ttl', {}) or {})
+
+        return cls(
+            rules=rules,
+            path=path if config.get('persist', False) else None,
+            identity=identity,
+            max_entries=config.get('max_entries', 2048)
+        )
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """
+        TTL of an endpoint
+
+        Args:
+            path: Endpoint without /api/v1 and query string
+
+        Returns:
+            TTL in seconds, or None if the endpoint isn't cached
+        """
+        for pattern, ttl in self.rules.items():
+            if fnmatch(path, pattern):
+                return ttl
+        return None
+
+    def key_for(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        params: Optional[Dict] = None
+    ) -> Optional[str]:
+        """
+        Cache key of a request
+
+        Args:
+            method: HTTP method
+            path: Endpoint without /api/v1
+            url: Absolute request URL
+            params: URL query parameters
+
+        Returns:
+            Key, or None if the request isn't cacheable
+        """
+        if method != 'GET' or self.ttl_for(path) is None:
+            return None
+
+        if params:
+            return f"{url}?{urlencode(sorted((str(k), str(v)) for k, v in params.items()))}"
+        return url
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Cached entry for a key (counts a miss if absent)
+
+        Args:
+            key: Cache key (see key_for)
+
+        Returns:
+            CacheEntry or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def hit(self, entry: CacheEntry) -> CachedResponse:
+        """
+        Serve a fresh entry without a request
+
+        Args:
+            entry: Fresh cached entry
+
+        Returns:
+            CachedResponse
+        """
+        with self._lock:
+            self.hits += 1
+        return entry.response()
+
+    def not_modified(self, key: str, entry: CacheEntry, response) -> CachedResponse:
+        """
+        Serve an entry confirmed by a 304 and restart its TTL
+
+        Args:
+            key: Cache key
+            entry: Entry that was revalidated
+            response: The 304 response (may carry updated validators)
+
+        Returns:
+            CachedResponse with the stored body
+        """
+        with self._lock:
+            self.revalidated += 1
+            entry.stored_at = time.time()
+            for name in ('ETag', 'Last-Modified'):
+                if name in response.headers:
+                    entry.headers[name] = response.headers[name]
+            self._dirty = True
+        return entry.response()
+
+    def store(self, key: str, path: str, response) -> bool:
+        """
+        Cache a 200 response
+
+        Args:
+            key: Cache key
+            path: Endpoint without /api/v1
+            response: Response (requests or look-alike)
+
+        Returns:
+            True if the response was cached
+        """
+        if response.status_code != 200:
+            return False
+
+        ttl = self.ttl_for(path) or 0
+        headers = {
+            name: response.headers[name]
+            for name in STORED_HEADERS
+            if name in response.headers
+        }
+
+        with self._lock:
+            # Nothing to revalidate with and no TTL: never reusable
+            if ttl <= 0 and 'ETag' not in headers and 'Last-Modified' not in headers:
+                self._entries.pop(key, None)
+                return False
+
+            self._entries[key] = CacheEntry(
+                url=key,
+                path=path,
+                content=response.content or b'',
+                headers=headers,
+                stored_at=time.time(),
+                ttl=ttl
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+        return True
+
+    def invalidate(self, method: str, path: str) -> int:
+        """
+        Drop entries affected by a write
+
+        An entry is dropped when its path is the written path, lies
+        under it, or contains it (e.g. PATCH /repos/o/r/issues/5 drops
+        the /repos/o/r/issues listing).
+
+        Args:
+            method: HTTP method of the write (safe methods are ignored)
+            path: Endpoint written, without /api/v1
+
+        Returns:
+            Number of entries dropped
+        """
+        if method in SAFE_METHODS:
+            return 0
+
+        paths = [path.rstrip('/')]
+        for prefix, alias in INVALIDATION_ALIASES:
+            if paths[0] == prefix or paths[0].startswith(prefix + '/'):
+                paths.append(alias + paths[0][len(prefix):])
+
+        def affected(entry_path: str) -> bool:
+            return any(
+                entry_path == written
+                or entry_path.startswith(written + '/')
+                or written.startswith(entry_path + '/')
+                for written in paths
+            )
+
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if affected(entry.path)]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self.invalidated += len(stale)
+                self._dirty = True
+
+        return len(stale)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self):
+        """
+        Load entries saved by a previous run (ignored if unreadable)
+
+        Only the validators are trusted across runs: loaded entries are
+        stale, so their first use is a conditional request.
+        """
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable HTTP cache {self.path}: {e}")
+            return
+
+        if data.get('version') != CACHE_FORMAT_VERSION or data.get('identity') != self.identity:
+            logger.debug(f"HTTP cache {self.path} belongs to another token or version, ignoring")
+            return
+
+        with self._lock:
+            for item in data.get('entries', []):
+                self._entries[item['url']] = CacheEntry(
+                    url=item['url'],
+                    path=item['path'],
+                    content=item['content'].encode('utf-8'),
+                    headers=item.get('headers', {}),
+                    ttl=self.ttl_for(item['path']) or 0
+                )
+
+        logger.debug(f"Loaded {len(self._entries)} cached responses from {self.path}")
+
+    def save(self):
+        """Write entries to disk (no-op without a path or changes)"""
+        if self.path is None or not self._dirty:
+            return
+
+        with self._lock:
+            data = {
+                'version': CACHE_FORMAT_VERSION,
+                'identity': self.identity,
+                'entries': [
+                    {
+                        'url': entry.url,
+                        'path': entry.path,
+                        'content': entry.content.decode('utf-8', errors='replace'),
+                        'headers': entry.headers
+                    }
+                    for entry in self._entries.values()
+                ]
+            }
+            self._dirty = False
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+            tmp.write_text(json.dumps(data), encoding='utf-8')
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️  Could not save HTTP cache {self.path}: {e}")
+
+    def as_dict(self) -> Dict[str, int]:
+        """
+        Get cache counters
+
+        Returns:
+            Dict with entries, hits, revalidated, misses and invalidated
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'misses': self.misses,
+                'invalidated': self.invalidated
+            }
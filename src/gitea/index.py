@@ -0,0 +1,287 @@
+"""
+Gitea Remote-State Indexes
+
+In-memory lookups over repository objects, built once per run so that
+syncers don't re-list the repository for every artifact.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import logging
+import re
+import threading
+from typing import ContextManager, Dict, List, Optional, Union
+
+from utils.concurrency import KeyedLock
+
+from .client import GiteaClient
+
+logger = logging.getLogger(__name__)
+
+# Titles of issues created by the story syncer: "Story-001: ..."
+STORY_ID_PATTERN = re.compile(r'^Story-(\d+):')
+
+
+def extract_story_id(text: str) -> Optional[int]:
+    """
+    Extract a BMad story ID from an issue title
+
+    Only titles in the form the story syncer creates are recognized,
+    so hand-written issues that merely mention a story never match.
+
+    Args:
+        text: Issue title (e.g., 'Story-001: Patient Account Creation')
+
+    Returns:
+        Story ID as an integer (e.g., 1) or None
+    """
+    match = STORY_ID_PATTERN.match(text or '')
+    if match:
+        return int(match.group(1))
+    return None
+
+
+class IssueIndex:
+    """
+    Title / story-id / number index over a repository's issues
+
+    Safe to share between sync workers: lookups and updates are locked,
+    and claim(title) serializes check-then-create for a given title.
+    """
+
+    def __init__(self, client: GiteaClient):
+        """
+        Initialize issue index
+
+        Args:
+            client: GiteaClient instance
+        """
+        self.client = client
+        self.loaded = False
+        self._lock = threading.RLock()
+        self._title_locks = KeyedLock()
+        self._by_title: Dict[str, Dict] = {}
+        self._by_story_id: Dict[int, Dict] = {}
+        self._by_number: Dict[int, Dict] = {}
+
+    def load(self, state: str = 'all') -> 'IssueIndex':
+        """
+        (Re)build the index with a single issue listing
+
+        Listing errors propagate and leave the index unloaded: an empty
+        index would make every story look new and create duplicates.
+
+        Args:
+            state: Issue state to index ('open', 'closed', 'all')
+
+        Returns:
+            self
+
+        Raises:
+            GiteaAPIError: If the issues can't be listed
+        """
+        issues = list(self.client.iter_issues(state=state, prefetch=True))
+
+        with self._lock:
+            self._by_title.clear()
+            self._by_story_id.clear()
+            self._by_number.clear()
+
+            for issue in issues:
+                self.add(issue)
+
+            self.loaded = True
+
+        logger.info(f"Indexed {len(self._by_number)} issues")
+
+        return self
+
+    def ensure_loaded(self) -> 'IssueIndex':
+        """Load the index on first use"""
+        with self._lock:
+            if not self.loaded:
+                self.load()
+        return self
+
+    def claim(self, title: str) -> ContextManager[None]:
+        """
+        Hold the per-title lock while checking for and creating an issue
+
+        Args:
+            title: Issue title about to be looked up / created
+        """
+        return self._title_locks.hold(title)
+
+    def add(self, issue: Dict):
+        """
+        Add or refresh an issue in the index
+
+        Args:
+            issue: Issue data as returned by the Gitea API
+        """
+        title = issue.get('title', '')
+        number = issue.get('number')
+        story_id = extract_story_id(title)
+
+        with self._lock:
+            # Keep the first (oldest listed) issue for duplicate titles
+            previous = self._by_number.get(number)
+            if previous is not None and previous.get('title') != title:
+                self._discard(previous)
+
+            if number is not None:
+                self._by_number[number] = issue
+
+            if title not in self._by_title or self._by_title[title].get('number') == number:
+                self._by_title[title] = issue
+
+            if story_id is not None:
+                current = self._by_story_id.get(story_id)
+                if current is None or current.get('number') == number:
+                    self._by_story_id[story_id] = issue
+
+    def _discard(self, issue: Dict):
+        """Drop stale title/story-id entries of a renamed issue"""
+        title = issue.get('title', '')
+        number = issue.get('number')
+
+        if self._by_title.get(title, {}).get('number') == number:
+            del self._by_title[title]
+
+        story_id = extract_story_id(title)
+        if story_id is not None and self._by_story_id.get(story_id, {}).get('number') == number:
+            del self._by_story_id[story_id]
+
+    def get_by_title(self, title: str) -> Optional[Dict]:
+        """Get issue by exact title"""
+        with self._lock:
+            return self._by_title.get(title)
+
+    def get_by_story_id(self, story_id: Union[str, int]) -> Optional[Dict]:
+        """Get issue by BMad story ID ('007', '7' and 7 are the same story)"""
+        with self._lock:
+            return self._by_story_id.get(int(story_id))
+
+    def get_by_number(self, number: int) -> Optional[Dict]:
+        """Get issue by issue number"""
+        with self._lock:
+            return self._by_number.get(number)
+
+    def issues(self) -> List[Dict]:
+        """All indexed issues"""
+        with self._lock:
+            return list(self._by_number.values())
+
+    def __len__(self) -> int:
+        return len(self._by_number)
+
+    def __contains__(self, title: str) -> bool:
+        return title in self._by_title
+
+
+class MilestoneIndex:
+    """
+    Title / id index over a repository's milestones
+
+    Built from one paginated listing and updated as milestones are
+    created, so epic sync needs a single list call per run.
+    """
+
+    def __init__(self, client: GiteaClient):
+        """
+        Initialize milestone index
+
+        Args:
+            client: GiteaClient instance
+        """
+        self.client = client
+        self.loaded = False
+        # Bumped on every change, so derived lookups know to rebuild
+        self.generation = 0
+        self._lock = threading.RLock()
+        self._by_title: Dict[str, Dict] = {}
+        self._by_id: Dict[int, Dict] = {}
+
+    def load(self, state: str = 'all') -> 'MilestoneIndex':
+        """
+        (Re)build the index with a single milestone listing
+
+        Listing errors propagate and leave the index unloaded.
+
+        Args:
+            state: Milestone state to index ('open', 'closed', 'all')
+
+        Returns:
+            self
+
+        Raises:
+            GiteaAPIError: If the milestones can't be listed
+        """
+        milestones = list(self.client.iter_milestones(state=state, prefetch=True))
+
+        with self._lock:
+            self._by_title.clear()
+            self._by_id.clear()
+
+            for milestone in milestones:
+                self.add(milestone)
+
+            self.loaded = True
+            self.generation += 1
+
+        logger.info(f"Indexed {len(self._by_id)} milestones")
+
+        return self
+
+    def ensure_loaded(self) -> 'MilestoneIndex':
+        """Load the index on first use"""
+        with self._lock:
+            if not self.loaded:
+                self.load()
+        return self
+
+    def add(self, milestone: Dict):
+        """
+        Add or refresh a milestone in the index
+
+        Args:
+            milestone: Milestone data as returned by the Gitea API
+        """
+        title = milestone.get('title', '')
+        milestone_id = milestone.get('id')
+
+        with self._lock:
+            previous = self._by_id.get(milestone_id)
+            if previous is not None and previous.get('title') != title:
+                if self._by_title.get(previous.get('title'), {}).get('id') == milestone_id:
+                    del self._by_title[previous.get('title')]
+
+            if milestone_id is not None:
+                self._by_id[milestone_id] = milestone
+
+            # Keep the first (oldest listed) milestone for duplicate titles
+            if title not in self._by_title or self._by_title[title].get('id') == milestone_id:
+                self._by_title[title] = milestone
+
+            self.generation += 1
+
+    def get_by_title(self, title: str) -> Optional[Dict]:
+        """Get milestone by exact title"""
+        with self._lock:
+            return self._by_title.get(title)
+
+    def get_by_id(self, milestone_id: int) -> Optional[Dict]:
+        """Get milestone by id"""
+        with self._lock:
+            return self._by_id.get(milestone_id)
+
+    def milestones(self) -> List[Dict]:
+        """All indexed milestones"""
+        with self._lock:
+            return list(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, title: str) -> bool:
+        return title in self._by_title
@@ -9,21 +9,85 @@ Authors: Khaled Z. & Claude (Anthropic)
 import logging
 from typing import Dict, List, Optional
 from .client import GiteaClient
+from .labels import LabelRegistry
 
 logger = logging.getLogger(__name__)
 
+# Labels every story issue carries
+STORY_LABELS = ['story', 'bmad']
+
+
+def issue_changes(
+    issue: Dict,
+    title: Optional[str] = None,
+    body: Optional[str] = None,
+    assignee: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    state: Optional[str] = None,
+    milestone: Optional[int] = None
+) -> Dict:
+    """
+    Compare an issue (as listed by Gitea) to its desired state
+    
+    Fields left as None are not managed and never reported. Labels are
+    additive: labels set by hand on Gitea are kept.
+    
+    Args:
+        issue: Current issue data
+        title: Desired title
+        body: Desired body
+        assignee: Desired assignee username
+        labels: Label names the issue must carry
+        state: Desired state ('open' or 'closed')
+        milestone: Desired milestone ID
+    
+    Returns:
+        Changed fields: update_issue keyword arguments, plus 'labels'
+        with the label names to add (empty dict when up to date)
+    """
+    changes = {}
+    
+    if title is not None and issue.get('title') != title:
+        changes['title'] = title
+    
+    if body is not None and (issue.get('body') or '').strip() != body.strip():
+        changes['body'] = body
+    
+    if assignee is not None:
+        current = issue.get('assignee') or {}
+        assignees = {user.get('login') for user in issue.get('assignees') or []}
+        if current.get('login') != assignee and assignee not in assignees:
+            changes['assignee'] = assignee
+    
+    if labels:
+        current = {label.get('name') for label in issue.get('labels') or []}
+        missing = [name for name in dict.fromkeys(labels) if name not in current]
+        if missing:
+            changes['labels'] = missing
+    
+    if state is not None and issue.get('state') != state:
+        changes['state'] = state
+    
+    if milestone is not None and (issue.get('milestone') or {}).get('id') != milestone:
+        changes['milestone'] = milestone
+    
+    return changes
+
 
 class GiteaIssues:
     """Manage Gitea issues"""
     
-    def __init__(self, client: GiteaClient):
+    def __init__(self, client: GiteaClient, labels: Optional[LabelRegistry] = None):
         """
         Initialize issues manager
         
         Args:
             client: GiteaClient instance
+            labels: LabelRegistry resolving label names to ids (label
+                names are dropped when omitted)
         """
         self.client = client
+        self.labels = labels
     
     def create_issue(
         self,
@@ -46,11 +110,16 @@ class GiteaIssues:
         Returns:
             Created issue data
         """
+        label_ids = None
+        if labels and self.labels is not None:
+            label_ids = self.labels.ids_for(labels)
+        
         issue = self.client.create_issue(
             title=title,
             body=body,
-            labels=labels,
-            assignee=assignee
+            labels=label_ids,
+            assignee=assignee,
+            milestone=milestone
         )
         
         logger.info(f"Created issue #{issue.get('number')}: {title}")
@@ -60,7 +129,9 @@ class GiteaIssues:
         self,
         story_title: str,
         story_body: str,
-        assignee: str = None
+        assignee: str = None,
+        labels: Optional[List[str]] = None,
+        milestone: Optional[int] = None
     ) -> Dict:
         """
         Create an issue for a BMad story
@@ -69,6 +140,8 @@ class GiteaIssues:
             story_title: Story title
             story_body: Story content/acceptance criteria
             assignee: Gitea username to assign
+            labels: Extra label names from the story
+            milestone: Milestone ID of the story's epic
             
         Returns:
             Created issue data
@@ -76,8 +149,9 @@ class GiteaIssues:
         return self.create_issue(
             title=story_title,
             body=story_body,
-            labels=['story', 'bmad'],
-            assignee=assignee
+            labels=STORY_LABELS + list(labels or []),
+            assignee=assignee,
+            milestone=milestone
         )
     
     def create_epic_tracking_issue(
@@ -109,6 +183,37 @@ class GiteaIssues:
             labels=['epic', 'bmad']
         )
 
+    def apply_changes(self, issue: Dict, changes: Dict) -> Dict:
+        """
+        Push the fields reported by issue_changes
+        
+        Sends one PATCH for the issue fields and one request for the
+        added labels, each only when needed.
+        
+        Args:
+            issue: Current issue data
+            changes: Output of issue_changes
+        
+        Returns:
+            Updated issue data
+        """
+        issue_number = issue['number']
+        fields = {key: value for key, value in changes.items() if key != 'labels'}
+        updated = dict(issue)
+        
+        if fields:
+            updated = self.client.update_issue(issue_number, **fields)
+        
+        label_ids = []
+        if changes.get('labels') and self.labels is not None:
+            label_ids = self.labels.ids_for(changes['labels'])
+        
+        if label_ids:
+            updated['labels'] = self.client.add_issue_labels(issue_number, label_ids)
+        
+        logger.info(f"Updated issue #{issue_number}: {', '.join(sorted(changes))}")
+        return updated
+    
     def close_issue(self, issue_number: int) -> Dict:
         """
         Close an issue
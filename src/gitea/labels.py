@@ -0,0 +1,157 @@
+"""
+Gitea Label Registry
+
+Loads a repository's labels once, creates the missing ones in a single
+reconciliation pass and resolves label names to the ids Gitea expects
+on issues.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional
+from .client import GiteaAPIError, GiteaClient
+
+logger = logging.getLogger(__name__)
+
+# Color for labels found in artifacts but not declared in gitea.labels
+DEFAULT_LABEL_COLOR = "ededed"
+
+
+class LabelRegistry:
+    """
+    Name -> label index over a repository's labels
+
+    Safe to share between sync workers.
+    """
+
+    def __init__(self, client: GiteaClient, definitions: Optional[List[Dict]] = None):
+        """
+        Initialize label registry
+
+        Args:
+            client: GiteaClient instance
+            definitions: Declared labels (gitea.labels in project YAML),
+                dicts with 'name', 'color' and optional 'description'
+        """
+        self.client = client
+        self.definitions = {
+            label['name']: label for label in (definitions or []) if label.get('name')
+        }
+        self.loaded = False
+        self._lock = threading.RLock()
+        self._by_name: Dict[str, Dict] = {}
+
+    def load(self) -> int:
+        """
+        (Re)load all repository labels with a single paginated listing
+
+        Returns:
+            Number of labels indexed
+        """
+        labels = self.client.list_labels()
+
+        with self._lock:
+            self._by_name = {label['name']: label for label in labels}
+            self.loaded = True
+
+        logger.info(f"Indexed {len(labels)} labels")
+        return len(labels)
+
+    def ensure_loaded(self):
+        """Load the registry on first use"""
+        with self._lock:
+            if not self.loaded:
+                self.load()
+
+    def reconcile(self, names: Iterable[str] = (), dry_run: bool = False) -> Dict[str, List[str]]:
+        """
+        Create every declared or requested label missing from the repository
+
+        Args:
+            names: Extra label names (e.g. collected from stories)
+            dry_run: If True, only report what would be created
+
+        Returns:
+            Dict with 'created', 'existing' and 'failed' label names
+        """
+        self.ensure_loaded()
+
+        wanted = list(dict.fromkeys([*self.definitions, *(name for name in names if name)]))
+        summary = {'created': [], 'existing': [], 'failed': []}
+
+        with self._lock:
+            for name in wanted:
+                if name in self._by_name:
+                    summary['existing'].append(name)
+                    continue
+
+                if dry_run:
+                    logger.info(f"DRY RUN: Would create label: {name}")
+                    summary['created'].append(name)
+                    continue
+
+                definition = self.definitions.get(name, {})
+                try:
+                    label = self.client.create_label(
+                        name=name,
+                        color=str(definition.get('color', DEFAULT_LABEL_COLOR)),
+                        description=definition.get('description', '')
+                    )
+                    self._by_name[name] = label
+                    summary['created'].append(name)
+                    logger.info(f"✅ Created label: {name}")
+
+                except GiteaAPIError as e:
+                    logger.warning(f"Could not create label {name}: {e}")
+                    summary['failed'].append(name)
+
+        logger.info(
+            f"Labels reconciled: {len(summary['created'])} created, "
+            f"{len(summary['existing'])} existing, {len(summary['failed'])} failed"
+        )
+        return summary
+
+    def get(self, name: str) -> Optional[Dict]:
+        """
+        Find a label by name
+
+        Args:
+            name: Label name
+
+        Returns:
+            Label data or None
+        """
+        with self._lock:
+            return self._by_name.get(name)
+
+    def ids_for(self, names: Iterable[str]) -> List[int]:
+        """
+        Resolve label names to ids (unknown names are skipped)
+
+        Args:
+            names: Label names
+
+        Returns:
+            Label ids, in name order, without duplicates
+        """
+        ids = []
+
+        with self._lock:
+            for name in dict.fromkeys(names):
+                label = self._by_name.get(name)
+                if label is None:
+                    logger.debug(f"Unknown label skipped: {name}")
+                elif label['id'] not in ids:
+                    ids.append(label['id'])
+
+        return ids
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._by_name)
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return name in self._by_name
@@ -0,0 +1,230 @@
+"""
+Gitea Request Metrics
+
+Per-endpoint call counts, latency histograms, bytes transferred,
+retries and errors for a Gitea client.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import json
+import math
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Path segments replaced by placeholders so that /issues/12 and
+# /issues/13 are reported as one endpoint
+ENDPOINT_TEMPLATES: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r'^/repos/[^/]+/[^/]+'), '/repos/{owner}/{repo}'),
+    (re.compile(r'^/orgs/[^/]+'), '/orgs/{org}'),
+    (re.compile(r'^/users/[^/]+'), '/users/{username}'),
+    (re.compile(r'^/admin/users/[^/]+'), '/admin/users/{username}'),
+    (re.compile(r'/members/[^/]+$'), '/members/{username}'),
+    (re.compile(r'/\d+(?=/|$)'), '/{id}'),
+]
+
+# Histogram buckets: 1 ms to ~10 min, 10% apart
+BUCKET_BASE = 0.001
+BUCKET_GROWTH = 1.1
+BUCKET_COUNT = int(math.log(600 / BUCKET_BASE, BUCKET_GROWTH)) + 1
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Normalize an API path to its endpoint template
+
+    Args:
+        endpoint: Path without the /api/v1 prefix and query string
+            (e.g. '/repos/org/repo/issues/12')
+
+    Returns:
+        Template (e.g. '/repos/{owner}/{repo}/issues/{id}')
+    """
+    template = endpoint.split('?', 1)[0]
+    for pattern, replacement in ENDPOINT_TEMPLATES:
+        template = pattern.sub(replacement, template)
+    return template
+
+
+def payload_size(payload) -> int:
+    """
+    Size of a JSON request body in bytes
+
+    Args:
+        payload: Object sent as JSON (None = no body)
+
+    Returns:
+        Encoded size
+    """
+    if payload is None:
+        return 0
+    return len(json.dumps(payload).encode('utf-8'))
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-scale latency histogram
+
+    Memory stays constant however long the process runs (watch mode);
+    percentiles are accurate to one bucket (10%).
+    """
+
+    def __init__(self):
+        self.buckets = [0] * (BUCKET_COUNT + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def _bucket(seconds: float) -> int:
+        if seconds <= BUCKET_BASE:
+            return 0
+        return min(int(math.log(seconds / BUCKET_BASE, BUCKET_GROWTH)) + 1, BUCKET_COUNT)
+
+    def record(self, seconds: float):
+        """
+        Record one latency
+
+        Args:
+            seconds: Request duration
+        """
+        self.buckets[self._bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """
+        Approximate percentile
+
+        Args:
+            q: Percentile (0-100)
+
+        Returns:
+            Upper bound of the bucket holding the percentile (seconds)
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min(BUCKET_BASE * BUCKET_GROWTH ** index, self.max)
+
+        return self.max
+
+
+class EndpointStats:
+    """Counters of one endpoint template"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.statuses: Dict[str, int] = {}
+        self.latency = LatencyHistogram()
+
+    def as_dict(self) -> Dict:
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'retries': self.retries,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'statuses': dict(self.statuses),
+            'latency': {
+                'total': round(self.latency.total, 6),
+                'mean': round(self.latency.total / self.latency.count, 6) if self.latency.count else 0.0,
+                'p50': round(self.latency.percentile(50), 6),
+                'p95': round(self.latency.percentile(95), 6),
+                'p99': round(self.latency.percentile(99), 6),
+                'max': round(self.latency.max, 6)
+            }
+        }
+
+
+class RequestMetrics:
+    """Thread-safe per-endpoint request metrics"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+
+    def _stats(self, method: str, endpoint: str) -> EndpointStats:
+        key = f"{method.upper()} {endpoint_template(endpoint)}"
+        stats = self._endpoints.get(key)
+        if stats is None:
+            stats = self._endpoints[key] = EndpointStats()
+        return stats
+
+    def record_call(
+        self,
+        method: str,
+        endpoint: str,
+        seconds: float,
+        status: Optional[int] = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0
+    ):
+        """
+        Record one HTTP exchange (each retry attempt counts as a call)
+
+        Args:
+            method: HTTP method
+            endpoint: Path without /api/v1
+            seconds: Time spent on the wire (throttling excluded)
+            status: Response status (None = transport error)
+            bytes_sent: Request body size
+            bytes_received: Response body size
+        """
+        with self._lock:
+            stats = self._stats(method, endpoint)
+            stats.calls += 1
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            status_key = str(status) if status is not None else 'error'
+            stats.statuses[status_key] = stats.statuses.get(status_key, 0) + 1
+            stats.latency.record(seconds)
+
+    def record_retry(self, method: str, endpoint: str):
+        """Record a retry of a request"""
+        with self._lock:
+            self._stats(method, endpoint).retries += 1
+
+    def record_error(self, method: str, endpoint: str):
+        """Record a request that finally failed (raised GiteaAPIError)"""
+        with self._lock:
+            self._stats(method, endpoint).errors += 1
+
+    def totals(self) -> Dict:
+        """Counters summed over all endpoints"""
+        with self._lock:
+            endpoints = list(self._endpoints.values())
+
+        return {
+            'calls': sum(stats.calls for stats in endpoints),
+            'errors': sum(stats.errors for stats in endpoints),
+            'retries': sum(stats.retries for stats in endpoints),
+            'bytes_sent': sum(stats.bytes_sent for stats in endpoints),
+            'bytes_received': sum(stats.bytes_received for stats in endpoints),
+            'seconds': round(sum(stats.latency.total for stats in endpoints), 6)
+        }
+
+    def as_dict(self) -> Dict:
+        """Totals plus per-endpoint counters, busiest endpoints first"""
+        with self._lock:
+            endpoints = {key: stats.as_dict() for key, stats in self._endpoints.items()}
+
+        return {
+            'totals': self.totals(),
+            'endpoints': dict(sorted(
+                endpoints.items(),
+                key=lambda item: item[1]['latency']['total'],
+                reverse=True
+            ))
+        }
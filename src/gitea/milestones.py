@@ -7,12 +7,25 @@ Authors: Khaled Z. & Claude (Anthropic)
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from .client import GiteaClient
 
 logger = logging.getLogger(__name__)
 
 
+def epic_milestone_title(epic_title: str) -> str:
+    """
+    Title of the milestone tracking a BMad epic
+    
+    Args:
+        epic_title: Epic title
+        
+    Returns:
+        Milestone title (e.g., 'Epic: Patient Portal')
+    """
+    return f"Epic: {epic_title}"
+
+
 class GiteaMilestones:
     """Manage Gitea milestones"""
     
@@ -25,6 +38,30 @@ class GiteaMilestones:
         """
         self.client = client
     
+    def iter_milestones(self, state: str = 'all') -> Iterator[Dict]:
+        """
+        Iterate over milestones, page by page
+        
+        Args:
+            state: Milestone state ('open', 'closed', 'all')
+            
+        Yields:
+            Milestone data
+        """
+        return self.client.iter_milestones(state=state)
+    
+    def list_milestones(self, state: str = 'all') -> List[Dict]:
+        """
+        List milestones (all pages)
+        
+        Args:
+            state: Milestone state ('open', 'closed', 'all')
+            
+        Returns:
+            List of milestones
+        """
+        return list(self.iter_milestones(state=state))
+    
     def create_milestone(
         self,
         title: str,
@@ -42,12 +79,7 @@ class GiteaMilestones:
         Returns:
             Created milestone data
         """
-        # Build endpoint
-        if self.client.organization:
-            endpoint = f"/repos/{self.client.organization}/{self.client.repository}/milestones"
-        else:
-            user = self.client.get_current_user()
-            endpoint = f"/repos/{user['login']}/{self.client.repository}/milestones"
+        endpoint = f"/repos/{self.client.repo_path}/milestones"
         
         data = {
             'title': title,
@@ -65,7 +97,8 @@ class GiteaMilestones:
     def create_epic_milestone(
         self,
         epic_title: str,
-        epic_description: str
+        epic_description: str,
+        due_date: Optional[str] = None
     ) -> Dict:
         """
         Create a milestone for a BMad epic
@@ -73,11 +106,13 @@ class GiteaMilestones:
         Args:
             epic_title: Epic title
             epic_description: Epic description
+            due_date: Epic target date (ISO format)
             
         Returns:
             Created milestone data
         """
         return self.create_milestone(
-            title=f"Epic: {epic_title}",
-            description=epic_description
+            title=epic_milestone_title(epic_title),
+            description=epic_description,
+            due_date=due_date
         )
\ No newline at end of file
@@ -7,11 +7,79 @@ Authors: Khaled Z. & Claude (Anthropic)
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Any, Set, Tuple
+
+from utils.concurrency import map_bounded
+
 from .client import GiteaClient, GiteaAPIError
 
 logger = logging.getLogger(__name__)
 
+# Only accounts created by the bridge are removed from teams
+MANAGED_USER_PREFIX = "bmad-"
+
+
+def member_delta(
+    current: Iterable[str],
+    desired: Iterable[str],
+    managed_prefix: Optional[str] = MANAGED_USER_PREFIX
+) -> Tuple[List[str], List[str]]:
+    """
+    Compute team membership changes (usernames compared case-insensitively)
+
+    Args:
+        current: Current member usernames
+        desired: Desired member usernames
+        managed_prefix: Only members with this prefix are removed
+            (None = remove any member not desired)
+
+    Returns:
+        (usernames to add, usernames to remove), sorted
+    """
+    current_by_key = {name.lower(): name for name in current}
+    desired_by_key = {name.lower(): name for name in desired}
+
+    to_add = sorted(
+        name for key, name in desired_by_key.items() if key not in current_by_key
+    )
+    to_remove = sorted(
+        name for key, name in current_by_key.items()
+        if key not in desired_by_key
+        and (managed_prefix is None or key.startswith(managed_prefix.lower()))
+    )
+    return to_add, to_remove
+
+
+@dataclass
+class OrganizationSnapshot:
+    """
+    An organization with its teams and repositories, fetched in bulk
+
+    Kept up to date by GiteaOrganizations as teams and repositories are
+    created or edited, so later phases can reuse it without re-listing.
+    """
+    name: str
+    organization: Optional[Dict[str, Any]] = None
+    teams: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    repositories: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    fetched_at: float = field(default_factory=time.time)
+
+    @property
+    def exists(self) -> bool:
+        """Whether the organization exists"""
+        return self.organization is not None
+
+    def team_id(self, team_name: str) -> Optional[int]:
+        """ID of a team, or None if it doesn't exist"""
+        team = self.teams.get(team_name)
+        return team['id'] if team else None
+
+    def repository(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        """Repository data, or None if it doesn't exist"""
+        return self.repositories.get(repo_name)
+
 
 class GiteaOrganizations:
     """Manage Gitea organizations, teams, and repositories"""
@@ -24,8 +92,62 @@ class GiteaOrganizations:
             client: GiteaClient instance with admin token
         """
         self.client = client
+        self._snapshots: Dict[str, OrganizationSnapshot] = {}
         logger.info("Initialized Gitea organization manager")
 
+    def get_organization(self, org_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get organization data
+
+        Args:
+            org_name: Organization name
+
+        Returns:
+            Organization data or None if not found
+        """
+        try:
+            return self.client.get(f"/api/v1/orgs/{org_name}").json()
+        except GiteaAPIError as e:
+            if '404' in str(e):
+                return None
+            raise
+
+    def snapshot(self, org_name: str, refresh: bool = False) -> OrganizationSnapshot:
+        """
+        Organization, teams and repositories in one bulk fetch
+
+        The snapshot is cached per organization for the lifetime of this
+        manager; pass refresh=True to re-fetch.
+
+        Args:
+            org_name: Organization name
+            refresh: Ignore the cached snapshot
+
+        Returns:
+            OrganizationSnapshot
+        """
+        if org_name in self._snapshots and not refresh:
+            return self._snapshots[org_name]
+
+        snapshot = OrganizationSnapshot(name=org_name)
+        snapshot.organization = self.get_organization(org_name)
+
+        if snapshot.exists:
+            snapshot.teams = self.get_teams(org_name)
+            snapshot.repositories = self.get_repos(org_name)
+
+        logger.info(
+            f"🏢 Loaded {org_name}: {len(snapshot.teams)} teams, "
+            f"{len(snapshot.repositories)} repositories"
+        )
+
+        self._snapshots[org_name] = snapshot
+        return snapshot
+
+    def _cached(self, org_name: str) -> Optional[OrganizationSnapshot]:
+        """Cached snapshot of an organization, if any"""
+        return self._snapshots.get(org_name)
+
     def organization_exists(self, org_name: str) -> bool:
         """
         Check if organization exists
@@ -64,7 +186,34 @@ class GiteaOrganizations:
 
         response = self.client.post("/api/v1/orgs", json=payload)
         logger.info(f"Created organization: {org_name}")
-        return response.json()
+        organization = response.json()
+
+        snapshot = self._cached(org_name)
+        if snapshot:
+            snapshot.organization = organization
+
+        return organization
+
+    def edit_organization(self, org_name: str, **fields) -> Dict[str, Any]:
+        """
+        Edit organization settings (e.g. description)
+
+        Args:
+            org_name: Organization name
+            **fields: Fields to change
+
+        Returns:
+            Organization data from API
+        """
+        response = self.client.patch(f"/api/v1/orgs/{org_name}", json=fields)
+        logger.info(f"Updated organization {org_name}: {', '.join(fields)}")
+        organization = response.json()
+
+        snapshot = self._cached(org_name)
+        if snapshot:
+            snapshot.organization = organization
+
+        return organization
 
     def ensure_organization(self, org_name: str, description: str = "") -> Dict[str, Any]:
         """
@@ -130,7 +279,66 @@ class GiteaOrganizations:
 
         response = self.client.post(f"/api/v1/orgs/{org_name}/teams", json=payload)
         logger.info(f"Created team: {team_name} in {org_name}")
-        return response.json()
+        team = response.json()
+
+        snapshot = self._cached(org_name)
+        if snapshot:
+            snapshot.teams[team_name] = team
+
+        return team
+
+    def edit_team(self, org_name: str, team: Dict[str, Any], **fields) -> Dict[str, Any]:
+        """
+        Edit team settings (description, permission, units, ...)
+
+        Args:
+            org_name: Organization name (for the snapshot cache)
+            team: Current team data
+            **fields: Fields to change
+
+        Returns:
+            Team data from API
+        """
+        payload = {'name': team['name'], **fields}
+        response = self.client.patch(f"/api/v1/teams/{team['id']}", json=payload)
+        logger.info(f"Updated team {team['name']}: {', '.join(fields)}")
+        team = response.json() if response.content else {**team, **fields}
+
+        snapshot = self._cached(org_name)
+        if snapshot:
+            snapshot.teams[team['name']] = team
+
+        return team
+
+    def get_teams(self, org_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Existing teams of an organization, by name (all pages)
+
+        Args:
+            org_name: Organization name
+
+        Returns:
+            Dictionary mapping team name to team data
+        """
+        return {
+            team['name']: team
+            for team in self.client.iter_org_teams(org_name, prefetch=True)
+        }
+
+    def get_repos(self, org_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Existing repositories of an organization, by name (all pages)
+
+        Args:
+            org_name: Organization name
+
+        Returns:
+            Dictionary mapping repository name to repository data
+        """
+        return {
+            repo['name']: repo
+            for repo in self.client.iter_org_repos(org_name, prefetch=True)
+        }
 
     def add_user_to_team(self, team_id: int, username: str) -> bool:
         """
@@ -154,6 +362,112 @@ class GiteaOrganizations:
             logger.error(f"Failed to add {username} to team {team_id}: {e}")
             raise
 
+    def remove_user_from_team(self, team_id: int, username: str) -> bool:
+        """
+        Remove a user from a team
+
+        Args:
+            team_id: Team ID
+            username: Username to remove
+
+        Returns:
+            True if successful
+
+        Raises:
+            GiteaAPIError: If removal fails
+        """
+        try:
+            self.client.delete(f"/api/v1/teams/{team_id}/members/{username}")
+            logger.debug(f"Removed {username} from team {team_id}")
+            return True
+        except GiteaAPIError as e:
+            logger.error(f"Failed to remove {username} from team {team_id}: {e}")
+            raise
+
+    def get_team_members(self, team_id: int) -> Set[str]:
+        """
+        Usernames of a team's current members (all pages)
+
+        Args:
+            team_id: Team ID
+
+        Returns:
+            Set of usernames
+        """
+        return {
+            member['login']
+            for member in self.client.iter_team_members(team_id, prefetch=True)
+        }
+
+    def reconcile_team_members(
+        self,
+        team_id: int,
+        usernames: Iterable[str],
+        workers: int = 1,
+        prune: bool = False,
+        managed_prefix: Optional[str] = MANAGED_USER_PREFIX
+    ) -> Dict[str, Any]:
+        """
+        Make a team's membership match the desired usernames
+
+        Lists the members once, then applies only the additions and
+        removals, at most `workers` at a time. An unchanged team costs a
+        single list call.
+
+        Args:
+            team_id: Team ID
+            usernames: Desired member usernames
+            workers: Max concurrent membership changes
+            prune: Also remove members that are not desired (off by
+                default: only additions are made)
+            managed_prefix: Only members with this prefix are pruned
+                (None = prune any member)
+
+        Returns:
+            Dictionary with added/removed/unchanged/failed counts and
+            elapsed seconds
+        """
+        started = time.monotonic()
+        usernames = list(usernames)
+
+        current = self.get_team_members(team_id)
+        to_add, to_remove = member_delta(current, usernames, managed_prefix)
+        if not prune:
+            to_remove = []
+
+        changes: List[Tuple[Callable[[int, str], bool], str]] = (
+            [(self.add_user_to_team, name) for name in to_add]
+            + [(self.remove_user_from_team, name) for name in to_remove]
+        )
+
+        def apply(change) -> bool:
+            operation, username = change
+            try:
+                return operation(team_id, username)
+            except GiteaAPIError:
+                return False
+
+        outcomes = map_bounded(apply, changes, workers=workers)
+
+        added_ok = outcomes[:len(to_add)]
+        removed_ok = outcomes[len(to_add):]
+
+        results = {
+            "added": sum(added_ok),
+            "removed": sum(removed_ok),
+            "unchanged": len({name.lower() for name in usernames} & {name.lower() for name in current}),
+            "failed": outcomes.count(False),
+            "elapsed": time.monotonic() - started
+        }
+
+        logger.info(
+            f"Team {team_id}: +{results['added']} -{results['removed']} "
+            f"={results['unchanged']} members"
+            + (f", {results['failed']} failed" if results['failed'] else "")
+            + f" ({results['elapsed']:.2f}s)"
+        )
+        return results
+
     def add_users_to_team(self, team_id: int, usernames: List[str]) -> Dict[str, int]:
         """
         Add multiple users to a team
@@ -210,4 +524,32 @@ class GiteaOrganizations:
 
         response = self.client.post(f"/api/v1/orgs/{org_name}/repos", json=payload)
         logger.info(f"Created repository: {org_name}/{repo_name}")
-        return response.json()
+        repository = response.json()
+
+        snapshot = self._cached(org_name)
+        if snapshot:
+            snapshot.repositories[repo_name] = repository
+
+        return repository
+
+    def edit_repo(self, org_name: str, repo_name: str, **fields) -> Dict[str, Any]:
+        """
+        Edit repository settings (description, private, ...)
+
+        Args:
+            org_name: Organization name
+            repo_name: Repository name
+            **fields: Fields to change
+
+        Returns:
+            Repository data from API
+        """
+        response = self.client.patch(f"/api/v1/repos/{org_name}/{repo_name}", json=fields)
+        logger.info(f"Updated repository {org_name}/{repo_name}: {', '.join(fields)}")
+        repository = response.json()
+
+        snapshot = self._cached(org_name)
+        if snapshot:
+            snapshot.repositories[repo_name] = repository
+
+        return repository
@@ -0,0 +1,116 @@
+"""
+Gitea Pagination
+
+Lazy page-by-page iteration over Gitea list endpoints.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Gitea's default MAX_RESPONSE_ITEMS
+DEFAULT_PAGE_SIZE = 50
+
+
+def has_next_page(
+    response: requests.Response,
+    items: List[Any],
+    seen: int
+) -> bool:
+    """
+    Decide whether another page follows
+
+    Prefers the Link header, then X-Total-Count. Without either, keeps
+    going until an empty page: the server may cap the page size below
+    the requested limit, so a short page doesn't prove it's the last.
+
+    Args:
+        response: Response of the current page
+        items: Items of the current page
+        seen: Items yielded so far, including this page
+
+    Returns:
+        True if the next page should be fetched
+    """
+    if not items:
+        return False
+
+    if 'Link' in response.headers:
+        return 'next' in response.links
+
+    total = response.headers.get('X-Total-Count')
+    if total is not None:
+        try:
+            return seen < int(total)
+        except ValueError:
+            pass
+
+    return True
+
+
+def paginate(
+    fetch_page: Callable[[int, int], requests.Response],
+    limit: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = False
+) -> Iterator[Dict]:
+    """
+    Iterate over all items of a paginated endpoint
+
+    Pages are fetched lazily; with prefetch, page N+1 is requested in a
+    background thread while the caller consumes page N.
+
+    Args:
+        fetch_page: Callable(page, limit) returning the page's Response
+        limit: Page size to request
+        prefetch: Fetch the next page concurrently
+
+    Yields:
+        Items from every page, in order
+    """
+    executor: Optional[ThreadPoolExecutor] = None
+    pending = None
+
+    if prefetch:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gitea-page')
+
+    try:
+        page = 1
+        seen = 0
+        response = fetch_page(page, limit)
+
+        while True:
+            items = response.json() if response.content else []
+            items = items or []
+            seen += len(items)
+
+            has_next = has_next_page(response, items, seen)
+
+            if has_next and executor is not None:
+                pending = executor.submit(fetch_page, page + 1, limit)
+
+            for item in items:
+                yield item
+
+            if not has_next:
+                break
+
+            page += 1
+            if pending is not None:
+                response = pending.result()
+                pending = None
+            else:
+                response = fetch_page(page, limit)
+
+        logger.debug(f"Paginated {seen} items over {page} page(s)")
+
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,251 @@
+"""
+Gitea Retry Policy
+
+Retries transient Gitea API failures (connection errors, 429, 502-504)
+with jittered exponential backoff, honouring Retry-After, without
+blindly replaying non-idempotent requests.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from email.utils import parsedate_to_datetime
+from fnmatch import fnmatch
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+# Statuses meaning "try again later"
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Statuses where the server refused the request without processing it,
+# so even a POST can safely be replayed
+NOT_PROCESSED_STATUSES = frozenset({429})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value (delay in seconds or HTTP date)
+
+    Returns:
+        Delay in seconds, or None if absent/invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def _request_not_sent(error: requests.exceptions.RequestException) -> bool:
+    """True if the error happened before the request reached the server"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        reason = getattr(error.args[0], 'reason', error.args[0])
+        return isinstance(reason, NewConnectionError)
+
+    return False
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry settings for a class of requests"""
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_after_max: float = 300.0
+    retry_statuses: FrozenSet[int] = RETRY_STATUSES
+    idempotent_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in self.idempotent_methods
+
+    def should_retry_status(self, method: str, status: int, attempt: int) -> bool:
+        """
+        Decide whether a response status warrants another attempt
+
+        Args:
+            method: HTTP method
+            status: Response status code
+            attempt: Attempt number that produced the response (1-based)
+
+        Returns:
+            True to retry
+        """
+        if attempt >= self.max_attempts or status not in self.retry_statuses:
+            return False
+
+        return self.is_idempotent(method) or status in NOT_PROCESSED_STATUSES
+
+    def should_retry_error(
+        self,
+        method: str,
+        error: requests.exceptions.RequestException,
+        attempt: int
+    ) -> bool:
+        """
+        Decide whether a transport error warrants another attempt
+
+        Args:
+            method: HTTP method
+            error: Exception raised by requests
+            attempt: Attempt number that failed (1-based)
+
+        Returns:
+            True to retry
+        """
+        if not isinstance(error, (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError
+        )):
+            return False
+
+        return self.should_retry_transport(method, attempt, _request_not_sent(error))
+
+    def should_retry_transport(self, method: str, attempt: int, not_sent: bool) -> bool:
+        """
+        Decide whether a transient transport failure warrants another attempt
+
+        Args:
+            method: HTTP method
+            attempt: Attempt number that failed (1-based)
+            not_sent: True if the request never reached the server
+
+        Returns:
+            True to retry
+        """
+        if attempt >= self.max_attempts:
+            return False
+
+        return self.is_idempotent(method) or not_sent
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Delay before the next attempt
+
+        Args:
+            attempt: Attempt number that just failed (1-based)
+            retry_after: Retry-After header of the response, if any
+
+        Returns:
+            Seconds to wait
+        """
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.retry_after_max)
+
+        # Exponential backoff with "equal jitter"
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+class RetryStats:
+    """Thread-safe retry/failure counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.failures = 0
+        self.throttled = 0
+        self.by_reason: Dict[str, int] = {}
+
+    def record_retry(self, reason: str):
+        with self._lock:
+            self.retries += 1
+            if reason == '429':
+                self.throttled += 1
+            self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def as_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'retries': self.retries,
+                'failures': self.failures,
+                'throttled': self.throttled,
+                'by_reason': dict(self.by_reason)
+            }
+
+
+@dataclass
+class RetryPolicies:
+    """Default policy plus per-endpoint overrides ("METHOD /path/glob")"""
+    default: RetryPolicy = field(default_factory=RetryPolicy)
+    overrides: List[Tuple[str, str, RetryPolicy]] = field(default_factory=list)
+
+    def set_override(self, pattern: str, policy: RetryPolicy):
+        """
+        Override the policy for matching endpoints
+
+        Args:
+            pattern: "METHOD /path/glob" (e.g. "POST /repos/*/issues")
+                or just "/path/glob" for every method
+            policy: Policy to apply
+        """
+        method, _, path = pattern.strip().rpartition(' ')
+        self.overrides.insert(0, ((method or '*').upper(), path, policy))
+
+    def policy_for(self, method: str, endpoint: str) -> RetryPolicy:
+        """
+        Find the policy for a request (latest matching override wins)
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path (e.g. /repos/org/repo/issues)
+
+        Returns:
+            RetryPolicy
+        """
+        for override_method, path, policy in self.overrides:
+            if override_method in ('*', method.upper()) and fnmatch(endpoint, path):
+                return policy
+        return self.default
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> 'RetryPolicies':
+        """
+        Build policies from the gitea.retry section of a project YAML
+
+        Args:
+            config: {max_attempts, backoff_base, backoff_max,
+                endpoints: {"POST /admin/users": {max_attempts: 1}}}
+
+        Returns:
+            RetryPolicies
+        """
+        config = dict(config or {})
+        endpoints = config.pop('endpoints', {}) or {}
+
+        default = replace(RetryPolicy(), **config)
+        policies = cls(default=default)
+
+        for pattern, overrides in endpoints.items():
+            policies.set_override(pattern, replace(default, **(overrides or {})))
+
+        return policies
@@ -0,0 +1,159 @@
+"""
+Gitea Request Throttle
+
+Client-side pacing for Gitea API calls: a token-bucket rate limiter
+plus a cap on requests in flight, shared by everything that uses one
+GiteaClient.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Waits shorter than this are not counted as throttling
+THROTTLE_EPSILON = 0.001
+
+
+class TokenBucket:
+    """Token-bucket rate limiter (thread-safe)"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize bucket
+
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket capacity (default: one second worth, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError(f"Invalid rate limit: {rate}. Must be > 0")
+
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1.0, self.rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    def reserve(self) -> float:
+        """
+        Reserve one token without sleeping
+
+        Tokens are reserved up front, so concurrent callers queue fairly
+        instead of racing for the next refill.
+
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class RequestThrottle:
+    """Rate limit + max-in-flight governor with throttling stats"""
+
+    def __init__(
+        self,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize throttle
+
+        Args:
+            rate_limit: Max requests per second (None = unlimited)
+            burst: Requests allowed back-to-back before pacing kicks in
+            max_concurrency: Max requests in flight (None = unlimited)
+        """
+        self.rate_limit = rate_limit
+        self.max_concurrency = max_concurrency
+
+        self._bucket = TokenBucket(rate_limit, burst) if rate_limit else None
+        self._semaphore = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        )
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._bucket is not None or self._semaphore is not None
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a request slot: waits for concurrency and rate budget"""
+        start = time.monotonic()
+
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+
+        try:
+            if self._bucket is not None:
+                self._bucket.acquire()
+
+            self._enter(time.monotonic() - start)
+            try:
+                yield
+            finally:
+                self._exit()
+
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    def _enter(self, waited: float):
+        """Account for a request that got its slot after `waited` seconds"""
+        with self._lock:
+            self.requests += 1
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+            if waited > THROTTLE_EPSILON:
+                self.throttled_requests += 1
+                self.throttled_seconds += waited
+
+    def _exit(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def as_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'rate_limit': self.rate_limit,
+                'max_concurrency': self.max_concurrency,
+                'requests': self.requests,
+                'throttled_requests': self.throttled_requests,
+                'throttled_seconds': round(self.throttled_seconds, 3),
+                'peak_in_flight': self.peak_in_flight
+            }
@@ -6,12 +6,16 @@ Parse BMad artifact files (epics, stories, architecture, etc.)
 Authors: Khaled Z. & Claude (Anthropic)
 """
 
-from .base_parser import BaseParser
+from .base_parser import BaseParser, ListItem, MarkdownDocument
 from .epic_parser import EpicParser
 from .story_parser import StoryParser
+from .bulk import parse_many
 
 __all__ = [
     "BaseParser",
+    "ListItem",
+    "MarkdownDocument",
     "EpicParser",
     "StoryParser",
+    "parse_many",
 ]
\ No newline at end of file
@@ -6,14 +6,112 @@ Abstract base class for all BMad file parsers.
 Authors: Khaled Z. & Claude (Anthropic)
 """
 
+import hashlib
+import io
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 import logging
 
+import yaml
+
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used by tokenize()
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+TITLE_PATTERN = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+SECTION_PATTERN = re.compile(r'^##\s+(.+?)$', re.MULTILINE)
+LIST_ITEM_PATTERN = re.compile(r'^\s*([-*]|\d+\.)\s+(.+)$', re.MULTILINE)
+CHECKBOX_PATTERN = re.compile(r'^\[([ x])\]\s+(.+)$')
+
+
+def scan_list_items(text: str) -> List['ListItem']:
+    """
+    Collect bullet, numbered and checkbox items of a section
+
+    Args:
+        text: Section content
+
+    Returns:
+        List items in document order
+    """
+    items = []
+
+    for match in LIST_ITEM_PATTERN.finditer(text):
+        marker, item_text = match.groups()
+        item = ListItem(text=item_text, marker=marker)
+
+        if not marker[0].isdigit():
+            checkbox = CHECKBOX_PATTERN.match(item_text)
+            if checkbox:
+                item.checked = checkbox.group(1) == 'x'
+                item.checkbox_text = checkbox.group(2)
+
+        items.append(item)
+
+    return items
+
+
+@dataclass
+class ListItem:
+    """A markdown list item"""
+    text: str
+    marker: str  # '-', '*' or 'N.'
+    checked: Optional[bool] = None  # None unless '- [ ]' / '- [x]'
+    checkbox_text: str = ""  # text after the checkbox, if any
+
+    @property
+    def numbered(self) -> bool:
+        return self.marker[0].isdigit()
+
+
+@dataclass
+class MarkdownDocument:
+    """
+    Result of a single scan over a markdown file
+
+    List items are scanned per section on first request and cached.
+    """
+    title: Optional[str] = None
+    frontmatter: Optional[Dict] = None
+    sections: Dict[str, str] = field(default_factory=dict)
+    items: Dict[str, List[ListItem]] = field(default_factory=dict)
+
+    def section(self, *names: str) -> str:
+        """
+        Get content of the first existing section among names
+
+        Args:
+            *names: Section titles in order of preference
+
+        Returns:
+            Section content or empty string
+        """
+        for name in names:
+            if name in self.sections:
+                return self.sections[name]
+        return ''
+
+    def section_items(self, *names: str) -> List[ListItem]:
+        """
+        Get list items of the first existing section among names
+
+        Args:
+            *names: Section titles in order of preference
+
+        Returns:
+            List items (empty if no such section)
+        """
+        for name in names:
+            if name in self.sections:
+                if name not in self.items:
+                    self.items[name] = scan_list_items(self.sections[name])
+                return self.items[name]
+        return []
+
 
 class BaseParser(ABC):
     """Base class for parsing BMad artifact files"""
@@ -28,6 +126,10 @@ class BaseParser(ABC):
         self.file_path = Path(file_path)
         self.content = ""
         self.parsed_data: Dict[str, Any] = {}
+        # (content_hash, mtime, size) of the content actually read
+        self.fingerprint: Optional[Tuple[str, float, int]] = None
+        self._document: Optional[MarkdownDocument] = None
+        self._document_source: Optional[str] = None
         
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
@@ -36,17 +138,69 @@ class BaseParser(ABC):
         """
         Read file content
         
+        Also captures the fingerprint of what was read: stat is taken
+        before reading, so a concurrent edit can only make the recorded
+        mtime older than the content (forcing a re-hash), never newer.
+        
         Returns:
             File content as string
         """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                self.content = f.read()
+            with open(self.file_path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                raw = f.read()
+            self.content = io.TextIOWrapper(io.BytesIO(raw), encoding='utf-8').read()
+            self.fingerprint = (hashlib.sha256(raw).hexdigest(), stat.st_mtime, stat.st_size)
             return self.content
         except Exception as e:
             logger.error(f"Error reading file {self.file_path}: {e}")
             raise
     
+    def tokenize(self) -> MarkdownDocument:
+        """
+        Scan the content once into title, frontmatter, sections and lists
+        
+        The result is cached until the content changes.
+        
+        Returns:
+            MarkdownDocument
+        """
+        if self._document is not None and self._document_source is self.content:
+            return self._document
+        
+        content = self.content
+        document = MarkdownDocument()
+        
+        # YAML frontmatter (only possible at the very start)
+        if content.startswith('---'):
+            match = FRONTMATTER_PATTERN.match(content)
+            if match:
+                try:
+                    document.frontmatter = yaml.safe_load(match.group(1))
+                except Exception as e:
+                    logger.warning(f"Failed to parse YAML frontmatter: {e}")
+        
+        # Title: first "# " heading anywhere
+        match = TITLE_PATTERN.search(content)
+        if match:
+            document.title = match.group(1).strip()
+        
+        # Sections: one split on "## " headings
+        parts = SECTION_PATTERN.split(content)
+        
+        intro = parts[0].strip()
+        if intro:
+            document.sections['_intro'] = intro
+        
+        for i in range(1, len(parts) - 1, 2):
+            section_title = parts[i].strip()
+            document.sections[section_title] = parts[i + 1].strip()
+        
+        self._document = document
+        self._document_source = content
+        
+        return document
+    
     def extract_yaml_frontmatter(self) -> Optional[Dict]:
         """
         Extract YAML frontmatter if present
@@ -54,19 +208,7 @@ class BaseParser(ABC):
         Returns:
             Frontmatter as dict or None
         """
-        pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.match(pattern, self.content, re.DOTALL)
-        
-        if match:
-            try:
-                import yaml
-                frontmatter = yaml.safe_load(match.group(1))
-                return frontmatter
-            except Exception as e:
-                logger.warning(f"Failed to parse YAML frontmatter: {e}")
-                return None
-        
-        return None
+        return self.tokenize().frontmatter
     
     def extract_title(self) -> str:
         """
@@ -75,11 +217,10 @@ class BaseParser(ABC):
         Returns:
             Title or filename if not found
         """
-        pattern = r'^#\s+(.+)$'
-        match = re.search(pattern, self.content, re.MULTILINE)
+        title = self.tokenize().title
         
-        if match:
-            return match.group(1).strip()
+        if title is not None:
+            return title
         
         # Fallback to filename
         return self.file_path.stem
@@ -91,24 +232,7 @@ class BaseParser(ABC):
         Returns:
             Dict of section_title: content
         """
-        sections = {}
-        
-        # Split by ## headings
-        pattern = r'^##\s+(.+?)$'
-        parts = re.split(pattern, self.content, flags=re.MULTILINE)
-        
-        # First part is before any ## heading
-        if parts[0].strip():
-            sections['_intro'] = parts[0].strip()
-        
-        # Process section pairs (heading, content)
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                section_title = parts[i].strip()
-                section_content = parts[i + 1].strip()
-                sections[section_title] = section_content
-        
-        return sections
+        return self.tokenize().sections
     
     @abstractmethod
     def parse(self) -> Dict[str, Any]:
@@ -0,0 +1,162 @@
+"""
+Bulk Parser
+
+Parse many BMad artifact files at once, fanning out across a process
+pool for large trees.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .epic_parser import EpicParser
+from .story_parser import StoryParser
+
+logger = logging.getLogger(__name__)
+
+PARSERS = {
+    'epic': EpicParser,
+    'story': StoryParser,
+}
+
+# Below this many bytes in total, a pool costs more than it saves
+SERIAL_THRESHOLD_BYTES = 256 * 1024
+
+# Smallest amount of markdown shipped to a worker in one task
+MIN_CHUNK_BYTES = 64 * 1024
+
+
+def _parse_one(kind: str, file_path: str) -> Dict[str, Any]:
+    """
+    Parse one file into a compact picklable record
+
+    Args:
+        kind: 'epic' or 'story'
+        file_path: File to parse
+
+    Returns:
+        Parsed data with file_path as str, or {'file_path', 'error'}
+    """
+    try:
+        data = PARSERS[kind](file_path).parse()
+        return {**data, 'file_path': str(file_path)}
+    except Exception as e:
+        return {'file_path': str(file_path), 'error': str(e)}
+
+
+def _parse_chunk(kind: str, file_paths: List[str]) -> List[Dict[str, Any]]:
+    """Worker entry point: parse a chunk of files in order"""
+    return [_parse_one(kind, file_path) for file_path in file_paths]
+
+
+def _chunk_by_size(
+    file_paths: List[str],
+    sizes: List[int],
+    workers: int
+) -> List[List[str]]:
+    """
+    Group files into chunks of similar total size
+
+    Aims for ~4 chunks per worker for load balancing, but never below
+    MIN_CHUNK_BYTES so that small files are batched into one task.
+
+    Args:
+        file_paths: Files to parse
+        sizes: File sizes in bytes
+        workers: Number of worker processes
+
+    Returns:
+        List of chunks, preserving input order
+    """
+    target = max(MIN_CHUNK_BYTES, sum(sizes) // (workers * 4) + 1)
+
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    current_bytes = 0
+
+    for file_path, size in zip(file_paths, sizes):
+        current.append(file_path)
+        current_bytes += size
+        if current_bytes >= target:
+            chunks.append(current)
+            current = []
+            current_bytes = 0
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def parse_many(
+    file_paths: Iterable[Path],
+    kind: str = 'story',
+    workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Parse many artifact files, in parallel when worthwhile
+
+    Args:
+        file_paths: Files to parse
+        kind: 'epic' or 'story'
+        workers: Worker processes (None = CPU count, 1 = in-process)
+
+    Returns:
+        One record per file, in input order. Failed files yield
+        {'file_path': str, 'error': str} instead of parsed data.
+    """
+    if kind not in PARSERS:
+        raise ValueError(f"Unknown artifact kind: {kind}")
+
+    file_paths = [str(file_path) for file_path in file_paths]
+    workers = workers or os.cpu_count() or 1
+
+    sizes = []
+    for file_path in file_paths:
+        try:
+            sizes.append(os.path.getsize(file_path))
+        except OSError:
+            sizes.append(0)
+
+    if workers <= 1 or len(file_paths) < 2 or sum(sizes) < SERIAL_THRESHOLD_BYTES:
+        return _parse_chunk(kind, file_paths)
+
+    chunks = _chunk_by_size(file_paths, sizes, workers)
+    workers = min(workers, len(chunks))
+
+    logger.info(
+        f"Parsing {len(file_paths)} {kind} files "
+        f"in {len(chunks)} chunks across {workers} processes"
+    )
+
+    records: List[Dict[str, Any]] = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_records in executor.map(_parse_chunk, [kind] * len(chunks), chunks):
+            records.extend(chunk_records)
+
+    return records
+
+
+def parse_many_by_path(
+    file_paths: Sequence[Path],
+    kind: str = 'story',
+    workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Same as parse_many, keyed by file path (str)
+
+    Args:
+        file_paths: Files to parse
+        kind: 'epic' or 'story'
+        workers: Worker processes (None = CPU count, 1 = in-process)
+
+    Returns:
+        Dict of file path -> record
+    """
+    records = parse_many(file_paths, kind=kind, workers=workers)
+    return {record['file_path']: record for record in records}
@@ -14,6 +14,8 @@ from .base_parser import BaseParser
 
 logger = logging.getLogger(__name__)
 
+CHECKBOX_SYNTAX_PATTERN = re.compile(r'\[[ x]\]\s*')
+
 
 class EpicParser(BaseParser):
     """Parse BMad epic markdown files"""
@@ -30,16 +32,18 @@ class EpicParser(BaseParser):
                 'stories': List[str],
                 'acceptance_criteria': List[str],
                 'sections': Dict[str, str],
-                'file_path': Path
+                'file_path': Path,
+                'fingerprint': (content_hash, mtime, size)
             }
         """
-        # Read file
+        # Read file and scan it once
         self.read_file()
+        document = self.tokenize()
         
         # Extract basic info
         title = self.extract_title()
-        frontmatter = self.extract_yaml_frontmatter()
-        sections = self.extract_sections()
+        frontmatter = document.frontmatter
+        sections = document.sections
         
         # Extract description (intro or first section)
         description = sections.get('_intro', '')
@@ -60,7 +64,8 @@ class EpicParser(BaseParser):
             'acceptance_criteria': acceptance_criteria,
             'sections': sections,
             'frontmatter': frontmatter,
-            'file_path': self.file_path
+            'file_path': self.file_path,
+            'fingerprint': self.fingerprint
         }
         
         logger.info(f"Parsed epic: {title} ({len(stories)} stories)")
@@ -74,25 +79,14 @@ class EpicParser(BaseParser):
         Returns:
             List of story titles/IDs
         """
-        stories = []
-        
-        # Look for stories section
-        sections = self.extract_sections()
-        stories_section = sections.get('Stories', sections.get('User Stories', ''))
-        
-        if not stories_section:
-            return stories
-        
-        # Extract list items
-        pattern = r'^\s*[-*]\s+(.+)$'
-        matches = re.findall(pattern, stories_section, re.MULTILINE)
-        
-        for match in matches:
-            # Clean up checkbox syntax if present
-            story = re.sub(r'\[[ x]\]\s*', '', match).strip()
-            stories.append(story)
-        
-        return stories
+        items = self.tokenize().section_items('Stories', 'User Stories')
+        
+        # Bullet items only, with checkbox syntax cleaned up
+        return [
+            CHECKBOX_SYNTAX_PATTERN.sub('', item.text).strip()
+            for item in items
+            if not item.numbered
+        ]
     
     def _extract_acceptance_criteria(self) -> List[str]:
         """
@@ -101,18 +95,7 @@ class EpicParser(BaseParser):
         Returns:
             List of acceptance criteria
         """
-        criteria = []
-        
-        sections = self.extract_sections()
-        ac_section = sections.get('Acceptance Criteria', sections.get('AC', ''))
-        
-        if not ac_section:
-            return criteria
-        
-        # Extract list items
-        pattern = r'^\s*[-*]\s+(.+)$'
-        matches = re.findall(pattern, ac_section, re.MULTILINE)
-        
-        criteria = [match.strip() for match in matches]
+        items = self.tokenize().section_items('Acceptance Criteria', 'AC')
         
-        return criteria
\ No newline at end of file
+        # Bullet items only
+        return [item.text.strip() for item in items if not item.numbered]
@@ -14,6 +14,9 @@ from .base_parser import BaseParser
 
 logger = logging.getLogger(__name__)
 
+STORY_ID_PATTERN = re.compile(r'story-(\d+)')
+EPIC_REFERENCE_PATTERN = re.compile(r'Epic:\s*(.+?)(?:\n|$)')
+
 
 class StoryParser(BaseParser):
     """Parse BMad story markdown files"""
@@ -33,16 +36,18 @@ class StoryParser(BaseParser):
                 'epic': str,
                 'assignee': str,
                 'sections': Dict[str, str],
-                'file_path': Path
+                'file_path': Path,
+                'fingerprint': (content_hash, mtime, size)
             }
         """
-        # Read file
+        # Read file and scan it once
         self.read_file()
+        document = self.tokenize()
         
         # Extract basic info
         title = self.extract_title()
-        frontmatter = self.extract_yaml_frontmatter()
-        sections = self.extract_sections()
+        frontmatter = document.frontmatter
+        sections = document.sections
         
         # Extract story ID from filename (e.g., story-001.md -> 001)
         story_id = self._extract_story_id()
@@ -75,7 +80,8 @@ class StoryParser(BaseParser):
             'assignee': assignee,
             'sections': sections,
             'frontmatter': frontmatter,
-            'file_path': self.file_path
+            'file_path': self.file_path,
+            'fingerprint': self.fingerprint
         }
         
         logger.info(f"Parsed story: {story_id} - {title}")
@@ -90,8 +96,7 @@ class StoryParser(BaseParser):
             Story ID (e.g., '001', '042')
         """
         # Pattern: story-NNN.md or story-NNN-name.md
-        pattern = r'story-(\d+)'
-        match = re.search(pattern, self.file_path.name)
+        match = STORY_ID_PATTERN.search(self.file_path.name)
         
         if match:
             return match.group(1)
@@ -106,21 +111,10 @@ class StoryParser(BaseParser):
         Returns:
             List of acceptance criteria
         """
-        criteria = []
-        
-        sections = self.extract_sections()
-        ac_section = sections.get('Acceptance Criteria', sections.get('AC', ''))
-        
-        if not ac_section:
-            return criteria
+        # List items or numbered items
+        items = self.tokenize().section_items('Acceptance Criteria', 'AC')
         
-        # Extract list items or numbered items
-        pattern = r'^\s*(?:[-*]|\d+\.)\s+(.+)$'
-        matches = re.findall(pattern, ac_section, re.MULTILINE)
-        
-        criteria = [match.strip() for match in matches]
-        
-        return criteria
+        return [item.text.strip() for item in items]
     
     def _extract_tasks(self) -> List[Dict[str, Any]]:
         """
@@ -129,25 +123,17 @@ class StoryParser(BaseParser):
         Returns:
             List of task dictionaries
         """
-        tasks = []
-        
-        sections = self.extract_sections()
-        tasks_section = sections.get('Tasks', sections.get('Implementation', ''))
+        items = self.tokenize().section_items('Tasks', 'Implementation')
         
-        if not tasks_section:
-            return tasks
-        
-        # Extract tasks with checkbox status
-        pattern = r'^\s*[-*]\s+\[([ x])\]\s+(.+)$'
-        matches = re.findall(pattern, tasks_section, re.MULTILINE)
-        
-        for checkbox, task_text in matches:
-            tasks.append({
-                'text': task_text.strip(),
-                'completed': checkbox.lower() == 'x'
-            })
-        
-        return tasks
+        # Only checkbox items carry a task status
+        return [
+            {
+                'text': item.checkbox_text.strip(),
+                'completed': item.checked
+            }
+            for item in items
+            if item.checked is not None
+        ]
     
     def _extract_epic_reference(self) -> str:
         """
@@ -156,18 +142,22 @@ class StoryParser(BaseParser):
         Returns:
             Epic title/ID or empty string
         """
-        sections = self.extract_sections()
+        document = self.tokenize()
         
         # Check frontmatter first
-        frontmatter = self.extract_yaml_frontmatter()
+        frontmatter = document.frontmatter
         if frontmatter and 'epic' in frontmatter:
             return frontmatter['epic']
         
+        # A dedicated "## Epic" section names it on its first line
+        epic_section = document.section('Epic').strip()
+        if epic_section:
+            return epic_section.splitlines()[0].strip()
+        
         # Look for epic mention in sections
-        for section_content in sections.values():
-            pattern = r'Epic:\s*(.+?)(?:\n|$)'
-            match = re.search(pattern, section_content)
+        for section_content in document.sections.values():
+            match = EPIC_REFERENCE_PATTERN.search(section_content)
             if match:
                 return match.group(1).strip()
         
-        return ''
\ No newline at end of file
+        return ''
@@ -5,8 +5,11 @@ Authors: Khaled Z. & Claude (Anthropic)
 """
 
 import click
+import fnmatch
+import json
 import logging
 import sys
+import time
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
@@ -14,6 +17,7 @@ from rich.table import Table
 from core.config_loader import ConfigLoader
 from core.agent_discovery import AgentDiscovery
 from core.email_generator import EmailGenerator
+from utils.timing import PhaseTimer
 
 console = Console()
 __version__ = "0.1.0"
@@ -25,6 +29,217 @@ def setup_logging(log_level: str):
     )
     return logging.getLogger(__name__)
 
+def create_gitea_client(project_config, workers: int = 1, host_concurrency: int = None):
+    """
+    Build a GiteaClient from project config (pooled session)
+
+    Args:
+        project_config: ProjectConfig
+        workers: Concurrent sync workers sharing the client
+        host_concurrency: Hard cap on simultaneous connections to the
+            Gitea host (blocks extra workers until a connection frees up)
+    """
+    from gitea.client import GiteaClient
+    from gitea.http_cache import ResponseCache
+    from gitea.retry import RetryPolicies
+    from gitea.throttle import RequestThrottle
+
+    pool_maxsize = max(project_config.gitea_pool_maxsize, workers)
+    pool_block = project_config.gitea_pool_block
+
+    if host_concurrency:
+        pool_maxsize = host_concurrency
+        pool_block = True
+
+    retry_policies = RetryPolicies.from_config(project_config.gitea_retry)
+    throttle = RequestThrottle(
+        rate_limit=project_config.gitea_rate_limit,
+        burst=project_config.gitea_rate_burst,
+        max_concurrency=project_config.gitea_max_concurrency
+    )
+    cache = ResponseCache.from_config(
+        project_config.gitea_cache,
+        path=project_config.gitea_cache_file,
+        identity=f"{project_config.gitea_url} {project_config.gitea_admin_token}"
+    )
+
+    return GiteaClient(
+        base_url=project_config.gitea_url,
+        token=project_config.gitea_admin_token,
+        organization=project_config.gitea_organization,
+        repository=project_config.gitea_repository,
+        verify_ssl=False,
+        pool_connections=project_config.gitea_pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        retry_policies=retry_policies,
+        throttle=throttle,
+        cache=cache
+    )
+
+def discover_agents(project: str, project_config, save: bool = True):
+    """
+    Discover BMad agents and assign their emails (for assignee mapping)
+
+    Args:
+        project: Project name
+        project_config: ProjectConfig
+        save: Persist new email assignments
+    """
+    discovery = AgentDiscovery(
+        str(project_config.bmad_root),
+        str(project_config.bmad_manifest)
+    )
+    agents = discovery.discover_all_agents()
+
+    email_mapping_file = Path(f"config/projects/{project}.email-mapping.yaml")
+    email_gen = EmailGenerator(
+        gmail_base=project_config.gmail_base,
+        gmail_domain=project_config.gmail_domain,
+        config_path=str(email_mapping_file)
+    )
+    return email_gen.assign_emails_to_agents(agents, save=save)
+
+def print_api_summary(gitea_client):
+    """Print retry/failure and throttling counters of a Gitea client"""
+    stats = gitea_client.retry_stats.as_dict()
+    throttle = gitea_client.throttle.as_dict()
+
+    console.print(
+        f"\n[bold]🔁 Gitea API:[/bold] {stats['retries']} retries, "
+        f"{stats['failures']} failed requests"
+    )
+
+    if stats['by_reason']:
+        reasons = ", ".join(f"{reason}: {count}" for reason, count in sorted(stats['by_reason'].items()))
+        console.print(f"   [dim]Retried on {reasons}[/dim]")
+
+    if gitea_client.cache is not None:
+        cache = gitea_client.cache.as_dict()
+        if cache['hits'] or cache['revalidated']:
+            console.print(
+                f"   [dim]Cache: {cache['hits']} fresh hits, "
+                f"{cache['revalidated']} revalidated (304)[/dim]"
+            )
+
+    if gitea_client.throttle.enabled:
+        console.print(
+            f"   [dim]Throttled {throttle['throttled_requests']}/{throttle['requests']} requests "
+            f"for {throttle['throttled_seconds']:.1f}s "
+            f"(peak {throttle['peak_in_flight']} in flight)[/dim]"
+        )
+
+def print_metrics(timer: PhaseTimer, gitea_client=None):
+    """Print phase timings and the busiest Gitea endpoints"""
+    phase_table = Table(title="Phase Timing")
+    phase_table.add_column("Phase", style="cyan")
+    phase_table.add_column("Wall (s)", justify="right", style="green")
+    phase_table.add_column("CPU (s)", justify="right", style="yellow")
+
+    for phase in timer.as_list():
+        phase_table.add_row(phase['name'], f"{phase['seconds']:.3f}", f"{phase['cpu_seconds']:.3f}")
+    phase_table.add_row("[bold]total[/bold]", f"{timer.total:.3f}", "")
+
+    console.print(phase_table)
+
+    if gitea_client is None:
+        return
+
+    metrics = gitea_client.metrics.as_dict()
+    api_table = Table(title="Gitea API")
+    api_table.add_column("Endpoint", style="cyan", overflow="fold")
+    for column in ("Calls", "Errors", "Retries", "p50 ms", "p95 ms", "p99 ms", "Total s", "KiB in"):
+        api_table.add_column(column, justify="right")
+
+    for endpoint, stats in metrics['endpoints'].items():
+        latency = stats['latency']
+        api_table.add_row(
+            endpoint,
+            str(stats['calls']),
+            str(stats['errors']),
+            str(stats['retries']),
+            f"{latency['p50'] * 1000:.1f}",
+            f"{latency['p95'] * 1000:.1f}",
+            f"{latency['p99'] * 1000:.1f}",
+            f"{latency['total']:.2f}",
+            f"{stats['bytes_received'] / 1024:.1f}"
+        )
+
+    totals = metrics['totals']
+    api_table.add_row(
+        "[bold]total[/bold]",
+        str(totals['calls']),
+        str(totals['errors']),
+        str(totals['retries']),
+        "", "", "",
+        f"{totals['seconds']:.2f}",
+        f"{totals['bytes_received'] / 1024:.1f}"
+    )
+
+    console.print(api_table)
+
+
+def write_metrics_report(
+    command: str,
+    project: str,
+    timer: PhaseTimer,
+    gitea_client=None,
+    metrics_file: str = None
+) -> Path:
+    """
+    Write the --metrics JSON report
+
+    Args:
+        command: CLI command ('sync', 'sync-artifacts')
+        project: Project name
+        timer: Phase timer of the run
+        gitea_client: Client whose request metrics to include
+        metrics_file: Report path (default: logs/metrics/<project>-<command>-<time>.json)
+
+    Returns:
+        Path of the written report
+    """
+    if metrics_file:
+        path = Path(metrics_file)
+    else:
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(timer.started_at))
+        path = Path('logs') / 'metrics' / f"{project}-{command}-{stamp}.json"
+
+    report = {
+        'command': command,
+        'project': project,
+        'version': __version__,
+        'started_at': timer.started_at,
+        'total_seconds': round(timer.total, 6),
+        'phases': timer.as_list()
+    }
+
+    if gitea_client is not None:
+        report['api'] = gitea_client.metrics.as_dict()
+        report['retry'] = gitea_client.retry_stats.as_dict()
+        report['throttle'] = gitea_client.throttle.as_dict()
+        report['pool'] = gitea_client.pool_stats()
+        if gitea_client.cache is not None:
+            report['cache'] = gitea_client.cache.as_dict()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2))
+    return path
+
+
+def report_metrics(
+    command: str,
+    project: str,
+    timer: PhaseTimer,
+    gitea_client=None,
+    metrics_file: str = None
+):
+    """Print the --metrics tables and write the JSON report"""
+    timer.stop()
+    print_metrics(timer, gitea_client)
+    path = write_metrics_report(command, project, timer, gitea_client, metrics_file)
+    console.print(f"   [dim]📊 Metrics report: {path}[/dim]")
+
 @click.group()
 @click.version_option(version=__version__)
 def cli():
@@ -34,9 +249,22 @@ def cli():
 @cli.command()
 @click.option('--project', '-p', required=True, help='Project name')
 @click.option('--dry-run', is_flag=True, help='Simulation mode')
-def sync(project: str, dry_run: bool):
+@click.option('--workers', '-w', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Agents provisioned concurrently')
+@click.option('--metrics', is_flag=True, help='Print phase/API timings and write a JSON report')
+@click.option('--metrics-file', type=click.Path(dir_okay=False), default=None,
+              help='Path of the --metrics JSON report')
+def sync(
+    project: str,
+    dry_run: bool,
+    workers: int,
+    metrics: bool,
+    metrics_file: str
+):
     """Synchronize BMad project with Gitea"""
     
+    timer = PhaseTimer()
+    
     config_loader = ConfigLoader()
     
     try:
@@ -62,6 +290,7 @@ def sync(project: str, dry_run: bool):
     
     # Phase 1: Agent Discovery
     console.print("[bold]📋 Phase 1: Agent Discovery[/bold]")
+    timer.start('discovery')
     
     try:
         discovery = AgentDiscovery(
@@ -90,6 +319,7 @@ def sync(project: str, dry_run: bool):
     
     # Phase 2: Email Assignment
     console.print("\n[bold]📧 Phase 2: Email Assignment[/bold]")
+    timer.start('email_assignment')
     
     try:
         email_mapping_file = Path(f"config/projects/{project}.email-mapping.yaml")
@@ -119,22 +349,16 @@ def sync(project: str, dry_run: bool):
         sys.exit(1)
 # Phase 3: Gitea User Provisioning
     console.print("\n[bold]🔧 Phase 3: Gitea User Provisioning[/bold]")
+    timer.start('provisioning')
     
     if dry_run:
         console.print("   [yellow]⏭️  Skipped (dry-run mode)[/yellow]")
     else:
         try:
-            from gitea.client import GiteaClient
             from core.gitea_provisioner import GiteaProvisioner
             
             # Connect to Gitea
-            gitea_client = GiteaClient(
-                base_url=project_config.gitea_url,
-                token=project_config.gitea_admin_token,
-                organization=project_config.gitea_organization,
-                repository=project_config.gitea_repository,
-                verify_ssl=False
-            )
+            gitea_client = create_gitea_client(project_config, workers=workers)
             
             # Test connection
             if not gitea_client.test_connection():
@@ -147,13 +371,15 @@ def sync(project: str, dry_run: bool):
                 mode=project_config.sync_provisioning if hasattr(project_config, 'sync_provisioning') else 'issue'
             )
             
-            results = provisioner.provision_all_agents(agents)
+            results = provisioner.provision_all_agents(agents, workers=workers)
             
             # Display results
             console.print(f"   [green]✅ Provisioning complete[/green]")
             console.print(f"      Created: {len(results['created'])}")
             console.print(f"      Already exist: {len(results['exists'])}")
             console.print(f"      Pending (issues): {len(results['pending'])}")
+            if results['failed']:
+                console.print(f"      [red]Failed: {len(results['failed'])}[/red]")
             
             # Show details if any created or pending
             if results['created'] or results['pending']:
@@ -172,7 +398,7 @@ def sync(project: str, dry_run: bool):
                 for item in results['pending']:
                     prov_table.add_row(
                         item['username'],
-                        "📋 Issue created",
+                        "📋 Issue exists" if item.get('issue_exists') else "📋 Issue created",
                         f"Issue #{item.get('issue_number', 'N/A')}"
                     )
                 
@@ -185,71 +411,64 @@ def sync(project: str, dry_run: bool):
     # Phase 4: Organization & Team Setup
     if project_config.organization_config and not dry_run:
         console.print("\n[bold]🏢 Phase 4: Organization & Team Setup[/bold]")
+        timer.start('org_setup')
 
         try:
             from gitea.organizations import GiteaOrganizations
+            from core.org_reconciler import OrganizationReconciler
 
             # Ensure Gitea client is initialized
             if 'gitea_client' not in locals():
-                from gitea.client import GiteaClient
-                gitea_client = GiteaClient(
-                    base_url=project_config.gitea_url,
-                    token=project_config.gitea_admin_token,
-                    organization=project_config.gitea_organization,
-                    repository=project_config.gitea_repository,
-                    verify_ssl=False
-                )
+                gitea_client = create_gitea_client(project_config, workers=workers)
 
             org_manager = GiteaOrganizations(gitea_client)
-            org_config = project_config.organization_config
+            reconciler = OrganizationReconciler(org_manager, project_config.organization_config)
 
-            # Ensure organization exists
-            org_data = org_manager.ensure_organization(
-                org_config.name,
-                org_config.description
-            )
+            # One bulk fetch of the org's teams and repositories, then
+            # create/patch only what drifted
+            results = reconciler.reconcile(agents, workers=workers)
 
-            if org_manager.organization_exists(org_config.name):
-                console.print(f"   [green]✅ Organization:[/green] {org_config.name} (exists)")
-            else:
-                console.print(f"   [green]✅ Created organization:[/green] {org_config.name}")
-
-            # Create teams and add members
-            for team_config in org_config.teams:
-                team_data = org_manager.create_team(
-                    org_config.name,
-                    team_config.name,
-                    team_config.description,
-                    team_config.permission,
-                    team_config.includes_all_repositories,
-                    team_config.units
-                )
+            icons = {'organization': '🏢', 'team': '👥', 'repository': '📦'}
+            for status, label in (('created', 'Created'), ('updated', 'Updated'), ('exists', 'Unchanged')):
+                for item in results[status]:
+                    changes = f" ({', '.join(item['changes'])})" if item.get('changes') else ""
+                    console.print(
+                        f"   [green]✅ {label} {item['kind']}:[/green] "
+                        f"{icons[item['kind']]} {item['name']}{changes}"
+                    )
+
+            for item in results['failed']:
+                console.print(f"   [red]❌ {item['kind']} {item['name']}:[/red] {item['error']}")
 
-                console.print(f"   [green]✅ Created team:[/green] {team_config.name}")
-
-                # Add members
-                if team_config.members == "all":
-                    # Add all discovered agents
-                    usernames = [f"bmad-{agent.name}" for agent in agents]
-                    results = org_manager.add_users_to_team(team_data['id'], usernames)
-                    console.print(f"   [green]✅ Added {results['success']} members to {team_config.name}[/green]")
-
-            # Create repositories
-            for repo_config in org_config.repositories:
-                repo_data = org_manager.create_repo_in_org(
-                    org_config.name,
-                    repo_config.name,
-                    repo_config.description,
-                    repo_config.private,
-                    repo_config.auto_init
+            for item in results['drift']:
+                console.print(
+                    f"   [yellow]⚠️  {item['kind']} {item['name']}:[/yellow] "
+                    f"{item['field']} is {item['current']}, configured {item['desired']} "
+                    f"(not changed, set enforce_visibility)"
                 )
 
-                console.print(f"   [green]✅ Created repository:[/green] {repo_config.name}")
+            for team_name, members in results['members'].items():
+                console.print(
+                    f"   [green]✅ Members of {team_name}:[/green] "
+                    f"+{members['added']} -{members['removed']} ={members['unchanged']}"
+                    + (f" [red]({members['failed']} failed)[/red]" if members['failed'] else "")
+                    + f" in {members['elapsed']:.2f}s"
+                )
 
         except Exception as e:
             console.print(f"   [red]❌ Error:[/red] {e}")
             logger.exception("Organization setup failed")
 
+    timer.stop()
+
+    if metrics:
+        report_metrics('sync', project, timer, locals().get('gitea_client'), metrics_file)
+
+    if 'gitea_client' in locals():
+        logger.info(f"Gitea connection pool: {gitea_client.pool_stats()}")
+        print_api_summary(gitea_client)
+        gitea_client.close()
+
     # Summary
     console.print("\n" + "=" * 60)
     
@@ -264,9 +483,35 @@ def sync(project: str, dry_run: bool):
 @cli.command()
 @click.option('--project', '-p', required=True, help='Project name')
 @click.option('--dry-run', is_flag=True, help='Simulation mode')
-def sync_artifacts(project: str, dry_run: bool):
+@click.option('--full', is_flag=True, help='Ignore sync state, re-sync every artifact')
+@click.option('--workers', '-w', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Artifacts synced concurrently')
+@click.option('--host-concurrency', type=click.IntRange(min=1), default=None,
+              help='Max simultaneous connections to the Gitea host')
+@click.option('--parse-workers', default=1, show_default=True, type=click.IntRange(min=0),
+              help='Processes used to parse artifacts up front (0 = CPU count)')
+@click.option('--plan', 'plan_file', type=click.Path(dir_okay=False), default=None,
+              help='Write the sync plan to this JSON file instead of syncing')
+@click.option('--apply', 'apply_file', type=click.Path(exists=True, dir_okay=False), default=None,
+              help='Execute a plan written by --plan')
+@click.option('--metrics', is_flag=True, help='Print phase/API timings and write a JSON report')
+@click.option('--metrics-file', type=click.Path(dir_okay=False), default=None,
+              help='Path of the --metrics JSON report')
+def sync_artifacts(
+    project: str,
+    dry_run: bool,
+    full: bool,
+    workers: int,
+    host_concurrency: int,
+    parse_workers: int,
+    plan_file: str,
+    apply_file: str,
+    metrics: bool,
+    metrics_file: str
+):
     """Synchronize BMad artifacts (epics, stories) with Gitea"""
     
+    timer = PhaseTimer()
     config_loader = ConfigLoader()
     
     try:
@@ -277,6 +522,10 @@ def sync_artifacts(project: str, dry_run: bool):
     
     logger = setup_logging(project_config.log_level)
     
+    if plan_file and apply_file:
+        console.print("[red]❌ --plan and --apply are mutually exclusive[/red]")
+        sys.exit(1)
+    
     console.print("\n[bold cyan]🌉 BMad-Gitea-Bridge - Artifact Sync[/bold cyan]")
     console.print(f"[dim]Version {__version__}[/dim]")
     console.print("=" * 60)
@@ -293,9 +542,8 @@ def sync_artifacts(project: str, dry_run: bool):
     # Import syncers
     from core.epic_syncer import EpicSyncer
     from core.story_syncer import StorySyncer
-    from core.agent_discovery import AgentDiscovery
-    from core.email_generator import EmailGenerator
-    from gitea.client import GiteaClient
+    from core.state_store import SyncStateStore
+    from gitea.labels import LabelRegistry
     
     # Check artifacts path
     artifacts_path = getattr(project_config, 'bmad_artifacts', None)
@@ -315,22 +563,10 @@ def sync_artifacts(project: str, dry_run: bool):
     
     # Phase 1: Agent Discovery (needed for assignee mapping)
     console.print("[bold]📋 Phase 1: Agent Discovery[/bold]")
+    timer.start('discovery')
     
     try:
-        discovery = AgentDiscovery(
-            str(project_config.bmad_root),
-            str(project_config.bmad_manifest)
-        )
-        agents = discovery.discover_all_agents()
-        
-        # Assign emails
-        email_mapping_file = Path(f"config/projects/{project}.email-mapping.yaml")
-        email_gen = EmailGenerator(
-            gmail_base=project_config.gmail_base,
-            gmail_domain=project_config.gmail_domain,
-            config_path=str(email_mapping_file)
-        )
-        agents = email_gen.assign_emails_to_agents(agents, save=not dry_run)
+        agents = discover_agents(project, project_config, save=not dry_run)
         
         console.print(f"   [green]✅ Discovered {len(agents)} agents[/green]")
         
@@ -341,14 +577,13 @@ def sync_artifacts(project: str, dry_run: bool):
     
     # Phase 2: Connect to Gitea
     console.print("\n[bold]🔗 Phase 2: Gitea Connection[/bold]")
+    timer.start('connection')
     
     try:
-        gitea_client = GiteaClient(
-            base_url=project_config.gitea_url,
-            token=project_config.gitea_admin_token,
-            organization=project_config.gitea_organization,
-            repository=project_config.gitea_repository,
-            verify_ssl=False
+        gitea_client = create_gitea_client(
+            project_config,
+            workers=workers,
+            host_concurrency=host_concurrency
         )
         
         if not gitea_client.test_connection():
@@ -360,16 +595,55 @@ def sync_artifacts(project: str, dry_run: bool):
         logger.exception("Gitea connection failed")
         sys.exit(1)
     
+    # Incremental sync state (one SQLite file per project)
+    state_store = SyncStateStore(project_config.state_dir / f"{project}.state.db")
+    
+    # Epics sync first; stories take their milestone from the epic syncer
+    epic_syncer = EpicSyncer(gitea_client, artifacts_path, state_store=state_store)
+    story_syncer = StorySyncer(
+        gitea_client,
+        artifacts_path,
+        agents,
+        state_store=state_store,
+        label_registry=LabelRegistry(gitea_client, project_config.gitea_labels),
+        epic_syncer=epic_syncer
+    )
+    
+    if plan_file or apply_file:
+        run_plan(
+            project,
+            project_config,
+            gitea_client,
+            state_store,
+            epic_syncer,
+            story_syncer,
+            plan_file=plan_file,
+            apply_file=apply_file,
+            full=full,
+            workers=workers,
+            parse_workers=parse_workers or None,
+            timer=timer,
+            metrics=metrics,
+            metrics_file=metrics_file
+        )
+        return
+    
     # Phase 3: Sync Epics → Milestones
     console.print("\n[bold]🎯 Phase 3: Epic Sync (Epics → Milestones)[/bold]")
+    timer.start('epic_sync')
     
     try:
-        epic_syncer = EpicSyncer(gitea_client, artifacts_path)
-        epic_results = epic_syncer.sync_all_epics(dry_run=dry_run)
+        epic_results = epic_syncer.sync_all_epics(
+            dry_run=dry_run,
+            force=full,
+            workers=workers,
+            parse_workers=parse_workers or None
+        )
         
         console.print(f"   [green]✅ Epic sync complete[/green]")
         console.print(f"      Created: {len(epic_results['created'])}")
         console.print(f"      Already exist: {len(epic_results['exists'])}")
+        console.print(f"      Unchanged: {len(epic_results['unchanged'])}")
         console.print(f"      Failed: {len(epic_results['failed'])}")
         
         if epic_results['created'] or epic_results['failed']:
@@ -400,17 +674,29 @@ def sync_artifacts(project: str, dry_run: bool):
     
     # Phase 4: Sync Stories → Issues
     console.print("\n[bold]📝 Phase 4: Story Sync (Stories → Issues)[/bold]")
+    timer.start('story_sync')
     
     try:
-        story_syncer = StorySyncer(gitea_client, artifacts_path, agents)
-        story_results = story_syncer.sync_all_stories(dry_run=dry_run)
+        story_results = story_syncer.sync_all_stories(
+            dry_run=dry_run,
+            force=full,
+            workers=workers,
+            parse_workers=parse_workers or None
+        )
         
         console.print(f"   [green]✅ Story sync complete[/green]")
+        if 'labels' in story_results:
+            console.print(
+                f"      Labels: {len(story_results['labels']['created'])} created, "
+                f"{len(story_results['labels']['failed'])} failed"
+            )
         console.print(f"      Created: {len(story_results['created'])}")
+        console.print(f"      Updated: {len(story_results['updated'])}")
         console.print(f"      Already exist: {len(story_results['exists'])}")
+        console.print(f"      Unchanged: {len(story_results['unchanged'])}")
         console.print(f"      Failed: {len(story_results['failed'])}")
         
-        if story_results['created'] or story_results['failed']:
+        if story_results['created'] or story_results['updated'] or story_results['failed']:
             story_table = Table(title="Story Sync Results")
             story_table.add_column("Story", style="cyan")
             story_table.add_column("Status", style="yellow")
@@ -425,6 +711,14 @@ def sync_artifacts(project: str, dry_run: bool):
                     f"#{item['issue'].get('number', 'N/A')}"
                 )
             
+            for item in story_results['updated']:
+                story_table.add_row(
+                    Path(item['story_file']).name,
+                    f"🔄 Updated ({', '.join(item['changes'])})",
+                    (item['issue'].get('assignee') or {}).get('login', 'None'),
+                    f"#{item['issue'].get('number', 'N/A')}"
+                )
+            
             for item in story_results['failed']:
                 story_table.add_row(
                     Path(item['story_file']).name,
@@ -439,6 +733,16 @@ def sync_artifacts(project: str, dry_run: bool):
         console.print(f"   [red]❌ Error:[/red] {e}")
         logger.exception("Story sync failed")
     
+    timer.stop()
+    
+    if metrics:
+        report_metrics('sync-artifacts', project, timer, gitea_client, metrics_file)
+    
+    logger.info(f"Gitea connection pool: {gitea_client.pool_stats()}")
+    print_api_summary(gitea_client)
+    gitea_client.close()
+    state_store.close()
+    
     # Summary
     console.print("\n" + "=" * 60)
     
@@ -450,6 +754,275 @@ def sync_artifacts(project: str, dry_run: bool):
     
     console.print()
 
+def run_plan(
+    project: str,
+    project_config,
+    gitea_client,
+    state_store,
+    epic_syncer,
+    story_syncer,
+    plan_file: str = None,
+    apply_file: str = None,
+    full: bool = False,
+    workers: int = 1,
+    parse_workers: int = 1,
+    timer: PhaseTimer = None,
+    metrics: bool = False,
+    metrics_file: str = None
+):
+    """Build (--plan) or execute (--apply) a sync plan, then close the client"""
+    timer = timer or PhaseTimer()
+    from core.sync_plan import SyncPlan, SyncPlanner
+    
+    planner = SyncPlanner(epic_syncer, story_syncer, project=project)
+    
+    try:
+        if plan_file:
+            console.print("\n[bold]🗺️  Phase 3: Sync Plan[/bold]")
+            timer.start('plan')
+            plan = planner.build(force=full, parse_workers=parse_workers)
+            plan.save(Path(plan_file))
+            
+            actions = ('create', 'update', 'close', 'skip')
+            table = Table(title="Sync Plan")
+            table.add_column("Artifact", style="cyan")
+            for action in actions:
+                table.add_column(action.capitalize(), style="yellow")
+            
+            for kind, counts in plan.counts().items():
+                table.add_row(kind, *(str(counts.get(action, 0)) for action in actions))
+            
+            console.print(table)
+            console.print(f"   Labels to create: {', '.join(plan.labels_to_create) or 'none'}")
+            console.print(f"   Milestones to create: {len(plan.milestones_to_create)}")
+            console.print(f"\n[green]✅ Plan written to {plan_file}[/green]")
+            console.print(f"   Apply it with: sync-artifacts -p {project} --apply {plan_file}")
+        
+        else:
+            console.print("\n[bold]🚀 Phase 3: Apply Sync Plan[/bold]")
+            timer.start('apply')
+            plan = SyncPlan.load(Path(apply_file))
+            
+            if plan.project != project:
+                console.print(f"   [red]❌ Plan was built for project '{plan.project}'[/red]")
+                sys.exit(1)
+            
+            results = planner.apply(plan, workers=workers)
+            
+            for status, items in results.items():
+                console.print(f"      {status.capitalize()}: {len(items)}")
+            
+            for item in results['failed'] + results['stale']:
+                console.print(
+                    f"   [red]❌ {item['kind']} {item['title']}: "
+                    f"{item.get('error', 'changed since plan was built')}[/red]"
+                )
+    
+    except Exception as e:
+        console.print(f"   [red]❌ Error:[/red] {e}")
+        logging.getLogger(__name__).exception("Sync plan failed")
+        sys.exit(1)
+    
+    finally:
+        timer.stop()
+        if metrics:
+            report_metrics('sync-artifacts', project, timer, gitea_client, metrics_file)
+        logging.getLogger(__name__).info(f"Gitea connection pool: {gitea_client.pool_stats()}")
+        print_api_summary(gitea_client)
+        gitea_client.close()
+        state_store.close()
+
+@cli.command()
+@click.option('--project', '-p', required=True, help='Project name')
+@click.option('--dry-run', is_flag=True, help='Simulation mode')
+@click.option('--workers', '-w', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Artifacts synced concurrently')
+@click.option('--interval', type=click.IntRange(min=1), default=None,
+              help='Seconds between full incremental re-syncs (default: sync.interval)')
+@click.option('--debounce', type=click.FloatRange(min=0), default=None,
+              help='Quiet seconds closing a batch of changes (default: sync.debounce)')
+@click.option('--max-batch-latency', type=click.FloatRange(min=0), default=None,
+              help='Max seconds a change waits before sync (default: sync.max_batch_latency)')
+@click.option('--polling', is_flag=True, help='Poll the filesystem instead of using inotify')
+def watch(
+    project: str,
+    dry_run: bool,
+    workers: int,
+    interval: int,
+    debounce: float,
+    max_batch_latency: float,
+    polling: bool
+):
+    """Watch BMad artifacts and sync changes to Gitea as they happen"""
+    
+    config_loader = ConfigLoader()
+    
+    try:
+        project_config = config_loader.load_project_config(project)
+    except Exception as e:
+        console.print(f"[red]❌ Error loading config:[/red] {e}")
+        sys.exit(1)
+    
+    logger = setup_logging(project_config.log_level)
+    
+    interval = interval or project_config.sync_interval
+    debounce = project_config.sync_debounce if debounce is None else debounce
+    if max_batch_latency is None:
+        max_batch_latency = project_config.sync_max_batch_latency
+    
+    console.print("\n[bold cyan]🌉 BMad-Gitea-Bridge - Watch Mode[/bold cyan]")
+    console.print(f"[dim]Version {__version__}[/dim]")
+    console.print("=" * 60)
+    
+    console.print(f"\n[bold]Project:[/bold] {project_config.name}")
+    console.print(f"[bold]Gitea:[/bold] {project_config.gitea_url}")
+    
+    if dry_run:
+        console.print("\n[yellow]🔍 DRY RUN - No changes[/yellow]")
+    
+    from core.epic_syncer import EpicSyncer
+    from core.story_syncer import StorySyncer
+    from core.state_store import SyncStateStore
+    from core.watcher import ArtifactWatcher, ChangeBatcher
+    from gitea.index import IssueIndex, MilestoneIndex
+    from gitea.labels import LabelRegistry
+    
+    artifacts_path = getattr(project_config, 'bmad_artifacts', None)
+    
+    if not artifacts_path or not Path(artifacts_path).exists():
+        console.print(f"[red]❌ Artifacts path not found: {artifacts_path}[/red]")
+        sys.exit(1)
+    
+    artifacts_path = Path(artifacts_path).resolve()
+    
+    try:
+        agents = discover_agents(project, project_config, save=not dry_run)
+        
+        gitea_client = create_gitea_client(project_config, workers=workers)
+        
+        if not gitea_client.test_connection():
+            console.print("   [red]❌ Cannot connect to Gitea[/red]")
+            sys.exit(1)
+        
+    except Exception as e:
+        console.print(f"   [red]❌ Error:[/red] {e}")
+        logger.exception("Watch setup failed")
+        sys.exit(1)
+    
+    # Syncers, index and labels live for the whole session
+    state_store = SyncStateStore(project_config.state_dir / f"{project}.state.db")
+    epic_syncer = EpicSyncer(
+        gitea_client,
+        artifacts_path,
+        state_store=state_store,
+        milestone_index=MilestoneIndex(gitea_client)
+    )
+    story_syncer = StorySyncer(
+        gitea_client,
+        artifacts_path,
+        agents,
+        issue_index=IssueIndex(gitea_client),
+        state_store=state_store,
+        label_registry=LabelRegistry(gitea_client, project_config.gitea_labels),
+        epic_syncer=epic_syncer
+    )
+    
+    def run_sync(epic_files=None, story_files=None):
+        """Sync the given artifacts (None = every changed artifact)"""
+        try:
+            if epic_files is None or epic_files:
+                epic_results = epic_syncer.sync_all_epics(
+                    dry_run=dry_run, workers=workers, epic_files=epic_files
+                )
+                console.print(
+                    f"   🎯 Epics: {len(epic_results['created'])} created, "
+                    f"{len(epic_results['exists'])} existing, "
+                    f"{len(epic_results['unchanged'])} unchanged, "
+                    f"{len(epic_results['failed'])} failed"
+                )
+            
+            if story_files is None or story_files:
+                story_results = story_syncer.sync_all_stories(
+                    dry_run=dry_run, workers=workers, story_files=story_files
+                )
+                console.print(
+                    f"   📝 Stories: {len(story_results['created'])} created, "
+                    f"{len(story_results['updated'])} updated, "
+                    f"{len(story_results['exists'])} up to date, "
+                    f"{len(story_results['unchanged'])} unchanged, "
+                    f"{len(story_results['failed'])} failed"
+                )
+        
+        except Exception as e:
+            console.print(f"   [red]❌ Error:[/red] {e}")
+            logger.exception("Watch sync failed")
+    
+    watch_paths = [artifacts_path] + [
+        (project_config.bmad_root / path).resolve() for path in project_config.bmad_watch
+    ]
+    batcher = ChangeBatcher(debounce=debounce, max_latency=max_batch_latency)
+    watcher = ArtifactWatcher(
+        watch_paths,
+        batcher,
+        ignore=project_config.bmad_ignore,
+        use_polling=polling
+    )
+    
+    console.print(f"\n[bold]🔄 Initial sync[/bold]")
+    run_sync()
+    
+    mode = watcher.start()
+    console.print(
+        f"\n[bold]👀 Watching[/bold] {len(watcher.paths)} directories ({mode}), "
+        f"debounce {debounce:g}s, max latency {max_batch_latency:g}s, "
+        f"full re-sync every {interval}s"
+    )
+    console.print("[dim]Press Ctrl+C to stop[/dim]")
+    
+    epics_dir = epic_syncer.epics_path.resolve()
+    stories_dir = story_syncer.stories_path.resolve()
+    last_full = time.monotonic()
+    
+    try:
+        while True:
+            timeout = max(0.0, interval - (time.monotonic() - last_full))
+            batch = batcher.next_batch(timeout=timeout)
+            
+            if not batch:
+                console.print(f"\n[bold]🔄 Periodic re-sync[/bold]")
+                run_sync()
+                last_full = time.monotonic()
+                continue
+            
+            changed = sorted({path.resolve() for path in batch})
+            epic_files = [
+                path for path in changed
+                if path.parent == epics_dir and fnmatch.fnmatch(path.name, 'epic-*.md')
+            ]
+            story_files = [
+                path for path in changed
+                if path.parent == stories_dir and fnmatch.fnmatch(path.name, 'story-*.md')
+            ]
+            
+            if not epic_files and not story_files:
+                logger.debug(f"Ignoring {len(changed)} non-artifact changes")
+                continue
+            
+            console.print(
+                f"\n[bold]🔄 {len(epic_files)} epic(s), {len(story_files)} story(ies) changed[/bold]"
+            )
+            run_sync(epic_files=epic_files, story_files=story_files)
+    
+    except KeyboardInterrupt:
+        console.print("\n[yellow]⏹️  Stopping watch[/yellow]")
+    
+    finally:
+        watcher.stop()
+        logger.info(f"Gitea connection pool: {gitea_client.pool_stats()}")
+        print_api_summary(gitea_client)
+        gitea_client.close()
+        state_store.close()
+
 @cli.command()
 def version():
     """Show version"""
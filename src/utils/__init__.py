@@ -7,5 +7,6 @@ Authors: Khaled Z. & Claude (Anthropic)
 """
 
 from .logger import setup_logger
+from .concurrency import KeyedLock, map_bounded
 
-__all__ = ["setup_logger"]
\ No newline at end of file
+__all__ = ["setup_logger", "KeyedLock", "map_bounded"]
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Concurrency Utilities
+
+Bounded worker pools and per-key locks for concurrent sync.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List
+
+
+def map_bounded(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: int = 1
+) -> List[Any]:
+    """
+    Apply func to every item with at most `workers` threads
+
+    Results are returned in input order regardless of completion order.
+
+    Args:
+        func: Function to apply
+        items: Input items
+        workers: Max concurrent calls (1 = sequential, in this thread)
+
+    Returns:
+        List of results, one per item
+    """
+    items = list(items)
+
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(items)),
+        thread_name_prefix='bmad-sync'
+    ) as executor:
+        return list(executor.map(func, items))
+
+
+class KeyedLock:
+    """
+    One lock per key, created on demand (e.g. per issue title)
+
+    Locks are reference-counted and dropped once no thread holds or waits
+    for them, so long-running processes (watch mode) don't accumulate one
+    lock per key ever seen.
+    """
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        # key -> [lock, holders + waiters]
+        self._locks: Dict[Hashable, List[Any]] = {}
+
+    @contextmanager
+    def hold(self, key: Hashable) -> Iterator[None]:
+        """
+        Hold the lock for a key
+
+        Args:
+            key: Lock key
+        """
+        with self._guard:
+            entry = self._locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[key]
+
+    def __len__(self) -> int:
+        """Number of keys currently held or waited for"""
+        with self._guard:
+            return len(self._locks)
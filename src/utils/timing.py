@@ -0,0 +1,66 @@
+"""
+Phase Timing
+
+Wall-clock and CPU time of the CLI phases (discovery, provisioning,
+epic sync, ...) for the --metrics report.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import time
+from typing import Dict, List, Optional
+
+
+class PhaseTimer:
+    """
+    Sequential phase timer
+
+    start(name) ends the running phase and starts the next one, so a
+    phase can be marked with a single line next to its console header.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self._phases: List[Dict] = []
+        self._current: Optional[Dict] = None
+
+    def start(self, name: str):
+        """
+        Start a phase (ending the running one)
+
+        Args:
+            name: Phase name (e.g. 'discovery')
+        """
+        self.stop()
+        self._current = {
+            'name': name,
+            'wall': time.perf_counter(),
+            'cpu': time.process_time()
+        }
+
+    def stop(self):
+        """End the running phase, if any"""
+        if self._current is None:
+            return
+
+        self._phases.append({
+            'name': self._current['name'],
+            'seconds': round(time.perf_counter() - self._current['wall'], 6),
+            'cpu_seconds': round(time.process_time() - self._current['cpu'], 6)
+        })
+        self._current = None
+
+    @property
+    def total(self) -> float:
+        """Seconds since the timer was created"""
+        return time.perf_counter() - self._started
+
+    def as_list(self) -> List[Dict]:
+        """
+        Finished phases, in order
+
+        Returns:
+            List of {'name', 'seconds', 'cpu_seconds'}
+        """
+        return list(self._phases)
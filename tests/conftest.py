@@ -0,0 +1,61 @@
+"""
+Shared pytest fixtures
+
+Tests run against benchmarks.fake_gitea, an in-memory Gitea API served
+on localhost, so no real instance is needed.
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(REPO_ROOT / 'src'))
+sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.fake_gitea import FakeGitea  # noqa: E402
+from benchmarks.synthetic import generate_tree  # noqa: E402
+from gitea.client import GiteaClient  # noqa: E402
+from gitea.retry import RetryPolicies, RetryPolicy  # noqa: E402
+
+ORG = 'BenchOrg'
+REPO = 'bench-repo'
+
+
+@pytest.fixture
+def fake_gitea():
+    """Running fake Gitea with an organization and repository"""
+    with FakeGitea(seed=0) as gitea:
+        gitea.state.add_org(ORG)
+        gitea.state.add_repo(ORG, REPO)
+        yield gitea
+
+
+@pytest.fixture
+def client(fake_gitea):
+    """GiteaClient on the fake server (fast retries)"""
+    gitea_client = GiteaClient(
+        fake_gitea.url,
+        'test-token',
+        organization=ORG,
+        repository=REPO,
+        retry_policies=RetryPolicies(default=RetryPolicy(backoff_base=0.01, backoff_max=0.05))
+    )
+    yield gitea_client
+    gitea_client.close()
+
+
+def route_calls(fake_gitea, route: str) -> int:
+    """Requests the fake server received on a route (e.g. 'POST /repos/{owner}/{repo}/issues')"""
+    return fake_gitea.stats()['by_route'].get(route, 0)
+
+
+@pytest.fixture
+def bmad_tree(tmp_path):
+    """Small synthetic BMad tree: 2 epics, 6 stories, 3 agents"""
+    generate_tree(tmp_path, epics=2, stories=6, agents=3)
+    return tmp_path
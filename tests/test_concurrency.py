@@ -0,0 +1,61 @@
+"""
+Tests for the concurrency utilities
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import threading
+import time
+
+from utils.concurrency import KeyedLock, map_bounded
+
+
+def test_map_bounded_keeps_input_order():
+    def slow_square(n):
+        time.sleep(0.01 * (5 - n))
+        return n * n
+
+    assert map_bounded(slow_square, range(5), workers=5) == [0, 1, 4, 9, 16]
+
+
+def test_keyed_lock_serializes_one_key():
+    locks = KeyedLock()
+    inside = []
+    overlaps = []
+
+    def work(_):
+        with locks.hold('Story-001: Item'):
+            inside.append(1)
+            overlaps.append(len(inside))
+            time.sleep(0.01)
+            inside.pop()
+
+    map_bounded(work, range(8), workers=8)
+
+    assert max(overlaps) == 1
+
+
+def test_keyed_lock_releases_keys_when_unused():
+    locks = KeyedLock()
+    for number in range(100):
+        with locks.hold(f"Story-{number:03d}: Item"):
+            assert len(locks) == 1
+
+    assert len(locks) == 0
+
+    release = threading.Event()
+    holder_ready = threading.Event()
+
+    def holder():
+        with locks.hold('busy'):
+            holder_ready.set()
+            release.wait()
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    holder_ready.wait()
+    assert len(locks) == 1
+    release.set()
+    thread.join()
+
+    assert len(locks) == 0
@@ -0,0 +1,85 @@
+"""
+Tests for EpicSyncer and the milestone index
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import re
+from pathlib import Path
+
+from core.epic_syncer import EpicSyncer
+from core.state_store import SyncStateStore, hash_payload
+
+from tests.conftest import route_calls
+
+CREATE_MILESTONE = 'POST /repos/{owner}/{repo}/milestones'
+
+
+def test_epic_sync_creates_nothing_when_index_fails(fake_gitea, client, bmad_tree):
+    syncer = EpicSyncer(client, bmad_tree / 'artifacts')
+    fake_gitea.options.error_status = 500
+    fake_gitea.options.error_rate = 1.0
+
+    results = syncer.sync_all_epics()
+
+    assert route_calls(fake_gitea, CREATE_MILESTONE) == 0
+    assert results['created'] == []
+    assert len(results['failed']) == 2
+    assert not syncer.milestone_index.loaded
+
+
+def test_existing_milestone_records_payload_hash(tmp_path, fake_gitea, client, bmad_tree):
+    EpicSyncer(client, bmad_tree / 'artifacts').sync_all_epics()
+
+    store = SyncStateStore(tmp_path / 'state.db')
+    syncer = EpicSyncer(client, bmad_tree / 'artifacts', state_store=store)
+    results = syncer.sync_all_epics()
+
+    assert len(results['exists']) == 2
+    assert route_calls(fake_gitea, CREATE_MILESTONE) == 2
+
+    epic_file = syncer.discover_epics()[0]
+    epic_data = syncer.parse_epic(epic_file)
+    state = store.get(epic_file)
+    assert state.payload_hash == hash_payload({
+        'title': epic_data['title'],
+        'description': epic_data['description'],
+        'due_date': syncer._extract_due_date(epic_data)
+    })
+    store.close()
+
+
+def test_created_milestones_carry_the_epic_target_date(client, bmad_tree):
+    syncer = EpicSyncer(client, bmad_tree / 'artifacts')
+    results = syncer.sync_all_epics()
+
+    for result in results['created']:
+        epic_data = syncer.parse_epic(Path(result['epic_file']))
+        target = re.search(r'Target\*\*: (\S+)', epic_data['sections']['Timeline']).group(1)
+        assert result['milestone']['due_on'] == f"{target}T23:59:59Z"
+
+
+def test_milestone_for_resolves_titles_after_index_changes(client, bmad_tree):
+    syncer = EpicSyncer(client, bmad_tree / 'artifacts')
+    first = syncer.milestones.create_epic_milestone(epic_title='Patient Portal', epic_description='')
+    syncer.milestone_index.load()
+
+    assert syncer.milestone_for('Epic-009: Patient Portal') == first['id']
+    assert syncer.milestone_for('Billing') is None
+
+    second = syncer.milestones.create_epic_milestone(epic_title='Billing', epic_description='')
+    syncer.milestone_index.add(second)
+
+    assert syncer.milestone_for('billing') == second['id']
+    assert syncer.milestone_for('Patient Portal') == first['id']
+
+
+def test_unreadable_epic_is_a_per_epic_failure(fake_gitea, client, bmad_tree):
+    broken = bmad_tree / 'artifacts' / 'epics' / 'epic-099-broken.md'
+    broken.write_bytes(b'# Epic 99: Broken\n\n\xff\xfe not utf-8\n')
+
+    results = EpicSyncer(client, bmad_tree / 'artifacts').sync_all_epics(parse_workers=1)
+
+    assert [result['epic_file'] for result in results['failed']] == [str(broken)]
+    assert len(results['created']) == 2
+    assert route_calls(fake_gitea, CREATE_MILESTONE) == 2
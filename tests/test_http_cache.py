@@ -0,0 +1,83 @@
+"""
+Tests for the conditional GET response cache
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+from gitea.client import GiteaClient
+from gitea.http_cache import ResponseCache
+
+from tests.conftest import ORG, REPO, route_calls
+
+GET_USER = 'GET /user'
+LIST_LABELS = 'GET /repos/{owner}/{repo}/labels'
+
+
+def make_client(fake_gitea, cache, token='test-token'):
+    return GiteaClient(fake_gitea.url, token, organization=ORG, repository=REPO, cache=cache)
+
+
+def test_fresh_entry_is_served_without_a_request(fake_gitea):
+    client = make_client(fake_gitea, ResponseCache.from_config({}))
+
+    first = client.get_current_user()
+    second = client.get_current_user(refresh=True)
+
+    assert first == second
+    assert route_calls(fake_gitea, GET_USER) == 1
+    assert client.cache.as_dict()['hits'] == 1
+
+
+def test_stale_entry_is_revalidated_with_304(fake_gitea):
+    client = make_client(fake_gitea, ResponseCache.from_config({}))
+    client.create_label('bug', '#ff0000')
+
+    first = client.list_labels()
+    second = client.list_labels()
+
+    assert [label['name'] for label in second] == [label['name'] for label in first] == ['bug']
+    assert route_calls(fake_gitea, LIST_LABELS) == 2
+    assert fake_gitea.stats()['by_status'].get('304') == 1
+    assert client.cache.as_dict()['revalidated'] == 1
+
+
+def test_write_invalidates_cached_listing(fake_gitea):
+    client = make_client(fake_gitea, ResponseCache.from_config({'ttl': {'/repos/*/*/labels': 300}}))
+    client.list_labels()
+
+    client.create_label('bug', '#ff0000')
+    labels = client.list_labels()
+
+    assert [label['name'] for label in labels] == ['bug']
+    assert route_calls(fake_gitea, LIST_LABELS) == 2
+    assert client.cache.as_dict()['invalidated'] >= 1
+
+
+def test_persisted_entries_are_revalidated_on_next_run(fake_gitea, tmp_path):
+    config = {'persist': True}
+    path = tmp_path / 'http-cache.json'
+    client = make_client(fake_gitea, ResponseCache.from_config(config, path=path, identity='test-token'))
+    user = client.get_current_user()
+    client.close()
+    fake_gitea.reset_stats()
+
+    reloaded = make_client(fake_gitea, ResponseCache.from_config(config, path=path, identity='test-token'))
+
+    assert len(reloaded.cache) == 1
+    assert reloaded.get_current_user() == user
+    assert route_calls(fake_gitea, GET_USER) == 1
+    assert fake_gitea.stats()['by_status'] == {'304': 1}
+
+
+def test_entries_are_not_shared_across_identities(fake_gitea, tmp_path):
+    config = {'persist': True}
+    path = tmp_path / 'http-cache.json'
+    client = make_client(fake_gitea, ResponseCache.from_config(config, path=path, identity='test-token'))
+    client.get_current_user()
+    client.close()
+
+    other = make_client(
+        fake_gitea, ResponseCache.from_config(config, path=path, identity='other-token'), token='other-token'
+    )
+
+    assert len(other.cache) == 0
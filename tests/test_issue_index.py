@@ -0,0 +1,74 @@
+"""
+Tests for IssueIndex and the story sync guard on index failures
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import pytest
+
+from core.story_syncer import StorySyncer
+from gitea.client import GiteaAPIError
+from gitea.index import IssueIndex
+
+from tests.conftest import route_calls
+
+CREATE_ISSUE = 'POST /repos/{owner}/{repo}/issues'
+
+
+def test_load_indexes_every_page(client):
+    for number in range(1, 121):
+        client.create_issue(f"Story-{number:03d}: Item {number}", body='')
+
+    index = IssueIndex(client).load()
+
+    assert index.loaded
+    assert len(index) == 120
+    assert index.get_by_story_id('117')['title'] == 'Story-117: Item 117'
+    assert 'Story-001: Item 1' in index
+
+
+def test_story_id_fallback_only_matches_synced_titles(client):
+    client.create_issue('Regression from story 12 rollout', body='')
+    client.create_issue('Story-7: Short id', body='')
+
+    index = IssueIndex(client).load()
+
+    assert index.get_by_story_id('012') is None
+    assert index.get_by_story_id('007')['title'] == 'Story-7: Short id'
+    assert index.get_by_story_id(7) is index.get_by_story_id('7')
+
+
+def test_story_sync_leaves_hand_written_issues_alone(fake_gitea, client, bmad_tree):
+    note = client.create_issue('Regression from story 001 rollout', body='Hand-written')
+
+    results = StorySyncer(client, bmad_tree / 'artifacts', agents=[]).sync_all_stories()
+
+    assert len(results['created']) == 6
+    assert results['updated'] == []
+    titles = {issue['number']: issue['title'] for issue in client.iter_issues(state='all')}
+    assert titles[note['number']] == 'Regression from story 001 rollout'
+
+
+def test_failed_listing_propagates_and_leaves_index_unloaded(fake_gitea, client):
+    client.create_issue('Story-001: Existing', body='')
+    fake_gitea.options.error_status = 500
+    fake_gitea.options.error_rate = 1.0
+
+    index = IssueIndex(client)
+    with pytest.raises(GiteaAPIError):
+        index.load()
+
+    assert not index.loaded
+    assert len(index) == 0
+
+
+def test_story_sync_creates_nothing_when_index_fails(fake_gitea, client, bmad_tree):
+    syncer = StorySyncer(client, bmad_tree / 'artifacts', agents=[])
+    fake_gitea.options.error_status = 500
+    fake_gitea.options.error_rate = 1.0
+
+    results = syncer.sync_all_stories()
+
+    assert route_calls(fake_gitea, CREATE_ISSUE) == 0
+    assert results['created'] == []
+    assert len(results['failed']) == 6
@@ -0,0 +1,88 @@
+"""
+Tests for OrganizationReconciler
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+from core.agent_discovery import Agent
+from core.config_loader import OrganizationConfig, RepositoryConfig, TeamConfig
+from core.org_reconciler import OrganizationReconciler
+from gitea.organizations import GiteaOrganizations
+
+from tests.conftest import ORG, route_calls
+
+EDIT_REPO = 'PATCH /repos/{owner}/{repo}'
+
+
+def make_config(enforce_visibility=False):
+    return OrganizationConfig(
+        name=ORG,
+        teams=[TeamConfig('BMad-Core', description='Agents')],
+        repositories=[
+            RepositoryConfig('bench-repo'),
+            RepositoryConfig('public-repo', enforce_visibility=enforce_visibility)
+        ]
+    )
+
+
+def reconcile(client, org_config, agents=None):
+    """Reconcile with a fresh manager (new snapshot, as in a new run)"""
+    return OrganizationReconciler(GiteaOrganizations(client), org_config).reconcile(agents, workers=4)
+
+
+def test_second_run_changes_nothing(fake_gitea, client):
+    fake_gitea.state.add_repo(ORG, 'public-repo', private=False)
+    fake_gitea.state.add_user('bmad-pm')
+    agents = [Agent('pm', 'John', 'PM', '📋', 'pm', 'bmm', 'pm.md')]
+
+    first = reconcile(client, make_config(), agents)
+    fake_gitea.reset_stats()
+    second = reconcile(client, make_config(), agents)
+
+    assert [item['name'] for item in first['created']] == ['BMad-Core']
+    assert first['members']['BMad-Core']['added'] == 1
+    assert second['created'] == second['updated'] == second['failed'] == []
+    assert second['members']['BMad-Core']['added'] == 0
+    assert set(fake_gitea.stats()['by_route']) <= {
+        'GET /orgs/{org}', 'GET /orgs/{org}/teams', 'GET /orgs/{org}/repos',
+        'GET /teams/{team}/members'
+    }
+
+
+def test_visibility_drift_is_reported_not_patched(fake_gitea, client):
+    fake_gitea.state.add_repo(ORG, 'public-repo', private=False)
+
+    results = reconcile(client, make_config())
+
+    assert route_calls(fake_gitea, EDIT_REPO) == 0
+    assert results['drift'] == [{
+        'kind': 'repository',
+        'name': 'public-repo',
+        'field': 'private',
+        'current': False,
+        'desired': True
+    }]
+
+
+def test_visibility_is_patched_when_enforced(fake_gitea, client):
+    fake_gitea.state.add_repo(ORG, 'public-repo', private=False)
+
+    results = reconcile(client, make_config(enforce_visibility=True))
+
+    assert route_calls(fake_gitea, EDIT_REPO) == 1
+    assert results['drift'] == []
+    assert {'kind': 'repository', 'name': 'public-repo', 'changes': {'private': True}} in results['updated']
+
+
+def test_member_errors_are_per_team_failures(fake_gitea, client, monkeypatch):
+    fake_gitea.state.add_repo(ORG, 'public-repo', private=False)
+    org_manager = GiteaOrganizations(client)
+
+    def unavailable(*args, **kwargs):
+        raise RuntimeError('members unavailable')
+
+    monkeypatch.setattr(org_manager, 'reconcile_team_members', unavailable)
+    results = OrganizationReconciler(org_manager, make_config()).reconcile([], workers=4)
+
+    assert results['failed'] == [{'kind': 'team', 'name': 'BMad-Core', 'error': 'members: members unavailable'}]
+    assert {'kind': 'repository', 'name': 'bench-repo'} in results['exists']
@@ -0,0 +1,51 @@
+"""
+Tests for GiteaOrganizations team membership reconciliation
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import pytest
+
+from gitea.organizations import GiteaOrganizations
+
+from tests.conftest import ORG
+
+
+@pytest.fixture
+def team(fake_gitea, client):
+    for login in ('bmad-pm', 'bmad-dev', 'bmad-old', 'alice'):
+        fake_gitea.state.add_user(login)
+
+    org_manager = GiteaOrganizations(client)
+    team = org_manager.create_team(ORG, 'BMad-Core')
+    for login in ('bmad-pm', 'bmad-old', 'alice'):
+        org_manager.add_user_to_team(team['id'], login)
+    return team
+
+
+def test_members_are_only_added_by_default(client, team):
+    org_manager = GiteaOrganizations(client)
+
+    results = org_manager.reconcile_team_members(team['id'], ['bmad-pm', 'bmad-dev'], workers=4)
+
+    assert (results['added'], results['removed'], results['unchanged']) == (1, 0, 1)
+    assert org_manager.get_team_members(team['id']) == {'bmad-pm', 'bmad-dev', 'bmad-old', 'alice'}
+
+
+def test_prune_removes_only_managed_members(client, team):
+    org_manager = GiteaOrganizations(client)
+
+    results = org_manager.reconcile_team_members(team['id'], ['bmad-pm', 'bmad-dev'], workers=4, prune=True)
+
+    assert (results['added'], results['removed'], results['failed']) == (1, 1, 0)
+    assert org_manager.get_team_members(team['id']) == {'bmad-pm', 'bmad-dev', 'alice'}
+
+
+def test_unchanged_team_costs_one_listing(fake_gitea, client, team):
+    org_manager = GiteaOrganizations(client)
+    fake_gitea.reset_stats()
+
+    results = org_manager.reconcile_team_members(team['id'], ['bmad-pm', 'bmad-old'])
+
+    assert results['added'] == results['removed'] == 0
+    assert fake_gitea.stats()['requests'] == 1
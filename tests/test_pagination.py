@@ -0,0 +1,45 @@
+"""
+Tests for paginated list endpoints
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+from itertools import islice
+
+from tests.conftest import route_calls
+
+LIST_ISSUES = 'GET /repos/{owner}/{repo}/issues'
+
+
+def test_every_page_is_listed_once(fake_gitea, client):
+    fake_gitea.options.page_size = 10
+    for number in range(1, 36):
+        client.create_issue(f"Story-{number:03d}: Item", body='')
+
+    issues = list(client.iter_issues(state='all'))
+
+    assert sorted(issue['number'] for issue in issues) == list(range(1, 36))
+    assert route_calls(fake_gitea, LIST_ISSUES) == 4
+
+
+def test_prefetch_yields_the_same_items(fake_gitea, client):
+    fake_gitea.options.page_size = 10
+    for number in range(1, 26):
+        client.create_issue(f"Story-{number:03d}: Item", body='')
+
+    plain = [issue['number'] for issue in client.iter_issues(state='all')]
+    prefetched = [issue['number'] for issue in client.iter_issues(state='all', prefetch=True)]
+
+    assert prefetched == plain
+    assert sorted(plain) == list(range(1, 26))
+
+
+def test_iteration_is_lazy(fake_gitea, client):
+    fake_gitea.options.page_size = 10
+    for number in range(1, 36):
+        client.create_issue(f"Story-{number:03d}: Item", body='')
+
+    first = list(islice(client.iter_issues(state='all'), 5))
+
+    assert len(first) == 5
+    assert route_calls(fake_gitea, LIST_ISSUES) == 1
@@ -0,0 +1,61 @@
+"""
+Tests for GiteaProvisioner
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+from core.agent_discovery import Agent
+from core.gitea_provisioner import GiteaProvisioner
+from gitea.client import GiteaAPIError
+
+from tests.conftest import route_calls
+
+
+def make_agents(*names):
+    return [
+        Agent(name, name.title(), 'Agent', '🤖', name, 'bmm', f"{name}.md", email=f"{name}@example.com")
+        for name in names
+    ]
+
+
+def test_manual_mode_opens_one_issue_per_agent(client):
+    provisioner = GiteaProvisioner(client, mode='manual')
+
+    first = provisioner.provision_all_agents(make_agents('pm', 'dev'), workers=2)
+    second = provisioner.provision_all_agents(make_agents('pm', 'dev'), workers=2)
+
+    assert len(first['pending']) == 2
+    assert all(result.get('issue_exists') for result in second['pending'])
+
+
+def test_unknown_mode_is_a_failure_not_a_crash(client):
+    provisioner = GiteaProvisioner(client, mode='auto')
+    provisioner.mode = 'ldap'
+
+    results = provisioner.provision_all_agents(make_agents('pm', 'dev'))
+
+    assert len(results['failed']) == 2
+    assert 'ldap' in results['failed'][0]['error']
+
+
+def test_snapshot_survives_current_user_errors(client, monkeypatch):
+    def unavailable(*args, **kwargs):
+        raise GiteaAPIError('HTTP 500: user unavailable')
+
+    monkeypatch.setattr(client, 'get_current_user', unavailable)
+    snapshot = GiteaProvisioner(client, mode='manual').snapshot()
+
+    assert snapshot.assignee is None
+    assert snapshot.usernames is not None
+
+
+def test_per_agent_calls_share_one_snapshot(fake_gitea, client):
+    provisioner = GiteaProvisioner(client, mode='manual')
+
+    for agent in make_agents('pm', 'dev', 'qa', 'sm'):
+        assert provisioner.provision_agent(agent)['status'] == 'pending'
+    again = provisioner.provision_agent(make_agents('pm')[0])
+
+    assert again.get('issue_exists')
+    assert route_calls(fake_gitea, 'GET /admin/users') == 1
+    assert route_calls(fake_gitea, 'GET /repos/{owner}/{repo}/issues') == 1
@@ -0,0 +1,72 @@
+"""
+Tests for retries of transient Gitea failures
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from gitea.client import GiteaAPIError
+from gitea.retry import RetryPolicy, parse_retry_after
+
+from tests.conftest import route_calls
+
+CREATE_ISSUE = 'POST /repos/{owner}/{repo}/issues'
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('7') == 7.0
+    assert 55 <= parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_after_wins_over_backoff_but_is_capped():
+    policy = RetryPolicy(backoff_base=0.5, retry_after_max=10)
+
+    assert policy.backoff(1, '3') == 3.0
+    assert policy.backoff(1, '600') == 10
+    assert 0.25 <= policy.backoff(1) <= 0.5
+
+
+def test_only_unprocessed_writes_are_replayed():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry_status('GET', 503, 1)
+    assert policy.should_retry_status('POST', 429, 1)
+    assert not policy.should_retry_status('POST', 503, 1)
+    assert not policy.should_retry_status('GET', 500, 1)
+    assert not policy.should_retry_status('GET', 503, 3)
+
+
+def test_throttled_creates_are_retried_without_duplicates(fake_gitea, client):
+    fake_gitea.options.retry_after = None
+    fake_gitea.options.throttle_rate = 0.3
+
+    for number in range(1, 21):
+        client.create_issue(f"Story-{number:03d}: Item", body='')
+
+    fake_gitea.options.throttle_rate = 0.0
+    titles = [issue['title'] for issue in client.iter_issues(state='all')]
+
+    assert len(titles) == len(set(titles)) == 20
+    assert client.retry_stats.throttled > 0
+    assert route_calls(fake_gitea, CREATE_ISSUE) == 20 + client.retry_stats.throttled
+
+
+def test_retry_after_header_sets_the_delay(fake_gitea, client, monkeypatch):
+    delays = []
+    monkeypatch.setattr(
+        client, '_wait_before_retry',
+        lambda method, url, reason, delay, attempt: delays.append((reason, delay))
+    )
+    fake_gitea.options.retry_after = 7
+    fake_gitea.options.throttle_rate = 1.0
+
+    with pytest.raises(GiteaAPIError):
+        client.create_issue('Story-001: Item', body='')
+
+    assert delays == [('429', 7.0)] * 3
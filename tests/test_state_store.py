@@ -0,0 +1,105 @@
+"""
+Tests for SyncStateStore and edits made while a sync is running
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import os
+
+from core.agent_discovery import Agent
+from core.state_store import SyncStateStore
+from core.story_syncer import StorySyncer
+from parsers.story_parser import StoryParser
+
+
+def edit(path, text):
+    """Rewrite a file and move its mtime, as a later save would"""
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+
+def test_unchanged_after_record(tmp_path, bmad_tree):
+    store = SyncStateStore(tmp_path / 'state.db')
+    story = sorted((bmad_tree / 'artifacts' / 'stories').glob('story-*.md'))[0]
+
+    data = StoryParser(story).parse()
+    store.record(story, kind='story', remote_id=1, fingerprint=data['fingerprint'])
+
+    assert store.is_unchanged(story)
+    store.close()
+
+
+def test_edit_after_parse_is_not_lost(tmp_path, bmad_tree):
+    store = SyncStateStore(tmp_path / 'state.db')
+    story = sorted((bmad_tree / 'artifacts' / 'stories').glob('story-*.md'))[0]
+
+    data = StoryParser(story).parse()
+    edit(story, story.read_text() + '\nEdited while syncing.\n')
+    store.record(story, kind='story', remote_id=1, fingerprint=data['fingerprint'])
+
+    assert not store.is_unchanged(story)
+    store.close()
+
+
+def test_story_edited_during_sync_is_synced_next_run(tmp_path, client, bmad_tree):
+    store = SyncStateStore(tmp_path / 'state.db')
+    syncer = StorySyncer(client, bmad_tree / 'artifacts', agents=[], state_store=store)
+    story = sorted((bmad_tree / 'artifacts' / 'stories').glob('story-*.md'))[0]
+
+    create = syncer.issues.create_story_issue
+
+    def create_then_edit(**kwargs):
+        issue = create(**kwargs)
+        if kwargs['story_title'].startswith('Story-001'):
+            edit(story, story.read_text().replace('# Story-001: ', '# Story-001: Revised '))
+        return issue
+
+    syncer.issues.create_story_issue = create_then_edit
+    first = syncer.sync_all_stories()
+    assert len(first['created']) == 6
+
+    second = syncer.sync_all_stories()
+
+    assert [result['story_file'] for result in second['updated']] == [str(story)]
+    issue = syncer.issue_index.get_by_story_id('001')
+    assert issue['title'].startswith('Story-001: Revised ')
+
+    third = syncer.sync_all_stories()
+    assert third['updated'] == [] and third['created'] == []
+    store.close()
+
+
+def test_new_agent_mapping_resyncs_unchanged_stories(tmp_path, fake_gitea, client, bmad_tree):
+    store = SyncStateStore(tmp_path / 'state.db')
+    artifacts = bmad_tree / 'artifacts'
+    StorySyncer(client, artifacts, agents=[], state_store=store).sync_all_stories()
+
+    fake_gitea.state.add_user('bmad-pm')
+    pm = Agent('pm', 'John', 'PM', '📋', 'pm', 'bmm', 'pm.md')
+    syncer = StorySyncer(client, artifacts, agents=[pm], state_store=store)
+    second = syncer.sync_all_stories()
+
+    assert len(second['updated']) == 2
+    assert all(result['changes'] == ['assignee'] for result in second['updated'])
+    assert len(second['unchanged']) == 4
+
+    third = syncer.sync_all_stories()
+    assert len(third['unchanged']) == 6
+    store.close()
+
+
+def test_dry_run_does_not_prune_state(tmp_path, client, bmad_tree):
+    store = SyncStateStore(tmp_path / 'state.db')
+    syncer = StorySyncer(client, bmad_tree / 'artifacts', agents=[], state_store=store)
+    syncer.sync_all_stories()
+    story = sorted((bmad_tree / 'artifacts' / 'stories').glob('story-*.md'))[0]
+    moved = story.with_name('story-001-moved.md')
+    story.rename(moved)
+
+    syncer.sync_all_stories(dry_run=True)
+    assert store.get(story) is not None
+
+    syncer.sync_all_stories()
+    assert store.get(story) is None
+    store.close()
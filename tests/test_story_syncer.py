@@ -0,0 +1,37 @@
+"""
+Tests for StorySyncer bulk sync
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+from core.story_syncer import StorySyncer
+
+from tests.conftest import route_calls
+
+CREATE_LABEL = 'POST /repos/{owner}/{repo}/labels'
+
+
+def test_unreadable_story_is_a_per_story_failure(client, bmad_tree):
+    stories_dir = bmad_tree / 'artifacts' / 'stories'
+    broken = stories_dir / 'story-099-broken.md'
+    broken.write_bytes(b'# Story-099: Broken\n\n\xff\xfe not utf-8\n')
+
+    syncer = StorySyncer(client, bmad_tree / 'artifacts', agents=[])
+    results = syncer.sync_all_stories()
+
+    assert [result['story_file'] for result in results['failed']] == [str(broken)]
+    assert len(results['created']) == 6
+
+
+def test_labels_come_from_the_bulk_parse(fake_gitea, client, bmad_tree, monkeypatch):
+    syncer = StorySyncer(client, bmad_tree / 'artifacts', agents=[])
+
+    def no_serial_parse(story_file):
+        raise AssertionError(f"{story_file} parsed outside the bulk parse")
+
+    monkeypatch.setattr(syncer, 'parse_story', no_serial_parse)
+    results = syncer.sync_all_stories()
+
+    assert len(results['created']) == 6
+    assert results['labels']['failed'] == []
+    assert route_calls(fake_gitea, CREATE_LABEL) == len(results['labels']['created'])
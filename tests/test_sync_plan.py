@@ -0,0 +1,89 @@
+"""
+Tests for SyncPlanner build/apply
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+from core.epic_syncer import EpicSyncer
+from core.story_syncer import StorySyncer
+from core.sync_plan import SyncPlan, SyncPlanner
+from gitea.client import GiteaAPIError
+
+from tests.conftest import route_calls
+
+CREATE_MILESTONE = 'POST /repos/{owner}/{repo}/milestones'
+CREATE_ISSUE = 'POST /repos/{owner}/{repo}/issues'
+
+
+def make_planner(client, bmad_tree):
+    """Planner over fresh syncers (as in a new sync-artifacts run)"""
+    epic_syncer = EpicSyncer(client, bmad_tree / 'artifacts')
+    story_syncer = StorySyncer(client, bmad_tree / 'artifacts', agents=[], epic_syncer=epic_syncer)
+    return SyncPlanner(epic_syncer, story_syncer, project='test')
+
+
+def test_apply_creates_everything(fake_gitea, client, bmad_tree):
+    planner = make_planner(client, bmad_tree)
+    results = planner.apply(planner.build())
+
+    assert len(results['created']) == 8
+    assert results['failed'] == []
+    assert route_calls(fake_gitea, CREATE_MILESTONE) == 2
+    assert route_calls(fake_gitea, CREATE_ISSUE) == 6
+
+
+def test_reapplying_a_plan_creates_no_duplicates(tmp_path, fake_gitea, client, bmad_tree):
+    plan_file = tmp_path / 'plan.json'
+    make_planner(client, bmad_tree).build().save(plan_file)
+
+    make_planner(client, bmad_tree).apply(SyncPlan.load(plan_file))
+    results = make_planner(client, bmad_tree).apply(SyncPlan.load(plan_file))
+
+    assert results['created'] == []
+    assert len(results['exists']) == 8
+    assert route_calls(fake_gitea, CREATE_MILESTONE) == 2
+    assert route_calls(fake_gitea, CREATE_ISSUE) == 6
+
+
+def test_applying_after_a_sync_creates_no_duplicates(fake_gitea, client, bmad_tree):
+    plan = make_planner(client, bmad_tree).build()
+
+    epic_syncer = EpicSyncer(client, bmad_tree / 'artifacts')
+    epic_syncer.sync_all_epics()
+    StorySyncer(client, bmad_tree / 'artifacts', agents=[], epic_syncer=epic_syncer).sync_all_stories()
+
+    results = make_planner(client, bmad_tree).apply(plan)
+
+    assert results['created'] == []
+    assert len(results['exists']) == 8
+    assert route_calls(fake_gitea, CREATE_MILESTONE) == 2
+    assert route_calls(fake_gitea, CREATE_ISSUE) == 6
+
+
+def test_apply_refuses_to_create_when_listing_fails(fake_gitea, client, bmad_tree, monkeypatch):
+    plan = make_planner(client, bmad_tree).build()
+
+    def unavailable(*args, **kwargs):
+        raise GiteaAPIError('HTTP 500: listing unavailable')
+
+    monkeypatch.setattr(client, 'iter_milestones', unavailable)
+    monkeypatch.setattr(client, 'iter_issues', unavailable)
+
+    results = make_planner(client, bmad_tree).apply(plan)
+
+    assert results['created'] == []
+    assert len(results['failed']) == 8
+    assert route_calls(fake_gitea, CREATE_MILESTONE) == 0
+    assert route_calls(fake_gitea, CREATE_ISSUE) == 0
+
+
+def test_unreadable_story_is_skipped_in_the_plan(client, bmad_tree):
+    broken = bmad_tree / 'artifacts' / 'stories' / 'story-099-broken.md'
+    broken.write_bytes(b'# Story-099: Broken\n\n\xff\xfe not utf-8\n')
+
+    plan = make_planner(client, bmad_tree).build(parse_workers=1)
+
+    skipped = [action for action in plan.actions if action.file == str(broken)]
+    assert [action.action for action in skipped] == ['skip']
+    assert 'utf-8' in skipped[0].reason
+    assert plan.counts()['story']['create'] == 6
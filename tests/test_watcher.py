@@ -0,0 +1,53 @@
+"""
+Tests for the watch-mode ChangeBatcher
+
+Authors: Khaled Z. & Claude (Anthropic)
+"""
+
+import threading
+import time
+from pathlib import Path
+
+from core.watcher import ChangeBatcher
+
+
+def test_burst_is_released_as_one_batch_after_quiet_period():
+    batcher = ChangeBatcher(debounce=0.1, max_latency=5)
+    for name in ('a.md', 'b.md', 'a.md'):
+        batcher.add(Path(name))
+
+    started = time.monotonic()
+    batch = batcher.next_batch(timeout=2)
+
+    assert batch == {Path('a.md'), Path('b.md')}
+    assert 0.05 <= time.monotonic() - started < 1
+    assert batcher.next_batch(timeout=0.05) == set()
+
+
+def test_steady_writes_are_flushed_by_max_latency():
+    batcher = ChangeBatcher(debounce=0.2, max_latency=0.4)
+    stop = threading.Event()
+
+    def keep_writing():
+        while not stop.is_set():
+            batcher.add(Path('busy.md'))
+            time.sleep(0.02)
+
+    writer = threading.Thread(target=keep_writing)
+    writer.start()
+    try:
+        started = time.monotonic()
+        batch = batcher.next_batch(timeout=3)
+        waited = time.monotonic() - started
+    finally:
+        stop.set()
+        writer.join()
+
+    assert batch == {Path('busy.md')}
+    assert waited < 1.5
+
+
+def test_timeout_without_changes_returns_empty_batch():
+    batcher = ChangeBatcher(debounce=0.1, max_latency=1)
+
+    assert batcher.next_batch(timeout=0.05) == set()